@@ -87,597 +87,1128 @@ Analyzes code for compliance with:
    - Form labels
 
 Total: 80+ checks across all design principles
+
+Directory results are cached per file in ~/.cache/ux-audit (or
+$XDG_CACHE_HOME), so re-runs only re-audit edited files; --no-cache disables it.
 """
 
 import sys
 import os
 import re
 import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import cached_property
 from pathlib import Path
 
+# ============ RULE REGISTRY ============
+# Every check is a rule function registered in audit order. Patterns are
+# compiled once at import, facts several rules share (has_form, nav_items,
+# has_hero, ...) are computed at most once per file, and a rule whose
+# literals (lowercase, any-of) are all absent from the file is skipped
+# without running a single regex. Structural checks query the tag stream
+# and CSS declarations of the markup and CSS model below; loose 'a.*b'
+# heuristics go through line_match().
+
+RULES = []
+
+
+def rule(*needs):
+    """Register a check; needs lists literals of which one must occur for it to fire."""
+    def register(check):
+        RULES.append((needs, check))
+        return check
+    return register
+
+
+class FileFacts:
+    """Content of one file plus facts derived from it on first use."""
+
+    def __init__(self, content: str, filename: str):
+        self.content = content
+        self.filename = filename
+
+    @cached_property
+    def lower(self):
+        return self.content.lower()
+
+    @cached_property
+    def tags(self):
+        return tokenize_tags(self.content, jsx=self.filename.endswith(JSX_EXTENSIONS))
+
+    @cached_property
+    def declarations(self):
+        return parse_declarations(self.content)
+
+    @cached_property
+    def keyframe_declarations(self):
+        return parse_declarations(''.join(keyframe_blocks(self.content)))
+
+    def declared(self, prop: str) -> list:
+        """Values of a CSS property; files that never name it are not parsed"""
+        if prop not in self.lower:
+            return []
+        return self.declarations.get(prop, [])
+
+    def tags_named(self, names) -> list:
+        return [t for t in self.tags if t.lname in names]
+
+    def tag_text(self, tag) -> str:
+        """Text inside the element a tag opens, inner tags removed"""
+        stop = self.content.find(f'</{tag.name}>', tag.end)
+        if stop < 0:
+            stop = self.content.find('<', tag.end)
+        text = self.content[tag.end:stop if stop >= 0 else len(self.content)]
+        return CLOSING_TAG_RE.sub(' ', TAG_RE.sub(' ', text))
+
+    def on_line(self, *sequences) -> bool:
+        return any(line_match(self.content, parts) for parts in sequences)
+
+    @cached_property
+    def has_long_text(self):
+        return 'article' in self.lower or any(
+            t.lname == 'p' or (t.lname in ('div', 'span') and 'text' in t.classes) for t in self.tags)
+
+    @cached_property
+    def has_form(self):
+        return bool(FORM_RE.search(self.content))
+
+    @cached_property
+    def complex_elements(self):
+        return len(self.tags_named(COMPLEX_TAGS))
+
+    @cached_property
+    def nav_tags(self):
+        # React Router links by component name (not HTML <link>), <a> with an
+        # href and any element classed as a nav item
+        return [t for t in self.tags
+                if t.name in NAV_COMPONENTS or (t.lname == 'a' and ('href' in t.attrs or ':href' in t.attrs))
+                or 'nav-item' in t.classes]
+
+    @cached_property
+    def nav_items(self):
+        return len(self.nav_tags)
+
+    @cached_property
+    def headings(self):
+        return [t.lname for t in self.tags if t.lname in HEADING_TAGS]
+
+    @cached_property
+    def has_hero(self):
+        return bool(HERO_RE.search(self.content))
+
+    @cached_property
+    def has_gradient(self):
+        return 'gradient' in self.content
+
+    @cached_property
+    def has_background(self):
+        return bool(BACKGROUND_RE.search(self.content))
+
+    @cached_property
+    def shadows(self):
+        return self.declared('box-shadow')
+
+    @cached_property
+    def paragraphs(self):
+        """Text of the <p> elements that hold only text"""
+        texts = []
+        for tag in self.tags_named(('p',)):
+            close = self.content.find('<', tag.end)
+            if close > tag.end and self.content[close:close + 4].lower() == '</p>':
+                texts.append(self.content[tag.end:close])
+        return texts
+
+    @cached_property
+    def has_lottie(self):
+        return bool(LOTTIE_RE.search(self.content))
+
+    @cached_property
+    def has_gsap(self):
+        return bool(GSAP_RE.search(self.content))
+
+
+class FileResult:
+    """Issues, warnings and passed checks of one file, in check order."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.issues = []
+        self.warnings = []
+        self.passed = 0
+
+    def issue(self, tag: str, message: str) -> None:
+        self.issues.append(f"[{tag}] {self.filename}: {message}")
+
+    def warn(self, tag: str, message: str) -> None:
+        self.warnings.append(f"[{tag}] {self.filename}: {message}")
+
+
+def audit_content(content: str, filename: str) -> FileResult:
+    """Run every registered rule that can fire on content."""
+    facts = FileFacts(content, filename)
+    result = FileResult(filename)
+    for needs, check in RULES:
+        if needs and not any(literal in facts.lower for literal in needs):
+            continue
+        check(facts, result)
+    return result
+
+
+# ============ LINE MATCHING ============
+# Heuristics of the form 'a.*b' backtrack badly on minified or very long
+# lines. line_match() finds the same matches with one forward scan per
+# candidate line, so these checks stay linear in the file size.
+
+
+def line_sequence(*patterns, flags=0) -> tuple:
+    """Compiled parts of the regex 'p1.*p2.*...' for line_match()"""
+    return tuple(re.compile(p, flags) for p in patterns)
+
+
+def line_match(content: str, parts) -> bool:
+    """True if parts match in order on one line, like re.search('.*'.join(parts)) without backtracking"""
+    first, rest = parts[0], parts[1:]
+    pos = 0
+    failed = (-1, -1)
+    while True:
+        m = first.search(content, pos)
+        if not m: return False
+        pos = m.start() + 1
+        # Ending later on a line that already failed only sees a suffix of it
+        if failed[0] <= m.end() <= failed[1]: continue
+        at = m.end()
+        for part in rest:
+            # '.*' stops at the line break, which the next part may still start with
+            end = content.find('\n', at)
+            if end < 0:
+                found = part.search(content, at)
+            else:
+                found = part.search(content, at, end) or part.match(content, end)
+            if not found: break
+            at = found.end()
+        else:
+            return True
+        end = content.find('\n', m.end())
+        failed = (m.end(), end if end >= 0 else len(content))
+
+
+# ============ MARKUP AND CSS MODEL ============
+# Each file is tokenized at most once into a stream of opening HTML/JSX tags
+# and a map of CSS declarations (stylesheets, <style> blocks, inline and
+# CSS-in-JS styles), so structural checks are lookups instead of regexes
+# that run across unrelated code.
+
+# {...} attribute values may hold '<', '>' and '=>' of their own
+_TAG_PATTERN = (r'<([A-Za-z][\w.:-]*)'
+                r'((?:"[^"]*"|\'[^\']*\'|\{(?:[^{}]|\{(?:[^{}]|\{[^{}]*\})*\})*\}|[^<>"\'{}])*)>')
+TAG_RE = re.compile(_TAG_PATTERN)
+# In JSX a '<' right after an identifier or a closing bracket is a
+# comparison or a TypeScript generic (useState<string>), not a tag
+JSX_TAG_RE = re.compile(r'(?<![\w$.)\]])' + _TAG_PATTERN)
+JSX_EXTENSIONS = ('.tsx', '.jsx')
+CLOSING_TAG_RE = re.compile(r'</[A-Za-z][\w.:-]*\s*>')
+ATTR_RE = re.compile(r'([^\s=/>{}"\']+)(?:\s*=\s*("[^"]*"|\'[^\']*\'|\{(?:[^{}]|\{[^{}]*\})*\}|[^\s>]+))?')
+# A value ends at ';', a brace, a quote or the end of the line unless the
+# line ends with ',' (multi-layer shadows); ${...} interpolations are kept
+DECLARATION_RE = re.compile(r'(?<![\w-])(-{0,2}[A-Za-z][\w-]*)\s*:\s*'
+                            r'((?:\$\{[^{}]*\}|,[ \t]*\r?\n|[^;{}"\'`<>\r\n])*)')
+KEYFRAMES_RE = re.compile(r'@(?:-webkit-)?keyframes\b[^{;]*\{')
+BRACE_RE = re.compile(r'[{}]')
+
+
+class Tag:
+    """One opening or self-closing tag; attribute names are lowercase."""
+
+    def __init__(self, name: str, attrs: dict, end: int):
+        self.name = name
+        self.lname = name.lower()
+        self.attrs = attrs
+        self.end = end
+
+    @property
+    def classes(self) -> str:
+        return (self.attrs.get('class') or self.attrs.get('classname') or '').lower()
+
+
+def tokenize_tags(content: str, jsx: bool = False) -> list:
+    """Opening tags of HTML/JSX markup in file order"""
+    tags = []
+    for m in (JSX_TAG_RE if jsx else TAG_RE).finditer(content):
+        attrs = {name.lower(): value for name, value in ATTR_RE.findall(m.group(2))}
+        tags.append(Tag(m.group(1), attrs, m.end()))
+    return tags
+
+
+def parse_declarations(content: str) -> dict:
+    """CSS property (lowercase) -> its values in file order"""
+    declarations = {}
+    for prop, value in DECLARATION_RE.findall(content):
+        declarations.setdefault(prop.lower(), []).append(value)
+    return declarations
+
+
+def keyframe_blocks(content: str) -> list:
+    """Bodies of the @keyframes rules, nested braces included"""
+    blocks = []
+    pos = 0
+    while True:
+        m = KEYFRAMES_RE.search(content, pos)
+        if not m: return blocks
+        depth, end = 1, len(content)
+        for brace in BRACE_RE.finditer(content, m.end()):
+            depth += 1 if brace.group() == '{' else -1
+            if depth == 0:
+                end = brace.start()
+                break
+        blocks.append(content[m.end():end])
+        pos = end
+
+
+# ============ SHARED FACTS ============
+FORM_RE = re.compile(r'<form|<input|password|credit|card|payment', re.IGNORECASE)
+COMPLEX_TAGS = {'input', 'select', 'textarea', 'option'}
+NAV_COMPONENTS = {'Link', 'NavLink'}
+HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+HERO_RE = re.compile(r'hero|<h1|banner', re.IGNORECASE)
+BACKGROUND_RE = re.compile(r'background:|bg-')
+LOTTIE_RE = re.compile(r'lottie|Lottie|@lottie-react')
+# 'from\(.*gsap' only matches where 'gsap' already does
+GSAP_RE = re.compile(r'gsap|ScrollTrigger')
+
+
+FORM_LITERALS = ('<form', '<input', 'password', 'credit', 'card', 'payment')
+COMPLEX_LITERALS = ('<input', '<select', '<textarea', '<option')
+NAV_LITERALS = ('<navlink', '<link', '<a', 'nav-item')
+HERO_LITERALS = ('hero', '<h1', 'banner')
+LONG_TEXT_LITERALS = ('<p', '<div', 'article', '<span')
+
+
+# --- 1. PSYCHOLOGY LAWS ---
+SMALL_HEIGHT_RE = re.compile(r'height:\s*([0-3]\d)px')
+SMALL_TARGET_CLASS_RE = re.compile(r'h-[1-9]\b|h-10\b')
+FORM_FIELD_TAGS = {'input', 'select', 'textarea'}
+STEPPED_RE = re.compile(r'step|wizard|stage', re.IGNORECASE)
+# 'bg-primary', 'Button.*primary' and variant="primary" all contain 'primary'
+PRIMARY_CTA_RE = re.compile(r'primary', re.IGNORECASE)
+
+
+@rule(*NAV_LITERALS)
+def hicks_law(f, out):
+    if f.nav_items > 7:
+        out.issue("Hick's Law", f"{f.nav_items} nav items (Max 7)")
+
+
+@rule('height:', 'h-')
+def fitts_law(f, out):
+    if SMALL_HEIGHT_RE.search(f.content) or SMALL_TARGET_CLASS_RE.search(f.content):
+        out.warn("Fitts' Law", "Small targets (< 44px)")
+
+
+@rule('<input', '<select', '<textarea')
+def millers_law(f, out):
+    form_fields = len(f.tags_named(FORM_FIELD_TAGS))
+    if form_fields > 7 and not STEPPED_RE.search(f.content):
+        out.warn("Miller's Law", f"Complex form ({form_fields} fields)")
+
+
+@rule('button')
+def von_restorff(f, out):
+    if not PRIMARY_CTA_RE.search(f.content):
+        out.warn("Von Restorff", "No primary CTA")
+
+
+@rule(*NAV_LITERALS)
+def serial_position(f, out):
+    # Important items at beginning/end: is the last nav item a key action?
+    if f.nav_items > 3:
+        last_item = f.tag_text(f.nav_tags[-1]).lower()
+        if not any(x in last_item for x in ['contact', 'login', 'sign', 'get started', 'cta', 'button']):
+            out.warn("Serial Position", "Last nav item may not be important. Place key actions at start/end.")
+
+
+# --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
+ANIMATION_RE = re.compile(r'@keyframes|transition:|animate-')
+FEEDBACK_RE = re.compile(r'transition|animate|hover:|focus:|disabled|loading|spinner', re.IGNORECASE)
+STATE_CHANGE_RE = re.compile(r'setState|useState|disabled|loading')
+REFLECTIVE_RE = re.compile(r'about|story|mission|values|why we|our journey|testimonials', re.IGNORECASE)
+
+
+@rule(*HERO_LITERALS)
+def visceral(f, out):
+    # First impressions: gradients or animations on the hero
+    if f.has_hero:
+        has_visual_interest = f.has_gradient or bool(ANIMATION_RE.search(f.content))
+        if not has_visual_interest and not f.has_background:
+            out.warn("Visceral", "Hero section lacks visual appeal. Consider gradients or subtle animations.")
+
+
+@rule('onclick', '@click')
+def behavioral(f, out):
+    # Instant feedback on interactive elements
+    if 'onClick' in f.content or '@click' in f.content or 'onclick' in f.content:
+        if not FEEDBACK_RE.search(f.content) and not STATE_CHANGE_RE.search(f.content):
+            out.warn("Behavioral", "Interactive elements lack immediate feedback. Add hover/focus/disabled states.")
+
+
+@rule(*LONG_TEXT_LITERALS)
+def reflective(f, out):
+    if f.has_long_text and not REFLECTIVE_RE.search(f.content):
+        out.warn("Reflective", "Long-form content without brand story/values. Add 'About' or 'Why We Exist' section.")
+
+
+# --- 1.6 TRUST BUILDING (Enhanced) ---
+SECURITY_SIGNAL_RE = re.compile(r'ssl|secure|encrypt|lock|padlock|https', re.IGNORECASE)
+CHECKOUT_RE = re.compile(r'checkout|payment', re.IGNORECASE)
+SOCIAL_PROOF_RE = re.compile(r'review|testimonial|rating|star|trust|trusted by|customer|logo', re.IGNORECASE)
+AUTHORITY_RE = re.compile(r'certif|award|media|press|featured|as seen in', re.IGNORECASE)
+
+
+@rule(*FORM_LITERALS)
+def security_signals(f, out):
+    if f.has_form and not SECURITY_SIGNAL_RE.search(f.content) and not CHECKOUT_RE.search(f.content):
+        out.warn("Trust", "Form without security indicators. Add 'SSL Secure' or lock icon.")
+
+
+@rule()
+def social_proof(f, out):
+    if SOCIAL_PROOF_RE.search(f.content):
+        out.passed += 1
+    elif f.has_long_text:
+        out.warn("Trust", "No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos.")
+
+
+@rule('footer')
+def authority(f, out):
+    if not AUTHORITY_RE.search(f.content):
+        out.warn("Trust", "Footer lacks authority signals. Add certifications, awards, or media mentions.")
+
+
+# --- 1.7 COGNITIVE LOAD MANAGEMENT ---
+PROGRESSIVE_RE = re.compile(r'step|wizard|stage|accordion|collapsible|tab|more\.\.\.|advanced|show more', re.IGNORECASE)
+COLOR_VALUE_RE = re.compile(r'#[0-9a-fA-F]{3,6}|rgb|hsl')
+BORDER_RE = re.compile(r'border:|border-')
+LABEL_RE = re.compile(r'<label|placeholder|aria-label', re.IGNORECASE)
+
+
+@rule(*COMPLEX_LITERALS)
+def progressive_disclosure(f, out):
+    if f.complex_elements > 5 and not PROGRESSIVE_RE.search(f.content):
+        out.warn("Cognitive Load", "Many form elements without progressive disclosure. Consider accordion, tabs, or 'Advanced' toggle.")
+
+
+@rule('border')
+def visual_noise(f, out):
+    has_many_colors = len(COLOR_VALUE_RE.findall(f.content)) > 15
+    has_many_borders = len(BORDER_RE.findall(f.content)) > 10
+    if has_many_colors and has_many_borders:
+        out.warn("Cognitive Load", "High visual noise detected. Many colors and borders increase cognitive load.")
+
+
+@rule(*FORM_LITERALS)
+def familiar_patterns(f, out):
+    if f.has_form and not LABEL_RE.search(f.content):
+        out.issue("Cognitive Load", "Form inputs without labels. Use <label> for accessibility and clarity.")
+
+
+# --- 1.8 PERSUASIVE DESIGN (Ethical) ---
+DEFAULTS_RE = re.compile(r'checked|selected|default')
+QUOTED_VALUE = line_sequence(r'value=["\']', r'["\']')
+RADIO_RE = re.compile(r'type=["\']radio', re.IGNORECASE)
+PRICE_RE = re.compile(r'price|pricing|cost|\$\d+', re.IGNORECASE)
+ANCHOR_RE = re.compile(r'original|was|strike|del|save \d+%', re.IGNORECASE)
+SOCIAL_RE = re.compile(r'join|subscriber|member|user', re.IGNORECASE)
+COUNT_RE = re.compile(r'\d+[+kmb]|\d+,\d+')
+PROGRESS_RE = re.compile(r'progress|step \d+|complete|%|bar', re.IGNORECASE)
+
+
+@rule('radio')
+def smart_defaults(f, out):
+    if f.has_form and RADIO_RE.search(f.content) and not (DEFAULTS_RE.search(f.content) or f.on_line(QUOTED_VALUE)):
+        out.warn("Persuasion", "Radio buttons without default selection. Pre-select recommended option.")
+
+
+@rule('pric', 'cost', '$')
+def anchoring(f, out):
+    # Show the original price to frame the discount
+    if PRICE_RE.search(f.content) and not ANCHOR_RE.search(f.content):
+        out.warn("Persuasion", "Prices without anchoring. Show original price to frame discount value.")
+
+
+@rule('join', 'subscriber', 'member', 'user')
+def social_numbers(f, out):
+    if SOCIAL_RE.search(f.content) and not COUNT_RE.search(f.content):
+        out.warn("Persuasion", "Social proof without specific numbers. Use 'Join 10,000+' format.")
+
+
+@rule(*COMPLEX_LITERALS)
+def progress_indicators(f, out):
+    if f.has_form and f.complex_elements > 5 and not PROGRESS_RE.search(f.content):
+        out.warn("Persuasion", "Long form without progress indicator. Add progress bar or 'Step X of Y'.")
+
+
+# --- 2. TYPOGRAPHY SYSTEM (Complete Coverage) ---
+FONT_FACE_RE = re.compile(r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', re.IGNORECASE)
+GOOGLE_FONTS_RE = re.compile(r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', re.IGNORECASE)
+FONT_FAMILY_RE = re.compile(r'font-family:\s*([^;]+)', re.IGNORECASE)
+SYSTEM_FONTS = {'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'arial', 'georgia',
+                'times new roman', 'courier new', 'verdana', 'helvetica', 'tahoma'}
+LINE_LENGTH_RE = re.compile(r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch')
+TEXT_TAGS = {'p', 'span'} | HEADING_TAGS
+LEADING_RE = re.compile(r'leading-|line-height:')
+HEADING_SIZE_RE = re.compile(r'text-(?:xl|2xl|3xl|4xl|5xl|6xl)', re.IGNORECASE)
+LINE_HEIGHT_RE = re.compile(r'(?:leading-|line-height:\s*)([\d.]+)')
+UPPERCASE_RE = re.compile(r'uppercase|text-transform:\s*uppercase', re.IGNORECASE)
+TRACKING_RE = re.compile(r'tracking-|letter-spacing:')
+DISPLAY_TEXT_RE = re.compile(r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx')
+TIGHT_TRACKING_RE = re.compile(r'tracking-tight|letter-spacing:\s*-[0-9]')
+WEIGHT_RE = re.compile(r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)',
+                       re.IGNORECASE)
+WEIGHT_NAMES = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500', 'semibold': '600',
+                'bold': '700', 'extrabold': '800', 'black': '900'}
+FONT_SIZE_CLASS_RE = re.compile(r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)')
+FLUID_RE = re.compile(r'clamp\(|responsive:')
+FONT_SIZE_RE = re.compile(r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)')
+COMMON_RATIOS = {1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618}
+
+
+@rule('font-face', 'googleapis', 'font-family')
+def font_pairing(f, out):
+    font_families = set()
+    for font in FONT_FACE_RE.findall(f.content):
+        font_families.add(font.strip().lower())
+    for font in GOOGLE_FONTS_RE.findall(f.content):
+        for name in font.replace('+', ' ').split('|'):
+            font_families.add(name.split(':')[0].strip().lower())
+    for family in FONT_FAMILY_RE.findall(f.content):
+        # First font of the stack
+        first_font = family.split(',')[0].strip().strip('"\'')
+        if first_font.lower() not in SYSTEM_FONTS:
+            font_families.add(first_font.lower())
+
+    if len(font_families) > 3:
+        out.issue("Typography", f"{len(font_families)} font families detected. Limit to 2-3 for cohesion.")
+
+
+@rule(*LONG_TEXT_LITERALS)
+def line_length(f, out):
+    if f.has_long_text and not LINE_LENGTH_RE.search(f.content):
+        out.warn("Typography", "No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch].")
+
+
+@rule('<p', '<span', '<div', '<h')
+def line_height(f, out):
+    has_text = any(t.lname in TEXT_TAGS or (t.lname == 'div' and 'text' in t.classes) for t in f.tags)
+    if has_text and not LEADING_RE.search(f.content):
+        out.warn("Typography", "Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3")
+
+
+@rule('leading-', 'line-height')
+def heading_line_height(f, out):
+    if f.headings or HEADING_SIZE_RE.search(f.content):
+        for lh in LINE_HEIGHT_RE.findall(f.content):
+            if float(lh) > 1.5:
+                out.warn("Typography", f"Heading has line-height {lh} (>1.3). Headings should be tighter (1.1-1.3).")
+
+
+@rule('uppercase')
+def uppercase_tracking(f, out):
+    if UPPERCASE_RE.search(f.content) and not TRACKING_RE.search(f.content):
+        out.warn("Typography", "Uppercase text without tracking. ALL CAPS needs +5-10% spacing.")
+
+
+@rule('text-', 'font-size')
+def display_tracking(f, out):
+    if DISPLAY_TEXT_RE.search(f.content) and not TIGHT_TRACKING_RE.search(f.content):
+        out.warn("Typography", "Large display text without tracking-tight. Big text needs -1% to -4% spacing.")
+
+
+@rule('font-weight', 'fw-')
+def weight_contrast(f, out):
+    weight_values = []
+    for w in WEIGHT_RE.findall(f.content):
+        val = w[0] or w[1]
+        if val:
+            val = WEIGHT_NAMES.get(val.lower(), val)
+            try:
+                weight_values.append(int(val))
+            except: pass
+
+    # Adjacent weights (400/500, 500/600, ...) lack contrast
+    for i in range(len(weight_values) - 1):
+        if abs(weight_values[i] - weight_values[i+1]) == 100:
+            out.warn("Typography", f"Adjacent font weights ({weight_values[i]}/{weight_values[i+1]}). Skip at least 2 levels for contrast.")
+
+    unique_weights = set(weight_values)
+    if len(unique_weights) > 4:
+        out.warn("Typography", f"{len(unique_weights)} font weights. Limit to 3-4 per page.")
+
+
+@rule('font-size:', 'text-')
+def responsive_typography(f, out):
+    if FONT_SIZE_CLASS_RE.search(f.content) and not FLUID_RE.search(f.content):
+        out.warn("Typography", "Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)")
+
+
+@rule('<h')
+def heading_hierarchy(f, out):
+    headings = f.headings
+    if headings:
+        for i in range(len(headings) - 1):
+            curr = int(headings[i][1])
+            next_h = int(headings[i+1][1])
+            if next_h > curr + 1:
+                out.warn("Typography", f"Skipped heading level (h{curr} -> h{next_h}). Maintain sequential hierarchy.")
+
+        if 'h1' not in headings and f.has_long_text:
+            out.warn("Typography", "No h1 found. Each page should have one primary heading.")
+
+
+@rule('font-size:')
+def modular_scale(f, out):
+    size_values = []
+    for size, unit in FONT_SIZE_RE.findall(f.content):
+        if unit == 'rem' or unit == 'em':
+            size_values.append(float(size))
+        elif unit == 'px':
+            size_values.append(float(size) / 16)  # Normalize to rem
+
+    if len(size_values) > 2:
+        sorted_sizes = sorted(set(size_values))
+        ratios = []
+        for i in range(1, len(sorted_sizes)):
+            if sorted_sizes[i-1] > 0:
+                ratios.append(sorted_sizes[i] / sorted_sizes[i-1])
+
+        for ratio in ratios[:3]:  # Check first 3 ratios
+            if not any(abs(ratio - cr) < 0.05 for cr in COMMON_RATIOS):
+                out.warn("Typography", f"Font sizes may not follow modular scale (ratio: {ratio:.2f}). Consider consistent ratio like 1.25 (Major Third).")
+                break
+
+
+@rule('<p')
+def readability(f, out):
+    # Very long paragraphs (>5 lines estimated)
+    for p in f.paragraphs:
+        word_count = len(p.split())
+        if word_count > 100:  # ~5-6 lines
+            out.warn("Typography", f"Long paragraph detected ({word_count} words). Break into 3-4 line chunks for readability.")
+
+    if len(f.paragraphs) > 5 and not any(h != 'h1' for h in f.headings):
+        out.warn("Typography", "Long content without subheadings. Add h2/h3 to break up text.")
+
+
+# --- 3. VISUAL EFFECTS (visual-effects.md) ---
+TRANSLUCENT_BG_RE = re.compile(r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+')
+MOTION_RE = re.compile(r'@keyframes|transition:')
+EXPENSIVE_PROP_RE = re.compile(r'width|height|top|left|right|bottom|margin|padding')
+Y_OFFSET_RE = re.compile(r'\d+px\s+[1-9]\d*px')
+OPACITY_RE = re.compile(r'rgba?\([^)]+,\s*([\d.]+)\)')
+GRADIENT_ANY_CASE_RE = re.compile(r'gradient', re.IGNORECASE)
+PARENS_RE = re.compile(r'\([^()]*\)')
+GLOW_LAYER_RE = re.compile(r'(?<![\w.])0\s+0\s')
+IMAGE_RE = re.compile(r'<img|background-image:|bg-\[url')
+OVERLAY_RE = re.compile(r'overlay|rgba\(0|::after|::before')
+GRADIENT_OVERLAY = line_sequence('gradient', 'transparent')
+BLUR_RE = re.compile(r'backdrop-filter|blur\(')
+# Easing, step and behaviour keywords of the transition shorthand
+TRANSITION_KEYWORDS = {'ease', 'ease-in', 'ease-out', 'ease-in-out', 'linear', 'cubic-bezier', 'steps',
+                       'step-start', 'step-end', 'allow-discrete', 'normal'}
+LAYOUT_PROPS = ['width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding']
+
+
+@rule('backdrop-filter', 'blur(')
+def glassmorphism(f, out):
+    if 'backdrop-filter' in f.content or 'blur(' in f.content:
+        if not TRANSLUCENT_BG_RE.search(f.content):
+            out.warn("Visual", "Blur used without semi-transparent background (Glassmorphism fail)")
+
+
+def transitioned_properties(values) -> list:
+    """Properties named by transition / transition-property values"""
+    props = []
+    for value in values:
+        for item in PARENS_RE.sub('', value).split(','):
+            # The property is the first word that is not a time or an easing
+            names = [word for word in item.lower().split() if word[0].isalpha() and word not in TRANSITION_KEYWORDS]
+            props.extend(names[:1])
+    return props
+
+
+@rule('@keyframes', 'transition:')
+def gpu_acceleration(f, out):
+    if MOTION_RE.search(f.content):
+        # Properties that keyframes set or transitions name, not every mention in the file
+        animated = transitioned_properties(f.declared('transition') + f.declared('transition-property'))
+        animated += list(f.keyframe_declarations)
+        expensive_props = {name for prop in animated for name in EXPENSIVE_PROP_RE.findall(prop)}
+        if expensive_props:
+            out.warn("Performance", f"Animating expensive properties ({', '.join(sorted(expensive_props))}). Use transform/opacity where possible.")
+        if 'prefers-reduced-motion' not in f.content:
+            out.warn("Accessibility", "Animations found without prefers-reduced-motion check")
+
+
+@rule('box-shadow')
+def natural_shadows(f, out):
+    for shadow in f.shadows:
+        # Natural shadows have Y > X or several layers
+        if ',' not in shadow and not Y_OFFSET_RE.search(shadow):
+            out.warn("Visual", "Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism.")
+
+
+@rule('box-shadow')
+def neomorphism(f, out):
+    # Dual shadows with opposite offsets; inset is the pressed state
+    for shadow in f.shadows:
+        if ',' in shadow and '-' in shadow and 'inset' in shadow:
+            out.warn("Visual", "Neomorphism inset detected. Ensure adequate contrast for accessibility.")
+
+
+@rule('box-shadow')
+def shadow_hierarchy(f, out):
+    if len(f.shadows) >= 3:
+        shadow_opacities = [float(o) for o in OPACITY_RE.findall(f.content) if float(o) < 0.5]
+        if shadow_opacities and len(set(shadow_opacities)) < 2:
+            out.warn("Visual", "All shadows at same opacity level. Vary shadow intensity for elevation hierarchy.")
+
+
+@rule('gradient', *HERO_LITERALS)
+def gradients(f, out):
+    if f.has_gradient:
+        gradient_count = len(GRADIENT_ANY_CASE_RE.findall(f.content))
+        if gradient_count > 5:
+            out.warn("Visual", f"Many gradients detected ({gradient_count}). Ensure this serves purpose, not decoration.")
+    elif f.has_hero and not f.has_background:
+        out.warn("Visual", "Hero section without visual interest. Consider gradient for depth.")
+
+
+@rule('border:')
+def border_effects(f, out):
+    border_count = f.content.count('border:')
+    if border_count > 8:
+        out.warn("Visual", f"Many border declarations ({border_count}). Simplify for cleaner look.")
+
+
+@rule('text-shadow')
+def text_glow(f, out):
+    # Multiple text-shadow layers indicate glow; commas inside rgba() etc. do not
+    if any(',' in PARENS_RE.sub('', ts) for ts in f.declared('text-shadow')):
+        out.warn("Visual", "Text glow effect detected. Ensure readability is maintained.")
+
+
+@rule('box-shadow')
+def box_glow(f, out):
+    # Multiple box-shadow layers with 0 offset
+    if sum(1 for shadow in f.shadows if GLOW_LAYER_RE.search(shadow)) > 2:
+        out.warn("Visual", "Multiple glow effects detected. Use sparingly for emphasis only.")
+
+
+@rule('<img', 'background-image:', 'bg-[url')
+def image_overlay(f, out):
+    if IMAGE_RE.search(f.content) and f.has_long_text and not (OVERLAY_RE.search(f.content) or f.on_line(GRADIENT_OVERLAY)):
+        out.warn("Visual", "Text over image without overlay. Add gradient overlay for readability.")
+
+
+@rule('will-change')
+def will_change(f, out):
+    will_change_values = f.declared('will-change')
+    for value in will_change_values:
+        for prop in value.split(','):
+            prop = prop.strip().lower()
+            if prop in LAYOUT_PROPS:
+                out.issue("Performance", f"will-change on '{prop}' (layout property). Use only for transform/opacity.")
+
+    will_change_count = len(will_change_values)
+    if will_change_count > 3:
+        out.warn("Performance", f"Many will-change declarations ({will_change_count}). Use sparingly, only for heavy animations.")
+
+
+@rule()
+def effect_selection(f, out):
+    effect_count = (
+        (1 if f.has_gradient else 0) +
+        len(f.shadows) +
+        len(BLUR_RE.findall(f.content)) +
+        len(f.declared('text-shadow'))
+    )
+    if effect_count > 10:
+        out.warn("Visual", f"Many visual effects ({effect_count}). Ensure effects serve purpose, not decoration.")
+
+    # Static/flat design (no depth)
+    if f.has_long_text and effect_count == 0:
+        out.warn("Visual", "Flat design with no depth. Consider shadows or subtle gradients for hierarchy.")
+
+
+# --- 4. COLOR SYSTEM (color-system.md) ---
+PURPLE_HEXES = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
+                '#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
+                '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
+                'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
+HEX_COLOR_RE = re.compile(r'#[0-9a-fA-F]{3,6}')
+BG_DECLARATION_RE = re.compile(r'(?:background|bg-|bg\[)([^;}\s]+)')
+TEXT_DECLARATION_RE = re.compile(r'(?:color|text-)([^;}\s]+)')
+HEX6_RE = re.compile(r'#[0-9a-fA-F]{6}')
+HSL_HUE_RE = re.compile(r'hsl\((\d+),\s*\d+%,\s*\d+%\)')
+PURE_BLACK_RE = re.compile(r'color:\s*#000000|#000\b')
+PURE_WHITE_RE = re.compile(r'background:\s*#ffffff|#fff\b')
+DARK_MODE_RE = re.compile(r'dark:\s*|dark:')
+LIGHT_ON_LIGHT_RE = re.compile(r'bg-(?:gray|slate|zinc)-50')
+LIGHT_TEXT_ON_WHITE = line_sequence('bg-white', r'text-(?:gray|slate)-[12]')
+DARK_ON_DARK_RE = re.compile(r'bg-(?:gray|slate|zinct)-9')
+DARK_TEXT_ON_BLACK = line_sequence('bg-black', r'text-(?:gray|slate)-[89]')
+BLUE_RE = re.compile(r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}')
+FOOD_RE = re.compile(r'restaurant|food|cooking|recipe|menu|dish|meal', re.IGNORECASE)
+COLOR_VAR_RE = re.compile(r'--color-|color-|primary-|secondary-')
+
+
+@rule()
+def purple_ban(f, out):
+    # Critical check from color-system.md
+    for purple in PURPLE_HEXES:
+        if purple.lower() in f.lower:
+            out.issue("Color", f"PURPLE DETECTED ('{purple}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.")
+            break
+
+
+@rule('#', 'hsl(')
+def color_ratio(f, out):
+    # 60-30-10: warn if too many distinct colors
+    total_colors = len(HEX_COLOR_RE.findall(f.content)) + f.content.count('hsl(')
+    if total_colors > 3:
+        if BG_DECLARATION_RE.search(f.content) and TEXT_DECLARATION_RE.search(f.content):
+            unique_hexes = set(HEX6_RE.findall(f.content))
+            if len(unique_hexes) > 5:
+                out.warn("Color", f"{len(unique_hexes)} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%).")
+
+
+@rule('hsl(')
+def monochromatic(f, out):
+    hsl_matches = HSL_HUE_RE.findall(f.content)
+    if len(hsl_matches) >= 3:
+        hues = [int(h) for h in hsl_matches]
+        hue_range = max(hues) - min(hues)
+        if hue_range < 10:
+            out.warn("Color", f"Monochromatic palette detected (hue variance: {hue_range}deg). Ensure adequate contrast.")
+
+
+@rule('#000')
+def pure_black(f, out):
+    if PURE_BLACK_RE.search(f.content):
+        out.warn("Color", "Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode.")
+
+
+@rule('#fff')
+def pure_white(f, out):
+    if PURE_WHITE_RE.search(f.content) and DARK_MODE_RE.search(f.content):
+        out.warn("Color", "Pure white background in dark mode context. Use slight off-white (#f9fafb) for reduced eye strain.")
+
+
+@rule('bg-')
+def wcag_contrast(f, out):
+    if (LIGHT_ON_LIGHT_RE.search(f.content) or DARK_ON_DARK_RE.search(f.content)
+            or f.on_line(LIGHT_TEXT_ON_WHITE, DARK_TEXT_ON_BLACK)):
+        out.warn("Color", "Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text).")
+
+
+@rule('restaurant', 'food', 'cooking', 'recipe', 'menu', 'dish', 'meal')
+def color_psychology(f, out):
+    # Blue suppresses appetite
+    if BLUE_RE.search(f.content) and FOOD_RE.search(f.content):
+        out.warn("Color", "Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow).")
+
+
+@rule('color-', 'primary-', 'secondary-')
+def hsl_palette(f, out):
+    if COLOR_VAR_RE.search(f.content) and 'hsl(' not in f.content:
+        out.warn("Color", "Color variables without HSL. Consider HSL for easier palette adjustment (Hue, Saturation, Lightness).")
+
+
+# --- 5. ANIMATION GUIDE (animation-guide.md) ---
+DURATION_RE = re.compile(r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)')
+EASE_IN_ENTRY = (line_sequence(r'ease-in\s+', 'entry'), line_sequence('fade-in', 'ease-in'))
+EASE_OUT_EXIT = (line_sequence(r'ease-out\s+', 'exit'), line_sequence('fade-out', 'ease-out'))
+INTERACTIVE_RE = re.compile(r'<button|<a\s+href|onClick|@click')
+HOVER_FOCUS_RE = re.compile(r'hover:|focus:|:hover|:focus')
+ASYNC_RE = re.compile(r'async|await|fetch|axios|loading|isLoading')
+LOADING_INDICATOR_RE = re.compile(r'skeleton|spinner|progress|loading')
+CIRCLE_ANIMATION = line_sequence('<circle', 'animate')
+ROUTING_RE = re.compile(r'router|navigate|useHistory')
+LINK_TO = line_sequence('Link', 'to')
+PAGE_TRANSITION_RE = re.compile(r'AnimatePresence|motion\.')
+PAGE_TRANSITIONS = (line_sequence('transition', 'page'), line_sequence('fade', 'route'))
+SCROLL_ANIMATION_RE = re.compile(r'onScroll|IntersectionObserver')
+SCROLL_TRIGGER = line_sequence('scroll', 'trigger')
+SCROLL_LAYOUT = line_sequence('onScroll', r'[^\w](width|height|top|left)')
+
+
+@rule('duration:')
+def animation_duration(f, out):
+    for duration, unit in DURATION_RE.findall(f.content):
+        duration_ms = float(duration) * (1000 if unit == 's' else 1)
+        if duration_ms < 50:
+            out.warn("Animation", f"Very fast animation ({duration}{unit}). Minimum 50ms for visibility.")
+        elif duration_ms > 1000 and 'transition' in f.lower:
+            out.warn("Animation", f"Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness.")
+
+
+@rule('ease-in')
+def entry_easing(f, out):
+    if f.on_line(*EASE_IN_ENTRY):
+        out.warn("Animation", "Entry animation with ease-in. Entry should use ease-out for snappy feel.")
+
+
+@rule('ease-out')
+def exit_easing(f, out):
+    if f.on_line(*EASE_OUT_EXIT):
+        out.warn("Animation", "Exit animation with ease-out. Exit should use ease-in for natural feel.")
+
+
+@rule('<button', '<a', 'onclick', '@click')
+def micro_interactions(f, out):
+    if len(INTERACTIVE_RE.findall(f.content)) > 2 and not HOVER_FOCUS_RE.search(f.content):
+        out.warn("Animation", "Interactive elements without hover/focus states. Add micro-interactions for feedback.")
+
+
+@rule('async', 'await', 'fetch', 'axios', 'loading')
+def loading_states(f, out):
+    if ASYNC_RE.search(f.content) and not (LOADING_INDICATOR_RE.search(f.content) or f.on_line(CIRCLE_ANIMATION)):
+        out.warn("Animation", "Async operations without loading indicator. Add skeleton or spinner for perceived performance.")
+
+
+@rule('router', 'navigate', 'link', 'usehistory')
+def page_transitions(f, out):
+    routing = ROUTING_RE.search(f.content) or f.on_line(LINK_TO)
+    if routing and not (PAGE_TRANSITION_RE.search(f.content) or f.on_line(*PAGE_TRANSITIONS)):
+        out.warn("Animation", "Routing detected without page transitions. Consider fade/slide for context continuity.")
+
+
+@rule('onscroll')
+def scroll_performance(f, out):
+    if (SCROLL_ANIMATION_RE.search(f.content) or f.on_line(SCROLL_TRIGGER)) and f.on_line(SCROLL_LAYOUT):
+        out.issue("Animation", "Scroll handler animating layout properties. Use transform/opacity for 60fps.")
+
+
+# --- 6. MOTION GRAPHICS (motion-graphics.md) ---
+LOTTIE_FALLBACKS = (line_sequence('prefers-reduced-motion', 'lottie'), line_sequence('lottie', 'isPaused'),
+                    line_sequence('lottie', 'stop'))
+GSAP_CLEANUP_RE = re.compile(r'kill\(|revert\(')
+GSAP_EFFECT_CLEANUP = line_sequence('useEffect', 'return', 'gsap')
+SVG_ANIMATION_RE = re.compile(r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset')
+TRANSFORM_3D_RE = re.compile(r'transform3d|perspective\(|rotate3d|translate3d')
+PERSPECTIVE_RE = re.compile(r'perspective:\s*\d+px|perspective\s*\(')
+PARTICLES_RE = re.compile(r'particle|Three\.js')
+PARTICLE_LOOPS = (line_sequence('canvas', 'loop'), line_sequence('requestAnimationFrame', 'draw'))
+SCROLL_DRIVEN_RE = re.compile(r'view-timeline')
+SCROLL_DRIVEN = (line_sequence('IntersectionObserver', 'animate'), line_sequence('scroll', 'progress'))
+THROTTLE_RE = re.compile(r'throttle|debounce|requestAnimationFrame')
+ANIMATION_COUNT_RE = re.compile(r'@keyframes|transition:|animate-')
+FUNCTIONAL_ANIMATION_RE = re.compile(r'hover:|focus:|disabled|loading|error|success')
+
+
+@rule('lottie')
+def lottie_fallback(f, out):
+    if f.has_lottie and not f.on_line(*LOTTIE_FALLBACKS):
+        out.warn("Motion", "Lottie animation without reduced-motion fallback. Add pause/stop for accessibility.")
+
+
+@rule('gsap', 'scrolltrigger')
+def gsap_cleanup(f, out):
+    if f.has_gsap and not (GSAP_CLEANUP_RE.search(f.content) or f.on_line(GSAP_EFFECT_CLEANUP)):
+        out.issue("Motion", "GSAP animation without cleanup (kill/revert). Memory leak risk on unmount.")
+
+
+@rule('<animate', 'stroke-dash')
+def svg_animation(f, out):
+    if len(SVG_ANIMATION_RE.findall(f.content)) > 3:
+        out.warn("Motion", "Multiple SVG animations detected. Ensure stroke-dashoffset is used sparingly for mobile performance.")
+
+
+@rule('transform3d', 'perspective(', 'rotate3d', 'translate3d')
+def transforms_3d(f, out):
+    if TRANSFORM_3D_RE.search(f.content):
+        if not PERSPECTIVE_RE.search(f.content):
+            out.warn("Motion", "3D transform without perspective parent. Add perspective: 1000px for realistic depth.")
+        out.warn("Motion", "3D transforms detected. Test on mobile; can impact performance on low-end devices.")
+
+
+@rule('particle', 'canvas', 'requestanimationframe', 'three.js')
+def particle_effects(f, out):
+    if PARTICLES_RE.search(f.content) or f.on_line(*PARTICLE_LOOPS):
+        out.warn("Motion", "Particle effects detected. Ensure fallback or reduced-quality option for mobile devices.")
+
+
+@rule('animate', 'progress', 'view-timeline')
+def scroll_driven(f, out):
+    if (SCROLL_DRIVEN_RE.search(f.content) or f.on_line(*SCROLL_DRIVEN)) and not THROTTLE_RE.search(f.content):
+        out.issue("Motion", "Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps.")
+
+
+@rule('@keyframes', 'transition:', 'animate-', 'lottie', 'gsap', 'scrolltrigger')
+def motion_purpose(f, out):
+    # Animation should serve a purpose, not just decorate
+    total_animations = (
+        len(ANIMATION_COUNT_RE.findall(f.content)) +
+        (1 if f.has_lottie else 0) +
+        (1 if f.has_gsap else 0)
+    )
+    if total_animations > 5:
+        functional_animations = len(FUNCTIONAL_ANIMATION_RE.findall(f.content))
+        if functional_animations < total_animations / 2:
+            out.warn("Motion", f"Many animations ({total_animations}). Ensure majority serve functional purpose (feedback, guidance), not decoration.")
+
+
+# --- 7. ACCESSIBILITY ---
+@rule('<img')
+def img_alt_text(f, out):
+    if any('alt' not in t.attrs for t in f.tags_named(('img',))):
+        out.issue("Accessibility", "Missing img alt text")
+
+
+# ============ RESULTS CACHE ============
+# The cache, worker fan-out and argument helpers are kept in step with
+# mobile_audit.py by hand: each skill script runs standalone, without imports.
+CACHE_FORMAT_VERSION = 1
+
+
+def _rules_version() -> str:
+    """Fingerprint of this script's source; editing any rule invalidates cached results"""
+    source = Path(__file__).read_bytes()
+    return hashlib.sha256(f"{CACHE_FORMAT_VERSION}:".encode('utf-8') + source).hexdigest()[:16]
+
+
+def default_cache_path(directory: str) -> Path:
+    """Per-directory cache file under $XDG_CACHE_HOME/ux-audit (or ~/.cache/...)"""
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    project_id = hashlib.sha1(os.path.abspath(directory).encode('utf-8')).hexdigest()[:16]
+    return Path(root) / "ux-audit" / f"{project_id}.json"
+
+
+class ResultsCache:
+    """
+    Issues, warnings and passed count per file, keyed by path relative to the
+    audited directory and the SHA-256 of its content, persisted as JSON.
+    """
+
+    def __init__(self, path, root):
+        self.path = Path(path)
+        self.root = Path(root)
+        self.version = _rules_version()
+        self.files = {}
+        self.hits = 0
+        self.misses = 0
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get("version") == self.version:
+                self.files = data.get("files", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def lookup(self, relpath: str):
+        return self.files.get(relpath)
+
+    def store(self, relpath: str, result) -> None:
+        digest, issues, warnings, passed = result
+        entry = self.files.get(relpath)
+        if entry is not None and entry.get("sha256") == digest:
+            self.hits += 1
+        else:
+            self.misses += 1
+        self.files[relpath] = {"sha256": digest, "issues": issues, "warnings": warnings, "passed": passed}
+
+    def save(self) -> None:
+        """Write the cache atomically, dropping files that no longer exist under root"""
+        self.files = {relpath: entry for relpath, entry in self.files.items() if (self.root / relpath).is_file()}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": self.version, "files": self.files}), encoding='utf-8')
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # caching is best effort
+
+    def stats(self):
+        return {"path": str(self.path), "hits": self.hits, "audited": self.misses}
+
+
+# ============ DIRECTORY AUDIT ============
+AUDIT_EXTENSIONS = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next'}
+PARALLEL_MIN_FILES = 32  # below this, pool start-up costs more than it saves
+
+
+def audit_path(filepath: str, cached: dict = None):
+    """
+    Worker entry point: (sha256, issues, warnings, passed) of one file, None if
+    it cannot be read. A cached entry whose hash still matches is reused.
+    """
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            content = f.read()
+    except: return None
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+    if cached and cached.get("sha256") == digest:
+        return digest, cached["issues"], cached["warnings"], cached["passed"]
+    result = audit_content(content, os.path.basename(filepath))
+    return digest, result.issues, result.warnings, result.passed
+
+
+def collect_files(directory: str) -> list:
+    """Auditable files under directory, in os.walk order"""
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for file in files:
+            if Path(file).suffix in AUDIT_EXTENSIONS:
+                paths.append(os.path.join(root, file))
+    return paths
+
+
+def iter_results(paths: list, cached: list, jobs: int = 1):
+    """audit_path() of every path, in order; fanned out to worker processes when jobs > 1"""
+    done = 0
+    if jobs > 1 and len(paths) >= PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                # map() yields in submission order, keeping the merge deterministic
+                chunksize = max(1, len(paths) // (jobs * 4))
+                for result in executor.map(audit_path, paths, cached, chunksize=chunksize):
+                    yield result
+                    done += 1
+            return
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # no usable process pool here: audit the rest serially
+    for filepath, entry in zip(paths[done:], cached[done:]):
+        yield audit_path(filepath, entry)
+
+
 class UXAuditor:
     def __init__(self):
         self.issues = []
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
-    
-    def audit_file(self, filepath: str) -> None:
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-        except: return
-        
+
+    def merge(self, result) -> None:
+        if result is None: return
+        _, issues, warnings, passed = result
         self.files_checked += 1
-        filename = os.path.basename(filepath)
-
-        # Pre-calculate common flags
-        has_long_text = bool(re.search(r'<p|<div.*class=.*text|article|<span.*text', content, re.IGNORECASE))
-        has_form = bool(re.search(r'<form|<input|password|credit|card|payment', content, re.IGNORECASE))
-        complex_elements = len(re.findall(r'<input|<select|<textarea|<option', content, re.IGNORECASE))
-
-        # --- 1. PSYCHOLOGY LAWS ---
-        # Hick's Law
-        nav_items = len(re.findall(r'<NavLink|<Link|<a\s+href|nav-item', content, re.IGNORECASE))
-        if nav_items > 7:
-            self.issues.append(f"[Hick's Law] {filename}: {nav_items} nav items (Max 7)")
-        
-        # Fitts' Law
-        if re.search(r'height:\s*([0-3]\d)px', content) or re.search(r'h-[1-9]\b|h-10\b', content):
-            self.warnings.append(f"[Fitts' Law] {filename}: Small targets (< 44px)")
-        
-        # Miller's Law
-        form_fields = len(re.findall(r'<input|<select|<textarea', content, re.IGNORECASE))
-        if form_fields > 7 and not re.search(r'step|wizard|stage', content, re.IGNORECASE):
-            self.warnings.append(f"[Miller's Law] {filename}: Complex form ({form_fields} fields)")
-            
-        # Von Restorff
-        if 'button' in content.lower() and not re.search(r'primary|bg-primary|Button.*primary|variant=["\']primary', content, re.IGNORECASE):
-            self.warnings.append(f"[Von Restorff] {filename}: No primary CTA")
-
-        # Serial Position Effect - Important items at beginning/end
-        if nav_items > 3:
-            # Check if last nav item is important (contact, login, etc.)
-            nav_content = re.findall(r'<NavLink|<Link|<a\s+href[^>]*>([^<]+)</a>', content, re.IGNORECASE)
-            if nav_content and len(nav_content) > 2:
-                last_item = nav_content[-1].lower() if nav_content else ''
-                if not any(x in last_item for x in ['contact', 'login', 'sign', 'get started', 'cta', 'button']):
-                    self.warnings.append(f"[Serial Position] {filename}: Last nav item may not be important. Place key actions at start/end.")
-
-        # --- 1.5 EMOTIONAL DESIGN (Don Norman) ---
-
-        # Visceral: First impressions (aesthetics, gradients, animations)
-        has_hero = bool(re.search(r'hero|<h1|banner', content, re.IGNORECASE))
-        if has_hero:
-            # Check for visual appeal elements
-            has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient', content))
-            has_animation = bool(re.search(r'@keyframes|transition:|animate-', content))
-            has_visual_interest = has_gradient or has_animation
-
-            if not has_visual_interest and not re.search(r'background:|bg-', content):
-                self.warnings.append(f"[Visceral] {filename}: Hero section lacks visual appeal. Consider gradients or subtle animations.")
-
-        # Behavioral: Instant feedback and usability
-        if 'onClick' in content or '@click' in content or 'onclick' in content:
-            has_feedback = re.search(r'transition|animate|hover:|focus:|disabled|loading|spinner', content, re.IGNORECASE)
-            has_state_change = re.search(r'setState|useState|disabled|loading', content)
-
-            if not has_feedback and not has_state_change:
-                self.warnings.append(f"[Behavioral] {filename}: Interactive elements lack immediate feedback. Add hover/focus/disabled states.")
-
-        # Reflective: Brand story, values, identity
-        has_reflective = bool(re.search(r'about|story|mission|values|why we|our journey|testimonials', content, re.IGNORECASE))
-        if has_long_text and not has_reflective:
-            self.warnings.append(f"[Reflective] {filename}: Long-form content without brand story/values. Add 'About' or 'Why We Exist' section.")
-
-        # --- 1.6 TRUST BUILDING (Enhanced) ---
-
-        # Security signals
-        if has_form:
-            security_signals = re.findall(r'ssl|secure|encrypt|lock|padlock|https', content, re.IGNORECASE)
-            if len(security_signals) == 0 and not re.search(r'checkout|payment', content, re.IGNORECASE):
-                self.warnings.append(f"[Trust] {filename}: Form without security indicators. Add 'SSL Secure' or lock icon.")
-
-        # Social proof elements
-        social_proof = re.findall(r'review|testimonial|rating|star|trust|trusted by|customer|logo', content, re.IGNORECASE)
-        if len(social_proof) > 0:
-            self.passed_count += 1
-        else:
-            if has_long_text:
-                self.warnings.append(f"[Trust] {filename}: No social proof detected. Consider adding testimonials, ratings, or 'Trusted by' logos.")
-
-        # Authority indicators
-        has_footer = bool(re.search(r'footer|<footer', content, re.IGNORECASE))
-        if has_footer:
-            authority = re.findall(r'certif|award|media|press|featured|as seen in', content, re.IGNORECASE)
-            if len(authority) == 0:
-                self.warnings.append(f"[Trust] {filename}: Footer lacks authority signals. Add certifications, awards, or media mentions.")
-
-        # --- 1.7 COGNITIVE LOAD MANAGEMENT ---
-
-        # Progressive disclosure
-        if complex_elements > 5:
-            has_progressive = re.search(r'step|wizard|stage|accordion|collapsible|tab|more\.\.\.|advanced|show more', content, re.IGNORECASE)
-            if not has_progressive:
-                self.warnings.append(f"[Cognitive Load] {filename}: Many form elements without progressive disclosure. Consider accordion, tabs, or 'Advanced' toggle.")
-
-        # Visual noise check
-        has_many_colors = len(re.findall(r'#[0-9a-fA-F]{3,6}|rgb|hsl', content)) > 15
-        has_many_borders = len(re.findall(r'border:|border-', content)) > 10
-        if has_many_colors and has_many_borders:
-            self.warnings.append(f"[Cognitive Load] {filename}: High visual noise detected. Many colors and borders increase cognitive load.")
-
-        # Familiar patterns
-        if has_form:
-            has_standard_labels = bool(re.search(r'<label|placeholder|aria-label', content, re.IGNORECASE))
-            if not has_standard_labels:
-                self.issues.append(f"[Cognitive Load] {filename}: Form inputs without labels. Use <label> for accessibility and clarity.")
-
-        # --- 1.8 PERSUASIVE DESIGN (Ethical) ---
-
-        # Smart defaults
-        if has_form:
-            has_defaults = bool(re.search(r'checked|selected|default|value=["\'].*["\']', content))
-            radio_inputs = len(re.findall(r'type=["\']radio', content, re.IGNORECASE))
-            if radio_inputs > 0 and not has_defaults:
-                self.warnings.append(f"[Persuasion] {filename}: Radio buttons without default selection. Pre-select recommended option.")
-
-        # Anchoring (showing original price)
-        if re.search(r'price|pricing|cost|\$\d+', content, re.IGNORECASE):
-            has_anchor = bool(re.search(r'original|was|strike|del|save \d+%', content, re.IGNORECASE))
-            if not has_anchor:
-                self.warnings.append(f"[Persuasion] {filename}: Prices without anchoring. Show original price to frame discount value.")
-
-        # Social proof live indicators
-        has_social = bool(re.search(r'join|subscriber|member|user', content, re.IGNORECASE))
-        if has_social:
-            has_count = bool(re.findall(r'\d+[+kmb]|\d+,\d+', content))
-            if not has_count:
-                self.warnings.append(f"[Persuasion] {filename}: Social proof without specific numbers. Use 'Join 10,000+' format.")
-
-        # Progress indicators
-        if has_form:
-            has_progress = bool(re.search(r'progress|step \d+|complete|%|bar', content, re.IGNORECASE))
-            if complex_elements > 5 and not has_progress:
-                self.warnings.append(f"[Persuasion] {filename}: Long form without progress indicator. Add progress bar or 'Step X of Y'.")
-
-        # --- 2. TYPOGRAPHY SYSTEM (Complete Coverage) ---
-
-        # 2.1 Font Pairing - Too many font families
-        font_families = set()
-        # Check for @font-face, Google Fonts, font-family declarations
-        font_faces = re.findall(r'@font-face\s*\{[^}]*family:\s*["\']?([^;"\'\s}]+)', content, re.IGNORECASE)
-        google_fonts = re.findall(r'fonts\.googleapis\.com[^"\']*family=([^"&]+)', content, re.IGNORECASE)
-        font_family_css = re.findall(r'font-family:\s*([^;]+)', content, re.IGNORECASE)
-
-        for font in font_faces: font_families.add(font.strip().lower())
-        for font in google_fonts:
-            for f in font.replace('+', ' ').split('|'):
-                font_families.add(f.split(':')[0].strip().lower())
-        for family in font_family_css:
-            # Extract first font from stack
-            first_font = family.split(',')[0].strip().strip('"\'')
-
-            if first_font.lower() not in {'sans-serif', 'serif', 'monospace', 'cursive', 'fantasy', 'system-ui', 'inherit', 'arial', 'georgia', 'times new roman', 'courier new', 'verdana', 'helvetica', 'tahoma'}:
-                font_families.add(first_font.lower())
-
-        if len(font_families) > 3:
-            self.issues.append(f"[Typography] {filename}: {len(font_families)} font families detected. Limit to 2-3 for cohesion.")
-
-        # 2.2 Line Length - Character-based width
-        if has_long_text and not re.search(r'max-w-(?:prose|[\[\\]?\d+ch[\]\\]?)|max-width:\s*\d+ch', content):
-            self.warnings.append(f"[Typography] {filename}: No line length constraint (45-75ch). Use max-w-prose or max-w-[65ch].")
-
-        # 2.3 Line Height - Proper leading ratios
-        # Check for text without proper line-height
-        text_elements = len(re.findall(r'<p|<span|<div.*text|<h[1-6]', content, re.IGNORECASE))
-        if text_elements > 0 and not re.search(r'leading-|line-height:', content):
-            self.warnings.append(f"[Typography] {filename}: Text elements found without line-height. Body: 1.4-1.6, Headings: 1.1-1.3")
-
-        # Check for heading-specific line height issues
-        if re.search(r'<h[1-6]|text-(?:xl|2xl|3xl|4xl|5xl|6xl)', content, re.IGNORECASE):
-            # Extract line-height values
-            line_heights = re.findall(r'(?:leading-|line-height:\s*)([\d.]+)', content)
-            for lh in line_heights:
-                if float(lh) > 1.5:
-                    self.warnings.append(f"[Typography] {filename}: Heading has line-height {lh} (>1.3). Headings should be tighter (1.1-1.3).")
-
-        # 2.4 Letter Spacing (Tracking)
-        # Uppercase without tracking
-        if re.search(r'uppercase|text-transform:\s*uppercase', content, re.IGNORECASE):
-            if not re.search(r'tracking-|letter-spacing:', content):
-                self.warnings.append(f"[Typography] {filename}: Uppercase text without tracking. ALL CAPS needs +5-10% spacing.")
-
-        # Large text (display/hero) should have negative tracking
-        if re.search(r'text-(?:4xl|5xl|6xl|7xl|8xl|9xl)|font-size:\s*[3-9]\dpx', content):
-            if not re.search(r'tracking-tight|letter-spacing:\s*-[0-9]', content):
-                self.warnings.append(f"[Typography] {filename}: Large display text without tracking-tight. Big text needs -1% to -4% spacing.")
-
-        # 2.5 Weight and Emphasis - Contrast levels
-        # Check for adjacent weight levels (poor contrast)
-        weights = re.findall(r'font-weight:\s*(\d+)|font-(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black)|fw-(\d+)', content, re.IGNORECASE)
-        weight_values = []
-        for w in weights:
-            val = w[0] or w[1]
-            if val:
-                # Map named weights to numbers
-                weight_map = {'thin': '100', 'extralight': '200', 'light': '300', 'normal': '400', 'medium': '500', 'semibold': '600', 'bold': '700', 'extrabold': '800', 'black': '900'}
-                val = weight_map.get(val.lower(), val)
-                try:
-                    weight_values.append(int(val))
-                except: pass
-
-        # Check for adjacent weights (400/500, 500/600, etc.)
-        for i in range(len(weight_values) - 1):
-            diff = abs(weight_values[i] - weight_values[i+1])
-            if diff == 100:
-                self.warnings.append(f"[Typography] {filename}: Adjacent font weights ({weight_values[i]}/{weight_values[i+1]}). Skip at least 2 levels for contrast.")
-
-        # Too many weight levels
-        unique_weights = set(weight_values)
-        if len(unique_weights) > 4:
-            self.warnings.append(f"[Typography] {filename}: {len(unique_weights)} font weights. Limit to 3-4 per page.")
-
-        # 2.6 Responsive Typography - Fluid sizing with clamp()
-        has_font_sizes = bool(re.search(r'font-size:|text-(?:xs|sm|base|lg|xl|2xl)', content))
-        if has_font_sizes and not re.search(r'clamp\(|responsive:', content):
-            self.warnings.append(f"[Typography] {filename}: Fixed font sizes without clamp(). Consider fluid typography: clamp(MIN, PREFERRED, MAX)")
-
-        # 2.7 Hierarchy - Heading structure
-        headings = re.findall(r'<(h[1-6])', content, re.IGNORECASE)
-        if headings:
-            # Check for skipped levels (h1 -> h3)
-            for i in range(len(headings) - 1):
-                curr = int(headings[i][1])
-                next_h = int(headings[i+1][1])
-                if next_h > curr + 1:
-                    self.warnings.append(f"[Typography] {filename}: Skipped heading level (h{curr} -> h{next_h}). Maintain sequential hierarchy.")
-
-            # Check if h1 exists for main content
-            if 'h1' not in [h.lower() for h in headings] and has_long_text:
-                self.warnings.append(f"[Typography] {filename}: No h1 found. Each page should have one primary heading.")
-
-        # 2.8 Modular Scale - Consistent sizing
-        # Extract font-size values
-        font_sizes = re.findall(r'font-size:\s*(\d+(?:\.\d+)?)(px|rem|em)', content)
-        size_values = []
-        for size, unit in font_sizes:
-            if unit == 'rem' or unit == 'em':
-                size_values.append(float(size))
-            elif unit == 'px':
-                size_values.append(float(size) / 16)  # Normalize to rem
-
-        if len(size_values) > 2:
-            # Check if sizes follow a modular scale roughly
-            sorted_sizes = sorted(set(size_values))
-            ratios = []
-            for i in range(1, len(sorted_sizes)):
-                if sorted_sizes[i-1] > 0:
-                    ratios.append(sorted_sizes[i] / sorted_sizes[i-1])
-
-            # Common scale ratios: 1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618
-            common_ratios = {1.067, 1.125, 1.2, 1.25, 1.333, 1.5, 1.618}
-            for ratio in ratios[:3]:  # Check first 3 ratios
-                if not any(abs(ratio - cr) < 0.05 for cr in common_ratios):
-                    self.warnings.append(f"[Typography] {filename}: Font sizes may not follow modular scale (ratio: {ratio:.2f}). Consider consistent ratio like 1.25 (Major Third).")
-                    break
-
-        # 2.9 Readability - Content chunking
-        # Check for very long paragraphs (>5 lines estimated)
-        paragraphs = re.findall(r'<p[^>]*>([^<]+)</p>', content, re.IGNORECASE)
-        for p in paragraphs:
-            word_count = len(p.split())
-            if word_count > 100:  # ~5-6 lines
-                self.warnings.append(f"[Typography] {filename}: Long paragraph detected ({word_count} words). Break into 3-4 line chunks for readability.")
-
-        # Check for missing subheadings in long content
-        if len(paragraphs) > 5:
-            subheadings = len(re.findall(r'<h[2-6]', content, re.IGNORECASE))
-            if subheadings == 0:
-                self.warnings.append(f"[Typography] {filename}: Long content without subheadings. Add h2/h3 to break up text.")
-
-        # --- 3. VISUAL EFFECTS (visual-effects.md) ---
-        
-        # Glassmorphism Check
-        if 'backdrop-filter' in content or 'blur(' in content:
-            if not re.search(r'background:\s*rgba|bg-opacity|bg-[a-z0-9]+\/\d+', content):
-                self.warnings.append(f"[Visual] {filename}: Blur used without semi-transparent background (Glassmorphism fail)")
-        
-        # GPU Acceleration / Performance
-        if re.search(r'@keyframes|transition:', content):
-            expensive_props = re.findall(r'width|height|top|left|right|bottom|margin|padding', content)
-            if expensive_props:
-                self.warnings.append(f"[Performance] {filename}: Animating expensive properties ({', '.join(set(expensive_props))}). Use transform/opacity where possible.")
-            
-            # Reduced Motion
-            if not re.search(r'prefers-reduced-motion', content):
-                self.warnings.append(f"[Accessibility] {filename}: Animations found without prefers-reduced-motion check")
-
-        # Natural Shadows
-        shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in shadows:
-            # Check if natural (Y > X) or multiple layers
-            if ',' not in shadow and not re.search(r'\d+px\s+[1-9]\d*px', shadow): # Simple heuristic for Y-offset
-                 self.warnings.append(f"[Visual] {filename}: Simple/Unnatural shadow detected. Consider multiple layers or Y > X offset for realism.")
-
-        # --- 3.1 NEOMORPHISM CHECK ---
-        # Check for neomorphism patterns (dual shadows with opposite directions)
-        neo_shadows = re.findall(r'box-shadow:\s*([^;]+)', content)
-        for shadow in neo_shadows:
-            # Neomorphism has two shadows: positive offset + negative offset
-            if ',' in shadow and '-' in shadow:
-                # Check for inset pattern (pressed state)
-                if 'inset' in shadow:
-                    self.warnings.append(f"[Visual] {filename}: Neomorphism inset detected. Ensure adequate contrast for accessibility.")
-
-        # --- 3.2 SHADOW HIERARCHY ---
-        # Count shadow levels to check for elevation consistency
-        shadow_count = len(shadows)
-        if shadow_count > 0:
-            # Check for shadow opacity levels (should indicate hierarchy)
-            opacities = re.findall(r'rgba?\([^)]+,\s*([\d.]+)\)', content)
-            shadow_opacities = [float(o) for o in opacities if float(o) < 0.5]
-            if shadow_count >= 3 and len(shadow_opacities) > 0:
-                # Check if there's variety in shadow opacities for different elevations
-                unique_opacities = len(set(shadow_opacities))
-                if unique_opacities < 2:
-                    self.warnings.append(f"[Visual] {filename}: All shadows at same opacity level. Vary shadow intensity for elevation hierarchy.")
-
-        # --- 3.3 GRADIENT CHECKS ---
-        # Check for gradient usage
-        has_gradient = bool(re.search(r'gradient|linear-gradient|radial-gradient|conic-gradient', content))
-        if has_gradient:
-            # Warn about mesh/aurora gradients (can be overused)
-            gradient_count = len(re.findall(r'gradient', content, re.IGNORECASE))
-            if gradient_count > 5:
-                self.warnings.append(f"[Visual] {filename}: Many gradients detected ({gradient_count}). Ensure this serves purpose, not decoration.")
-        else:
-            # Check if hero section exists without gradient
-            if has_hero and not re.search(r'background:|bg-', content):
-                self.warnings.append(f"[Visual] {filename}: Hero section without visual interest. Consider gradient for depth.")
-
-        # --- 3.4 BORDER EFFECTS ---
-        # Check for gradient borders or animated borders
-        has_border = bool(re.search(r'border:|border-', content))
-        if has_border:
-            # Check for overly complex borders
-            border_count = len(re.findall(r'border:', content))
-            if border_count > 8:
-                self.warnings.append(f"[Visual] {filename}: Many border declarations ({border_count}). Simplify for cleaner look.")
-
-        # --- 3.5 GLOW EFFECTS ---
-        # Check for text-shadow or multiple box-shadow layers (glow effects)
-        text_shadows = re.findall(r'text-shadow:', content)
-        for ts in text_shadows:
-            # Multiple text-shadow layers indicate glow
-            if ',' in ts:
-                self.warnings.append(f"[Visual] {filename}: Text glow effect detected. Ensure readability is maintained.")
-
-        # Check for box-shadow glow (multiple layers with 0 offset)
-        glow_shadows = re.findall(r'box-shadow:\s*[^;]*0\s+0\s+', content)
-        if len(glow_shadows) > 2:
-            self.warnings.append(f"[Visual] {filename}: Multiple glow effects detected. Use sparingly for emphasis only.")
-
-        # --- 3.6 OVERLAY TECHNIQUES ---
-        # Check for image overlays (for readability)
-        has_images = bool(re.search(r'<img|background-image:|bg-\[url', content))
-        if has_images and has_long_text:
-            has_overlay = bool(re.search(r'overlay|rgba\(0|gradient.*transparent|::after|::before', content))
-            if not has_overlay:
-                self.warnings.append(f"[Visual] {filename}: Text over image without overlay. Add gradient overlay for readability.")
-
-        # --- 3.7 PERFORMANCE: will-change ---
-        # Check for will-change usage
-        if re.search(r'will-change:', content):
-            will_change_props = re.findall(r'will-change:\s*([^;]+)', content)
-            for prop in will_change_props:
-                prop = prop.strip().lower()
-                if prop in ['width', 'height', 'top', 'left', 'right', 'bottom', 'margin', 'padding']:
-                    self.issues.append(f"[Performance] {filename}: will-change on '{prop}' (layout property). Use only for transform/opacity.")
-
-        # Check for excessive will-change usage
-        will_change_count = len(re.findall(r'will-change:', content))
-        if will_change_count > 3:
-            self.warnings.append(f"[Performance] {filename}: Many will-change declarations ({will_change_count}). Use sparingly, only for heavy animations.")
-
-        # --- 3.8 EFFECT SELECTION ---
-        # Check for effect overuse (too many visual effects)
-        effect_count = (
-            (1 if has_gradient else 0) +
-            shadow_count +
-            len(re.findall(r'backdrop-filter|blur\(', content)) +
-            len(re.findall(r'text-shadow:', content))
-        )
-        if effect_count > 10:
-            self.warnings.append(f"[Visual] {filename}: Many visual effects ({effect_count}). Ensure effects serve purpose, not decoration.")
-
-        # Check for static/flat design (no depth)
-        if has_long_text and effect_count == 0:
-            self.warnings.append(f"[Visual] {filename}: Flat design with no depth. Consider shadows or subtle gradients for hierarchy.")
-
-        # --- 4. COLOR SYSTEM (color-system.md) ---
-
-        # 4.1 PURPLE BAN - Critical check from color-system.md
-        purple_hexes = ['#8B5CF6', '#A855F7', '#9333EA', '#7C3AED', '#6D28D9',
-                        '#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE',
-                        '#8b5cf6', '#a855f7', '#9333ea', '#7c3aed', '#6d28d9',
-                        'purple', 'violet', 'fuchsia', 'magenta', 'lavender']
-        for purple in purple_hexes:
-            if purple.lower() in content.lower():
-                self.issues.append(f"[Color] {filename}: PURPLE DETECTED ('{purple}'). Banned by Maestro rules. Use Teal/Cyan/Emerald instead.")
-                break
+        self.issues.extend(issues)
+        self.warnings.extend(warnings)
+        self.passed_count += passed
 
-        # 4.2 60-30-10 Rule check
-        # Count color usage to estimate ratio
-        color_hex_count = len(re.findall(r'#[0-9a-fA-F]{3,6}', content))
-        hsl_count = len(re.findall(r'hsl\(', content))
-        total_colors = color_hex_count + hsl_count
-        if total_colors > 3:
-            # Check for dominant colors (should be ~60%)
-            bg_declarations = re.findall(r'(?:background|bg-|bg\[)([^;}\s]+)', content)
-            text_declarations = re.findall(r'(?:color|text-)([^;}\s]+)', content)
-            if len(bg_declarations) > 0 and len(text_declarations) > 0:
-                # Just warn if too many distinct colors
-                unique_hexes = set(re.findall(r'#[0-9a-fA-F]{6}', content))
-                if len(unique_hexes) > 5:
-                    self.warnings.append(f"[Color] {filename}: {len(unique_hexes)} distinct colors. Consider 60-30-10 rule: dominant (60%), secondary (30%), accent (10%).")
-
-        # 4.3 Color Scheme Pattern Detection
-        # Detect monochromatic (same hue, different lightness)
-        hsl_matches = re.findall(r'hsl\((\d+),\s*\d+%,\s*\d+%\)', content)
-        if len(hsl_matches) >= 3:
-            hues = [int(h) for h in hsl_matches]
-            hue_range = max(hues) - min(hues)
-            if hue_range < 10:
-                self.warnings.append(f"[Color] {filename}: Monochromatic palette detected (hue variance: {hue_range}deg). Ensure adequate contrast.")
-
-        # 4.4 Dark Mode Compliance
-        # Check for pure black (#000000) or pure white (#FFFFFF) text (forbidden)
-        if re.search(r'color:\s*#000000|#000\b', content):
-            self.warnings.append(f"[Color] {filename}: Pure black (#000000) detected. Use #1a1a1a or darker grays for better dark mode.")
-        if re.search(r'background:\s*#ffffff|#fff\b', content) and re.search(r'dark:\s*|dark:', content):
-            self.warnings.append(f"[Color] {filename}: Pure white background in dark mode context. Use slight off-white (#f9fafb) for reduced eye strain.")
-
-        # 4.5 WCAG Contrast Pattern Check
-        # Look for potential low-contrast combinations
-        light_bg_light_text = bool(re.search(r'bg-(?:gray|slate|zinc)-50|bg-white.*text-(?:gray|slate)-[12]', content))
-        dark_bg_dark_text = bool(re.search(r'bg-(?:gray|slate|zinct)-9|bg-black.*text-(?:gray|slate)-[89]', content))
-        if light_bg_light_text or dark_bg_dark_text:
-            self.warnings.append(f"[Color] {filename}: Possible low-contrast combination detected. Verify WCAG AA (4.5:1 for text).")
-
-        # 4.6 Color Psychology Context Check
-        # Warn if blue used for food/restaurant context
-        has_blue = bool(re.search(r'bg-blue|text-blue|from-blue|#[0-9a-fA-F]*00[0-9A-Fa-f]{2}|#[0-9a-fA-F]*1[0-9A-Fa-f]{2}', content))
-        has_food_context = bool(re.search(r'restaurant|food|cooking|recipe|menu|dish|meal', content, re.IGNORECASE))
-        if has_blue and has_food_context:
-            self.warnings.append(f"[Color] {filename}: Blue color in food context. Blue suppresses appetite; consider warm colors (red, orange, yellow).")
-
-        # 4.7 HSL-Based Palette Detection
-        # Check if using HSL for palette (recommended in color-system.md)
-        has_color_vars = bool(re.search(r'--color-|color-|primary-|secondary-', content))
-        if has_color_vars and not re.search(r'hsl\(', content):
-            self.warnings.append(f"[Color] {filename}: Color variables without HSL. Consider HSL for easier palette adjustment (Hue, Saturation, Lightness).")
-
-        # --- 5. ANIMATION GUIDE (animation-guide.md) ---
-
-        # 5.1 Duration Appropriateness
-        # Check for excessively long or short animations
-        durations = re.findall(r'(?:duration|animation-duration|transition-duration):\s*([\d.]+)(s|ms)', content)
-        for duration, unit in durations:
-            duration_ms = float(duration) * (1000 if unit == 's' else 1)
-            if duration_ms < 50:
-                self.warnings.append(f"[Animation] {filename}: Very fast animation ({duration}{unit}). Minimum 50ms for visibility.")
-            elif duration_ms > 1000 and 'transition' in content.lower():
-                self.warnings.append(f"[Animation] {filename}: Long transition ({duration}{unit}). Transitions should be 100-300ms for responsiveness.")
-
-        # 5.2 Easing Function Correctness
-        # Check for incorrect easing patterns
-        if re.search(r'ease-in\s+.*entry|fade-in.*ease-in', content):
-            self.warnings.append(f"[Animation] {filename}: Entry animation with ease-in. Entry should use ease-out for snappy feel.")
-        if re.search(r'ease-out\s+.*exit|fade-out.*ease-out', content):
-            self.warnings.append(f"[Animation] {filename}: Exit animation with ease-out. Exit should use ease-in for natural feel.")
-
-        # 5.3 Micro-interaction Feedback Patterns
-        # Check for interactive elements without hover/focus states
-        interactive_elements = len(re.findall(r'<button|<a\s+href|onClick|@click', content))
-        has_hover_focus = bool(re.search(r'hover:|focus:|:hover|:focus', content))
-        if interactive_elements > 2 and not has_hover_focus:
-            self.warnings.append(f"[Animation] {filename}: Interactive elements without hover/focus states. Add micro-interactions for feedback.")
-
-        # 5.4 Loading State Indicators
-        # Check for loading patterns
-        has_async = bool(re.search(r'async|await|fetch|axios|loading|isLoading', content))
-        has_loading_indicator = bool(re.search(r'skeleton|spinner|progress|loading|<circle.*animate', content))
-        if has_async and not has_loading_indicator:
-            self.warnings.append(f"[Animation] {filename}: Async operations without loading indicator. Add skeleton or spinner for perceived performance.")
-
-        # 5.5 Page Transition Patterns
-        # Check for page/view transitions
-        has_routing = bool(re.search(r'router|navigate|Link.*to|useHistory', content))
-        has_page_transition = bool(re.search(r'AnimatePresence|motion\.|transition.*page|fade.*route', content))
-        if has_routing and not has_page_transition:
-            self.warnings.append(f"[Animation] {filename}: Routing detected without page transitions. Consider fade/slide for context continuity.")
-
-        # 5.6 Scroll Animation Performance
-        # Check for scroll-driven animations
-        has_scroll_anim = bool(re.search(r'onScroll|scroll.*trigger|IntersectionObserver', content))
-        if has_scroll_anim:
-            # Check if using expensive properties in scroll handlers
-            if re.search(r'onScroll.*[^\w](width|height|top|left)', content):
-                self.issues.append(f"[Animation] {filename}: Scroll handler animating layout properties. Use transform/opacity for 60fps.")
-
-        # --- 6. MOTION GRAPHICS (motion-graphics.md) ---
-
-        # 6.1 Lottie Animation Checks
-        has_lottie = bool(re.search(r'lottie|Lottie|@lottie-react', content))
-        if has_lottie:
-            # Check for reduced motion fallback
-            has_lottie_fallback = bool(re.search(r'prefers-reduced-motion.*lottie|lottie.*isPaused|lottie.*stop', content))
-            if not has_lottie_fallback:
-                self.warnings.append(f"[Motion] {filename}: Lottie animation without reduced-motion fallback. Add pause/stop for accessibility.")
-
-        # 6.2 GSAP Memory Leak Risks
-        has_gsap = bool(re.search(r'gsap|ScrollTrigger|from\(.*gsap', content))
-        if has_gsap:
-            # Check for cleanup patterns
-            has_gsap_cleanup = bool(re.search(r'kill\(|revert\(|useEffect.*return.*gsap', content))
-            if not has_gsap_cleanup:
-                self.issues.append(f"[Motion] {filename}: GSAP animation without cleanup (kill/revert). Memory leak risk on unmount.")
-
-        # 6.3 SVG Animation Performance
-        svg_animations = re.findall(r'<animate|<animateTransform|stroke-dasharray|stroke-dashoffset', content)
-        if len(svg_animations) > 3:
-            self.warnings.append(f"[Motion] {filename}: Multiple SVG animations detected. Ensure stroke-dashoffset is used sparingly for mobile performance.")
-
-        # 6.4 3D Transform Performance
-        has_3d_transform = bool(re.search(r'transform3d|perspective\(|rotate3d|translate3d', content))
-        if has_3d_transform:
-            # Check for perspective on parent
-            has_perspective_parent = bool(re.search(r'perspective:\s*\d+px|perspective\s*\(', content))
-            if not has_perspective_parent:
-                self.warnings.append(f"[Motion] {filename}: 3D transform without perspective parent. Add perspective: 1000px for realistic depth.")
-
-            # Warn about mobile performance
-            self.warnings.append(f"[Motion] {filename}: 3D transforms detected. Test on mobile; can impact performance on low-end devices.")
-
-        # 6.5 Particle Effect Warnings
-        # Check for canvas/WebGL particle systems
-        has_particles = bool(re.search(r'particle|canvas.*loop|requestAnimationFrame.*draw|Three\.js', content))
-        if has_particles:
-            self.warnings.append(f"[Motion] {filename}: Particle effects detected. Ensure fallback or reduced-quality option for mobile devices.")
-
-        # 6.6 Scroll-Driven Animation Performance
-        has_scroll_driven = bool(re.search(r'IntersectionObserver.*animate|scroll.*progress|view-timeline', content))
-        if has_scroll_driven:
-            # Check for throttling/debouncing
-            has_throttle = bool(re.search(r'throttle|debounce|requestAnimationFrame', content))
-            if not has_throttle:
-                self.issues.append(f"[Motion] {filename}: Scroll-driven animation without throttling. Add requestAnimationFrame for 60fps.")
-
-        # 6.7 Motion Decision Tree - Context Check
-        # Check if animation serves purpose (not just decoration)
-        total_animations = (
-            len(re.findall(r'@keyframes|transition:|animate-', content)) +
-            (1 if has_lottie else 0) +
-            (1 if has_gsap else 0)
-        )
-        if total_animations > 5:
-            # Check if animations are functional
-            functional_animations = len(re.findall(r'hover:|focus:|disabled|loading|error|success', content))
-            if functional_animations < total_animations / 2:
-                self.warnings.append(f"[Motion] {filename}: Many animations ({total_animations}). Ensure majority serve functional purpose (feedback, guidance), not decoration.")
-
-        # --- 7. ACCESSIBILITY ---
-        if re.search(r'<img(?![^>]*alt=)[^>]*>', content):
-            self.issues.append(f"[Accessibility] {filename}: Missing img alt text")
-
-    def audit_directory(self, directory: str) -> None:
-        extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+    def audit_file(self, filepath: str) -> None:
+        self.merge(audit_path(filepath))
+
+    def audit_directory(self, directory: str, jobs: int = 1, cache: ResultsCache = None) -> None:
+        paths = collect_files(directory)
+        relpaths = [Path(p).relative_to(directory).as_posix() for p in paths]
+        cached = [cache.lookup(r) for r in relpaths] if cache else [None] * len(paths)
+        for relpath, result in zip(relpaths, iter_results(paths, cached, jobs)):
+            if cache and result is not None:
+                cache.store(relpath, result)
+            self.merge(result)
+        if cache: cache.save()
 
     def get_report(self):
         return {
@@ -688,17 +1219,41 @@ class UXAuditor:
             "compliant": len(self.issues) == 0
         }
 
+
+def _arg_value(flags, default=None):
+    """Value following the first of flags present on the command line"""
+    for flag in flags:
+        if flag in sys.argv[:-1]:
+            return sys.argv[sys.argv.index(flag) + 1]
+    return default
+
+
+USAGE = "Usage: python ux_audit.py <path> [--json] [--jobs N] [--cache FILE | --no-cache]"
+
+
 def main():
-    if len(sys.argv) < 2: sys.exit(1)
+    if len(sys.argv) < 2:
+        print(USAGE)
+        sys.exit(1)
     
     path = sys.argv[1]
     is_json = "--json" in sys.argv
+    try:
+        jobs = int(_arg_value(("--jobs", "-j"), 1))
+    except ValueError:
+        print(f"--jobs expects an integer\n{USAGE}")
+        sys.exit(1)
+    if jobs < 1: jobs = os.cpu_count() or 1  # --jobs 0: one per CPU
+    cache = None
+    if os.path.isdir(path) and "--no-cache" not in sys.argv:
+        cache = ResultsCache(_arg_value(("--cache",)) or default_cache_path(path), path)
     
     auditor = UXAuditor()
     if os.path.isfile(path): auditor.audit_file(path)
-    else: auditor.audit_directory(path)
+    else: auditor.audit_directory(path, jobs, cache)
     
     report = auditor.get_report()
+    if cache: report["cache"] = cache.stats()
     
     if is_json:
         print(json.dumps(report))
@@ -713,6 +1268,7 @@ def main():
             print(f"[*] WARNINGS ({len(report['warnings'])}):")
             for w in report['warnings'][:15]: print(f"  - {w}")
         print(f"[+] PASSED CHECKS: {report['passed_checks']}")
+        if cache: print(f"[=] CACHE: {cache.hits} reused, {cache.misses} audited")
         status = "PASS" if report['compliant'] else "FAIL"
         print(f"STATUS: {status}")
 
@@ -63,37 +63,64 @@ Analyzes React Native / Flutter code for compliance with:
    - API Response Caching
 
 Total: 50+ mobile-specific checks
+
+Only React Native / Flutter files are audited: files_checked counts those,
+files_skipped the rest. Directory audits skip packages whose package.json or
+pubspec.yaml is not a mobile app. Files of a mobile app are searched whole for
+a framework marker; elsewhere only their first PRESCREEN_CHARS are, unless
+--no-prescreen is given. --ignore-manifests turns both off and searches each
+whole file.
+
+Directory results are cached per file in ~/.cache/mobile-audit (or
+$XDG_CACHE_HOME), so re-runs only re-audit edited files; --no-cache disables it.
 """
 
 import sys
 import os
 import re
 import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
+AUDIT_EXTENSIONS = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', '.idea'}
+PARALLEL_MIN_FILES = 32  # below this, pool start-up costs more than it saves
+CACHE_FORMAT_VERSION = 1
+
+# Framework markers; imports sit at the top, so outside a mobile app's package
+# a file without one in its first PRESCREEN_CHARS is classified as non-mobile
+# without a full read
+REACT_NATIVE_RE = re.compile(r'react-native|@react-navigation|React\.Native')
+FLUTTER_RE = re.compile(r'import \'package:flutter|MaterialApp|Widget\.build')
+PRESCREEN_CHARS = 8192
+
+# Manifest dependencies that make a package a React Native / Flutter app
+MOBILE_PACKAGES = {'react-native', 'expo'}
+MOBILE_PACKAGE_PREFIXES = ('react-native-', '@react-native', '@react-navigation/', 'expo-')
+MANIFESTS = ('package.json', 'pubspec.yaml')
+FLUTTER_SDK_RE = re.compile(r'sdk:\s*flutter')
+
 class MobileAuditor:
     def __init__(self):
         self.issues = []
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
+        self.files_skipped = 0
 
     def audit_file(self, filepath: str) -> None:
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-        except:
-            return
-
-        self.files_checked += 1
-        filename = os.path.basename(filepath)
+        self.merge(audit_path(filepath, prescreen=False))
 
+    def audit_content(self, content: str, filename: str) -> None:
         # Detect framework
-        is_react_native = bool(re.search(r'react-native|@react-navigation|React\.Native', content))
-        is_flutter = bool(re.search(r'import \'package:flutter|MaterialApp|Widget\.build', content))
+        is_react_native = bool(REACT_NATIVE_RE.search(content))
+        is_flutter = bool(FLUTTER_RE.search(content))
 
         if not (is_react_native or is_flutter):
             return  # Skip non-mobile files
+        self.files_checked += 1
 
         # --- 1. TOUCH PSYCHOLOGY CHECKS ---
 
@@ -610,17 +637,36 @@ class MobileAuditor:
             # This is more of a configuration check, not code pattern
             self.passed_count += 1  # Hermes is default in RN 0.70+
 
-    def audit_directory(self, directory: str) -> None:
-        extensions = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', 'build', '.idea'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
+    def merge(self, result) -> None:
+        """Add one file's (issues, warnings, passed) from audit_path()"""
+        if result is None:
+            self.files_skipped += 1
+            return
+        _, issues, warnings, passed = result
+        self.files_checked += 1
+        self.issues.extend(issues)
+        self.warnings.extend(warnings)
+        self.passed_count += passed
+
+    def audit_directory(self, directory: str, jobs: int = 1, cache: "ResultsCache" = None,
+                        manifests: bool = True, prescreen: bool = True) -> None:
+        entries = collect_files(directory, manifests)
+        paths = [p for p, _ in entries]
+        # A manifest that says mobile vouches for the file: read it whole
+        prescreens = [prescreen and manifests and kind is not True for _, kind in entries]
+        relpaths = [Path(p).relative_to(directory).as_posix() for p in paths]
+        cached = [cache.lookup(r) for r in relpaths] if cache else [None] * len(paths)
+        for relpath, result in zip(relpaths, iter_results(paths, cached, jobs, prescreens)):
+            if cache and result is not None:
+                cache.store(relpath, result)
+            self.merge(result)
+        if cache:
+            cache.save()
 
     def get_report(self):
         return {
             "files_checked": self.files_checked,
+            "files_skipped": self.files_skipped,
             "issues": self.issues,
             "warnings": self.warnings,
             "passed_checks": self.passed_count,
@@ -628,26 +674,234 @@ class MobileAuditor:
         }
 
 
+# The cache, worker fan-out and argument helpers below are kept in step with
+# frontend-design/scripts/ux_audit.py by hand: each skill script runs standalone.
+def _rules_version() -> str:
+    """Fingerprint of this script's source; editing any check invalidates cached results"""
+    source = Path(__file__).read_bytes()
+    return hashlib.sha256(f"{CACHE_FORMAT_VERSION}:".encode('utf-8') + source).hexdigest()[:16]
+
+
+def default_cache_path(directory: str) -> Path:
+    """Per-directory cache file under $XDG_CACHE_HOME/mobile-audit (or ~/.cache/...)"""
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    project_id = hashlib.sha1(os.path.abspath(directory).encode('utf-8')).hexdigest()[:16]
+    return Path(root) / "mobile-audit" / f"{project_id}.json"
+
+
+class ResultsCache:
+    """
+    Issues, warnings and passed count per file, keyed by path relative to the
+    audited directory and the SHA-256 of its content, persisted as JSON.
+    """
+
+    def __init__(self, path, root):
+        self.path = Path(path)
+        self.root = Path(root)
+        self.version = _rules_version()
+        self.files = {}
+        self.hits = 0
+        self.misses = 0
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get("version") == self.version:
+                self.files = data.get("files", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def lookup(self, relpath: str):
+        return self.files.get(relpath)
+
+    def store(self, relpath: str, result) -> None:
+        digest, issues, warnings, passed = result
+        entry = self.files.get(relpath)
+        if entry is not None and entry.get("sha256") == digest:
+            self.hits += 1
+        else:
+            self.misses += 1
+        self.files[relpath] = {"sha256": digest, "issues": issues, "warnings": warnings, "passed": passed}
+
+    def save(self) -> None:
+        """Write the cache atomically, dropping files that no longer exist under root"""
+        self.files = {relpath: entry for relpath, entry in self.files.items() if (self.root / relpath).is_file()}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": self.version, "files": self.files}), encoding='utf-8')
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # caching is best effort
+
+    def stats(self):
+        return {"path": str(self.path), "hits": self.hits, "audited": self.misses}
+
+
+def read_source(filepath: str, prescreen: bool = True):
+    """
+    Text of a React Native or Flutter file; None if it cannot be read or carries
+    no framework marker. With prescreen only the first PRESCREEN_CHARS are
+    searched, so a non-mobile file is never read past them.
+    """
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            head = f.read(PRESCREEN_CHARS) if prescreen else f.read()
+            if not (REACT_NATIVE_RE.search(head) or FLUTTER_RE.search(head)):
+                return None
+            return head + f.read()
+    except:
+        return None
+
+
+def audit_path(filepath: str, cached: dict = None, prescreen: bool = True):
+    """
+    Worker entry point: (sha256, issues, warnings, passed) of one file, None if
+    it cannot be read or is not a mobile file (see read_source()). A cached
+    entry whose hash still matches is reused.
+    """
+    content = read_source(filepath, prescreen)
+    if content is None:
+        return None
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+    if cached and cached.get("sha256") == digest:
+        return digest, cached["issues"], cached["warnings"], cached["passed"]
+    auditor = MobileAuditor()
+    auditor.audit_content(content, os.path.basename(filepath))
+    return digest, auditor.issues, auditor.warnings, auditor.passed_count
+
+
+def manifest_kind(directory: str):
+    """
+    True if directory's package.json depends on React Native / Expo or its
+    pubspec.yaml on the Flutter SDK, False if its manifests show neither,
+    None if it has no readable manifest.
+    """
+    kind = None
+    try:
+        with open(os.path.join(directory, 'package.json'), 'r', encoding='utf-8') as f:
+            package = json.load(f)
+        deps = set()
+        for key in ('dependencies', 'devDependencies', 'peerDependencies'):
+            deps.update(package.get(key) or {})
+        kind = any(name in MOBILE_PACKAGES or name.startswith(MOBILE_PACKAGE_PREFIXES) for name in deps)
+    except (OSError, ValueError, AttributeError, TypeError):
+        pass
+    if not kind:
+        try:
+            with open(os.path.join(directory, 'pubspec.yaml'), 'r', encoding='utf-8', errors='replace') as f:
+                kind = bool(FLUTTER_SDK_RE.search(f.read()))
+        except OSError:
+            pass
+    return kind
+
+
+def enclosing_manifest_kind(directory: str):
+    """manifest_kind() of the nearest ancestor with a manifest, up to the repository root"""
+    path = os.path.abspath(directory)
+    while not os.path.isdir(os.path.join(path, '.git')):
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+        kind = manifest_kind(path)
+        if kind is not None:
+            return kind
+    return None
+
+
+def collect_files(directory: str, manifests: bool = True) -> list:
+    """
+    (path, kind) of the auditable files under directory, in os.walk order, kind
+    being the manifest_kind() of the nearest package.json / pubspec.yaml (None
+    without one or without manifests). With manifests, files whose package is
+    not a mobile app are left out; nested packages are still visited, so a
+    mobile app inside a web monorepo is found.
+    """
+    paths = []
+    kinds = {}
+    start = enclosing_manifest_kind(directory) if manifests else None
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        kind = kinds.pop(root, start)
+        if manifests and any(m in files for m in MANIFESTS):
+            found = manifest_kind(root)
+            if found is not None:
+                kind = found
+        for d in dirs:
+            kinds[os.path.join(root, d)] = kind
+        if kind is False:
+            continue  # a web or Dart-only package
+        for file in files:
+            if Path(file).suffix in AUDIT_EXTENSIONS:
+                paths.append((os.path.join(root, file), kind))
+    return paths
+
+
+def iter_results(paths: list, cached: list, jobs: int = 1, prescreens: list = None):
+    """audit_path() of every path, in order; fanned out to worker processes when jobs > 1"""
+    if prescreens is None:
+        prescreens = [True] * len(paths)
+    done = 0
+    if jobs > 1 and len(paths) >= PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                # map() yields in submission order, keeping the merge deterministic
+                chunksize = max(1, len(paths) // (jobs * 4))
+                for result in executor.map(audit_path, paths, cached, prescreens, chunksize=chunksize):
+                    yield result
+                    done += 1
+            return
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # no usable process pool here: audit the rest serially
+    for filepath, entry, prescreen in zip(paths[done:], cached[done:], prescreens[done:]):
+        yield audit_path(filepath, entry, prescreen)
+
+
+def _arg_value(flags, default=None):
+    """Value following the first of flags present on the command line"""
+    for flag in flags:
+        if flag in sys.argv[:-1]:
+            return sys.argv[sys.argv.index(flag) + 1]
+    return default
+
+
+USAGE = ("Usage: python mobile_audit.py <directory> [--json] [--jobs N] [--cache FILE | --no-cache] "
+         "[--ignore-manifests] [--no-prescreen]")
+
+
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python mobile_audit.py <directory>")
+        print(USAGE)
         sys.exit(1)
 
     path = sys.argv[1]
     is_json = "--json" in sys.argv
+    try:
+        jobs = int(_arg_value(("--jobs", "-j"), 1))
+    except ValueError:
+        print(f"--jobs expects an integer\n{USAGE}")
+        sys.exit(1)
+    if jobs < 1:
+        jobs = os.cpu_count() or 1  # --jobs 0: one per CPU
+    cache = None
+    if os.path.isdir(path) and "--no-cache" not in sys.argv:
+        cache = ResultsCache(_arg_value(("--cache",)) or default_cache_path(path), path)
 
     auditor = MobileAuditor()
     if os.path.isfile(path):
         auditor.audit_file(path)
     else:
-        auditor.audit_directory(path)
+        auditor.audit_directory(path, jobs, cache, "--ignore-manifests" not in sys.argv,
+                                "--no-prescreen" not in sys.argv)
 
     report = auditor.get_report()
+    if cache:
+        report["cache"] = cache.stats()
 
     if is_json:
         print(json.dumps(report, indent=2))
     else:
-        print(f"\n[MOBILE AUDIT] {report['files_checked']} mobile files checked")
+        print(f"\n[MOBILE AUDIT] {report['files_checked']} mobile files checked, "
+              f"{report['files_skipped']} non-mobile skipped")
         print("-" * 50)
         if report['issues']:
             print(f"[!] ISSUES ({len(report['issues'])}):")
@@ -658,6 +912,8 @@ def main():
             for w in report['warnings'][:15]:
                 print(f"  - {w}")
         print(f"[+] PASSED CHECKS: {report['passed_checks']}")
+        if cache:
+            print(f"[=] CACHE: {cache.hits} reused, {cache.misses} audited")
         status = "PASS" if report['compliant'] else "FAIL"
         print(f"STATUS: {status}")
 
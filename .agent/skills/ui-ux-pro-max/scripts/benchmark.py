@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Benchmark - search quality and latency for core.py
+Usage: python benchmark.py [--queries FILE] [--repeat 20] [--depth 10] [--output run.json]
+       python benchmark.py --compare base.json new.json [--tolerance 10]
+
+Each line of the queries file is one labeled case:
+    {"domain": "style", "query": "...", "expected": ["Glassmorphism"]}
+    {"stack": "react", "query": "...", "expected": ["Use keys correctly"]}
+    {"design_system": true, "query": "SaaS dashboard"}
+Expected values are matched against the domain's key column (KEY_COLS, else
+its first output column; "Guideline" for stacks). Design-system cases are
+timed only.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime
+from math import log2
+from pathlib import Path
+
+import core
+from core import CSV_CONFIG, search, search_stack
+
+# ============ CONFIGURATION ============
+DEFAULT_QUERIES = Path(__file__).parent.parent / "benchmarks" / "queries.jsonl"
+DEFAULT_REPEAT = 20
+DEFAULT_DEPTH = 10
+
+# Identifying column for domains whose first output column is not unique
+KEY_COLS = {"ux": "Issue", "react": "Issue", "web": "Issue", "icons": "Icon Name"}
+STACK_KEY_COL = "Guideline"
+
+# Metrics where a higher value is better; everything else is a cost
+QUALITY_METRICS = {"mrr", "ndcg"}
+QUALITY_TOLERANCE = 0.01
+
+
+def load_queries(path):
+    """Read labeled cases from a JSON-lines file"""
+    cases = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                cases.append(json.loads(line))
+    return cases
+
+
+def _kind(case):
+    if case.get("design_system"):
+        return "design_system"
+    return "search_stack" if case.get("stack") else "search"
+
+
+def _key_col(case):
+    if case.get("stack"):
+        return STACK_KEY_COL
+    return KEY_COLS.get(case["domain"], CSV_CONFIG[case["domain"]]["output_cols"][0])
+
+
+def _run(case, depth):
+    if case.get("design_system"):
+        from design_system import generate_design_system
+        return generate_design_system(case["query"])
+    if case.get("stack"):
+        return search_stack(case["query"], case["stack"], depth)
+    return search(case["query"], case.get("domain"), depth)
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+# ============ QUALITY ============
+def score_case(case, result, depth):
+    """(reciprocal rank, nDCG@depth) of one search result against its labels"""
+    expected = set(case.get("expected", []))
+    key_col = _key_col(case)
+    found = [row.get(key_col) for row in result.get("results", [])][:depth]
+
+    rr = 0.0
+    dcg = 0.0
+    seen = set()
+    for rank, value in enumerate(found, 1):
+        if value in expected and value not in seen:
+            seen.add(value)
+            dcg += 1 / log2(rank + 1)
+            if not rr:
+                rr = 1 / rank
+    ideal = sum(1 / log2(rank + 1) for rank in range(1, min(len(expected), depth) + 1))
+    return rr, (dcg / ideal if ideal else 0.0)
+
+
+# ============ MEASUREMENTS ============
+def measure_index():
+    """Cold build (empty cache), warm load (disk cache) and peak memory of a build"""
+    saved_dir = core.CACHE_DIR
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            core.CACHE_DIR = Path(tmp)
+            core._INDEX_MEMO.clear()
+            tracemalloc.start()
+            start = time.perf_counter()
+            loaded = core.preload_indexes()
+            build_s = time.perf_counter() - start
+            _, build_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            core._INDEX_MEMO.clear()
+            start = time.perf_counter()
+            core.preload_indexes()
+            warm_s = time.perf_counter() - start
+    finally:
+        core.CACHE_DIR = saved_dir
+        core._INDEX_MEMO.clear()
+
+    return {
+        "indexes": loaded,
+        "build_s": round(build_s, 4),
+        "warm_load_s": round(warm_s, 4),
+        "build_peak_kb": round(build_peak / 1024, 1),
+    }
+
+
+def measure_cases(cases, repeat, depth):
+    """Quality per case plus latency and peak memory per entry point"""
+    core.preload_indexes()
+    summary = {}
+    groups = defaultdict(list)
+    for case in cases:
+        groups[_kind(case)].append(case)
+
+    per_label = defaultdict(lambda: {"count": 0, "mrr": 0.0, "ndcg": 0.0})
+    for kind, group in groups.items():
+        # Quality and memory: one traced pass
+        tracemalloc.start()
+        rr_sum = ndcg_sum = 0.0
+        for case in group:
+            result = _run(case, depth)
+            if kind == "design_system":
+                continue
+            rr, ndcg = score_case(case, result, depth)
+            rr_sum += rr
+            ndcg_sum += ndcg
+            label = f"stack:{case['stack']}" if case.get("stack") else case["domain"]
+            per_label[label]["count"] += 1
+            per_label[label]["mrr"] += rr
+            per_label[label]["ndcg"] += ndcg
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Latency: untraced repeats
+        samples = []
+        for _ in range(repeat):
+            for case in group:
+                start = time.perf_counter()
+                _run(case, depth)
+                samples.append((time.perf_counter() - start) * 1000)
+
+        stats = {
+            "count": len(group),
+            "p50_ms": round(_percentile(samples, 50), 4),
+            "p99_ms": round(_percentile(samples, 99), 4),
+            "peak_kb": round(peak / 1024, 1),
+        }
+        if kind != "design_system":
+            stats["mrr"] = round(rr_sum / len(group), 4)
+            stats["ndcg"] = round(ndcg_sum / len(group), 4)
+        summary[kind] = stats
+
+    by_label = {
+        label: {"count": v["count"], "mrr": round(v["mrr"] / v["count"], 4), "ndcg": round(v["ndcg"] / v["count"], 4)}
+        for label, v in sorted(per_label.items())
+    }
+    return summary, by_label
+
+
+def run_benchmark(queries_path, repeat=DEFAULT_REPEAT, depth=DEFAULT_DEPTH, design_system=True):
+    """Full benchmark run as a JSON-serializable report"""
+    cases = load_queries(queries_path)
+    if not design_system:
+        cases = [c for c in cases if not c.get("design_system")]
+    index = measure_index()
+    entry_points, by_label = measure_cases(cases, repeat, depth)
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "backend": core.BM25_BACKEND,
+            "queries": str(queries_path),
+            "repeat": repeat,
+            "depth": depth,
+        },
+        "index": index,
+        "entry_points": entry_points,
+        "by_label": by_label,
+    }
+
+
+# ============ COMPARISON ============
+def _flatten(report):
+    flat = {}
+    for key, value in report.get("index", {}).items():
+        flat[f"index.{key}"] = value
+    for kind, stats in report.get("entry_points", {}).items():
+        for key, value in stats.items():
+            if key != "count":
+                flat[f"{kind}.{key}"] = value
+    return flat
+
+
+def compare_reports(base, new, tolerance):
+    """Rows of (metric, base, new, change, regressed) for every shared metric"""
+    old, cur = _flatten(base), _flatten(new)
+    rows = []
+    for metric in sorted(set(old) & set(cur)):
+        a, b = old[metric], cur[metric]
+        name = metric.rsplit(".", 1)[-1]
+        if name in QUALITY_METRICS:
+            change = b - a
+            regressed = change < -QUALITY_TOLERANCE
+            shown = f"{change:+.4f}"
+        elif name == "indexes":
+            regressed = False
+            shown = f"{b - a:+d}"
+        else:
+            change = (b - a) / a * 100 if a else 0.0
+            regressed = change > tolerance
+            shown = f"{change:+.1f}%"
+        rows.append((metric, a, b, shown, regressed))
+    return rows
+
+
+def format_comparison(rows):
+    lines = [f"{'Metric':<28} {'Base':>12} {'New':>12} {'Change':>10}", "-" * 66]
+    for metric, a, b, shown, regressed in rows:
+        flag = "  << REGRESSION" if regressed else ""
+        lines.append(f"{metric:<28} {a:>12} {b:>12} {shown:>10}{flag}")
+    return "\n".join(lines)
+
+
+def format_report(report):
+    lines = ["## UI Pro Max Benchmark", ""]
+    index = report["index"]
+    lines.append(f"**Index:** {index['indexes']} built in {index['build_s']}s (warm load {index['warm_load_s']}s, "
+                 f"peak {index['build_peak_kb']} KB)")
+    lines.append("")
+    lines.append(f"{'Entry point':<16} {'N':>4} {'MRR':>7} {'nDCG':>7} {'p50 ms':>9} {'p99 ms':>9} {'peak KB':>9}")
+    for kind, s in report["entry_points"].items():
+        lines.append(f"{kind:<16} {s['count']:>4} {s.get('mrr', '-'):>7} {s.get('ndcg', '-'):>7} "
+                     f"{s['p50_ms']:>9} {s['p99_ms']:>9} {s['peak_kb']:>9}")
+    lines.append("")
+    lines.append(f"{'Domain / stack':<24} {'N':>4} {'MRR':>7} {'nDCG':>7}")
+    for label, s in report["by_label"].items():
+        lines.append(f"{label:<24} {s['count']:>4} {s['mrr']:>7} {s['ndcg']:>7}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max search benchmark")
+    parser.add_argument("--queries", type=Path, default=DEFAULT_QUERIES, help="Labeled queries (JSON-lines)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed repetitions per query")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="Result depth for MRR/nDCG")
+    parser.add_argument("--no-design-system", action="store_true", help="Skip generate_design_system() cases")
+    parser.add_argument("--output", "-o", type=Path, default=None, help="Write the run as JSON")
+    parser.add_argument("--json", action="store_true", help="Print the run as JSON")
+    parser.add_argument("--compare", nargs=2, type=Path, metavar=("BASE", "NEW"), help="Diff two saved runs")
+    parser.add_argument("--tolerance", type=float, default=10.0, help="Allowed cost increase in percent (default: 10)")
+
+    args = parser.parse_args()
+
+    if args.compare:
+        base, new = (json.loads(p.read_text(encoding='utf-8')) for p in args.compare)
+        rows = compare_reports(base, new, args.tolerance)
+        print(format_comparison(rows))
+        sys.exit(1 if any(r[4] for r in rows) else 0)
+
+    report = run_benchmark(args.queries, args.repeat, args.depth, not args.no_design_system)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(json.dumps(report, indent=2, ensure_ascii=False) if args.json else format_report(report))
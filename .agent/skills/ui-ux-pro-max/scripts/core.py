@@ -5,14 +5,39 @@ UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
 import csv
+import hashlib
+import heapq
+import mmap
+import os
+import pickle
 import re
+import struct
+import tempfile
+from array import array
 from pathlib import Path
 from math import log
 from collections import defaultdict
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:  # optional: vectorized scoring backend
+    np = None
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
+CACHE_DIR = DATA_DIR.parent / ".index-cache"
+INDEX_FORMAT_VERSION = 3
 MAX_RESULTS = 3
+# CSVs at least this large keep only row byte offsets in the index; output
+# columns of the top hits are read back from the file on demand
+LAZY_ROWS_MIN_BYTES = 4 * 1024 * 1024
+
+# Scoring backend: "python" (postings dicts), "numpy" (sparse weight matrix),
+# "mmap" (compact binary index shared through the page cache) or "auto" (numpy
+# for corpora of at least NUMPY_MIN_DOCS rows when NumPy is installed)
+BM25_BACKEND = os.environ.get("UIPRO_BM25_BACKEND", "auto")
+NUMPY_MIN_DOCS = 2000
 
 CSV_CONFIG = {
     "style": {
@@ -97,16 +122,17 @@ AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
 # ============ BM25 IMPLEMENTATION ============
 class BM25:
-    """BM25 ranking algorithm for text search"""
+    """BM25 ranking algorithm for text search (inverted-index backed)"""
 
     def __init__(self, k1=1.5, b=0.75):
         self.k1 = k1
         self.b = b
-        self.corpus = []
         self.doc_lengths = []
         self.avgdl = 0
         self.idf = {}
         self.doc_freqs = defaultdict(int)
+        self.postings = {}
+        self.length_norms = []
         self.N = 0
 
     def tokenize(self, text):
@@ -115,102 +141,580 @@ class BM25:
         return [w for w in text.split() if len(w) > 2]
 
     def fit(self, documents):
-        """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
-        self.N = len(self.corpus)
+        """Build BM25 index from documents (any iterable, consumed once).
+
+        Postings map each term to a list of (doc_id, term_freq) pairs in
+        ascending doc_id order, so scoring only visits matching documents.
+        Documents are tokenized one at a time, never held as a token corpus.
+        """
+        postings = defaultdict(list)
+        self.doc_lengths = []
+        for idx, doc in enumerate(documents):
+            tokens = self.tokenize(doc)
+            self.doc_lengths.append(len(tokens))
+            term_freqs = defaultdict(int)
+            for word in tokens:
+                term_freqs[word] += 1
+            for word, tf in term_freqs.items():
+                postings[word].append((idx, tf))
+        self.N = len(self.doc_lengths)
         if self.N == 0:
             return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
+        self.postings = dict(postings)
 
-        for doc in self.corpus:
-            seen = set()
-            for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
-
-        for word, freq in self.doc_freqs.items():
+        for word, plist in self.postings.items():
+            freq = len(plist)
+            self.doc_freqs[word] = freq
             self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
 
+        # Per-document length normalisation, the only doc-dependent part of the denominator
+        avgdl = self.avgdl or 1
+        self.length_norms = [self.k1 * (1 - self.b + self.b * dl / avgdl) for dl in self.doc_lengths]
+
+    def _accumulate(self, query):
+        """Sum BM25 contributions over the postings of each query token"""
+        scores = {}
+        k1_plus_1 = self.k1 + 1
+        norms = self.length_norms
+        for token in self.tokenize(query):
+            plist = self.postings.get(token)
+            if not plist:
+                continue
+            idf = self.idf[token]
+            for idx, tf in plist:
+                scores[idx] = scores.get(idx, 0) + idf * (tf * k1_plus_1) / (tf + norms[idx])
+        return scores
+
     def score(self, query):
-        """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
+        """Score documents matching the query, best first"""
+        scores = self._accumulate(query)
+        return sorted(scores.items(), key=lambda x: (-x[1], x[0]))
 
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
+    def top_k(self, query, k):
+        """Return the k best (doc_id, score) pairs using a bounded heap"""
+        scores = self._accumulate(query)
+        return heapq.nsmallest(k, scores.items(), key=lambda x: (-x[1], x[0]))
 
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+    def top_k_many(self, queries, k):
+        """top_k() for each query in a batch"""
+        return [self.top_k(query, k) for query in queries]
 
-            scores.append((idx, score))
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+class NumpyBM25(BM25):
+    """
+    BM25 over a sparse term-document weight matrix (CSR, one row per term).
 
+    Every (term, doc) BM25 weight is precomputed in fit(), so scoring a query
+    is a sparse matrix-vector product: gather the rows of the query terms and
+    sum them per document with one np.bincount. Batches of queries are
+    scored together the same way, with the query offset folded into the bin index.
+    """
 
-# ============ SEARCH FUNCTIONS ============
-def _load_csv(filepath):
-    """Load CSV and return list of dicts"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+    # Upper bound on queries x documents scored per bincount in top_k_many()
+    BATCH_CELLS = 4_000_000
+
+    def fit(self, documents):
+        super().fit(documents)
+        self._compile()
+
+    @classmethod
+    def from_fitted(cls, bm25):
+        """Compile an already fitted pure-Python BM25 into the matrix form"""
+        compiled = cls(bm25.k1, bm25.b)
+        compiled.__dict__.update(bm25.__dict__)
+        compiled._compile()
+        return compiled
+
+    def _compile(self):
+        """Turn the postings lists into CSR arrays of precomputed weights"""
+        terms = list(self.postings)
+        self.vocab = {term: row for row, term in enumerate(terms)}
+        lengths = np.fromiter((len(self.postings[t]) for t in terms), dtype=np.int64, count=len(terms))
+        self.indptr = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.indptr[1:])
+
+        nnz = int(self.indptr[-1])
+        self.doc_ids = np.fromiter((idx for t in terms for idx, _ in self.postings[t]), dtype=np.int32, count=nnz)
+        tfs = np.fromiter((tf for t in terms for _, tf in self.postings[t]), dtype=np.float64, count=nnz)
+        idf = np.repeat(np.fromiter((self.idf[t] for t in terms), dtype=np.float64, count=len(terms)), lengths)
+        norms = np.asarray(self.length_norms, dtype=np.float64)[self.doc_ids]
+        self.weights = idf * (tfs * (self.k1 + 1)) / (tfs + norms)
+
+        # The matrix replaces the postings lists
+        self.postings = {}
+
+    def _query_cells(self, query):
+        """Positions in doc_ids/weights covered by the query's term rows"""
+        rows = [self.vocab[t] for t in self.tokenize(query) if t in self.vocab]
+        if not rows:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([np.arange(self.indptr[r], self.indptr[r + 1]) for r in rows])
+
+    def _score_vector(self, query):
+        cells = self._query_cells(query)
+        return np.bincount(self.doc_ids[cells], weights=self.weights[cells], minlength=self.N)
+
+    @staticmethod
+    def _select(scores, k):
+        """(doc_id, score) pairs of the k best positive scores, ties by doc_id"""
+        candidates = np.flatnonzero(scores > 0)
+        if k <= 0 or candidates.size == 0:
+            return []
+        if candidates.size > k:
+            kth = np.partition(scores[candidates], candidates.size - k)[candidates.size - k]
+            candidates = candidates[scores[candidates] >= kth]
+        order = np.lexsort((candidates, -scores[candidates]))[:k]
+        return [(int(idx), float(scores[idx])) for idx in candidates[order]]
+
+    def score(self, query):
+        scores = self._score_vector(query)
+        return self._select(scores, self.N)
+
+    def top_k(self, query, k):
+        return self._select(self._score_vector(query), k)
+
+    def top_k_many(self, queries, k):
+        results = []
+        chunk = max(1, self.BATCH_CELLS // max(self.N, 1))
+        for start in range(0, len(queries), chunk):
+            batch = queries[start:start + chunk]
+            cells = [self._query_cells(q) for q in batch]
+            bins = np.concatenate([self.doc_ids[c].astype(np.int64) + i * self.N for i, c in enumerate(cells)])
+            weights = np.concatenate([self.weights[c] for c in cells])
+            matrix = np.bincount(bins, weights=weights, minlength=len(batch) * self.N).reshape(len(batch), self.N)
+            results.extend(self._select(row, k) for row in matrix)
+        return results
+
+
+# ============ COMPACT INDEX FORMAT ============
+# Native-endian binary layout, every section 8-byte aligned:
+#   header      magic, byte-order marker, N, n_terms, nnz, k1, b, avgdl
+#   doc_lengths uint32[N]
+#   term_ptr    uint64[n_terms + 1]  offsets into the term blob
+#   post_ptr    uint64[n_terms + 1]  offsets into deltas/tfs
+#   deltas      uint32[nnz]          doc ids, delta-encoded per term
+#   tfs         uint32[nnz]
+#   term blob   sorted utf-8 terms, concatenated
+COMPACT_MAGIC = b"UXBM25\x00\x01"
+_COMPACT_HEADER = struct.Struct("=8sIIIQddd")
+_BYTE_ORDER_MARK = 0x01020304
+
+
+def _pad8(n):
+    return (n + 7) & ~7
+
+
+def write_compact_index(bm25, path):
+    """Serialize a fitted BM25 (postings form) into the compact mmap format"""
+    terms = sorted(bm25.postings)
+    blob = bytearray()
+    term_ptr = array('Q', [0])
+    post_ptr = array('Q', [0])
+    deltas = array('I')
+    tfs = array('I')
+    for term in terms:
+        blob += term.encode('utf-8')
+        term_ptr.append(len(blob))
+        prev = 0
+        for idx, tf in bm25.postings[term]:
+            deltas.append(idx - prev)
+            tfs.append(tf)
+            prev = idx
+        post_ptr.append(len(deltas))
+
+    header = _COMPACT_HEADER.pack(COMPACT_MAGIC, _BYTE_ORDER_MARK, bm25.N, len(terms), len(deltas),
+                                  bm25.k1, bm25.b, float(bm25.avgdl))
+    sections = [header, array('I', bm25.doc_lengths).tobytes(), term_ptr.tobytes(),
+                post_ptr.tobytes(), deltas.tobytes(), tfs.tobytes(), bytes(blob)]
+
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for section in sections:
+                f.write(section)
+                f.write(b"\x00" * (_pad8(len(section)) - len(section)))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class MmapBM25(BM25):
+    """
+    Read-only BM25 over a compact index file opened with mmap.
+
+    Postings stay in the page cache and are decoded per query term, so every
+    process serving the same file shares one copy. Pickles as its file path.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = str(path)
+        self._open()
+
+    def _open(self):
+        with open(self.path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, mark, n_docs, n_terms, nnz, self.k1, self.b, self.avgdl = _COMPACT_HEADER.unpack_from(self._mm, 0)
+        if magic != COMPACT_MAGIC or mark != _BYTE_ORDER_MARK:
+            raise ValueError(f"Not a compact BM25 index for this platform: {self.path}")
+        self.N = n_docs
+        self.n_terms = n_terms
+
+        view = memoryview(self._mm)
+        pos = _pad8(_COMPACT_HEADER.size)
+
+        def take(fmt, count):
+            nonlocal pos
+            size = array(fmt).itemsize * count
+            section = view[pos:pos + size].cast(fmt)
+            pos = _pad8(pos + size)
+            return section
+
+        self.doc_lengths = take('I', n_docs)
+        self._term_ptr = take('Q', n_terms + 1)
+        self._post_ptr = take('Q', n_terms + 1)
+        self._deltas = take('I', nnz)
+        self._tfs = take('I', nnz)
+        self._terms = view[pos:pos + self._term_ptr[n_terms]]
+
+    def __getstate__(self):
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
+
+    def _term_row(self, token):
+        """Binary search the sorted term dictionary; -1 if absent"""
+        key = token.encode('utf-8')
+        lo, hi = 0, self.n_terms
+        ptr, terms = self._term_ptr, self._terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            term = terms[ptr[mid]:ptr[mid + 1]].tobytes()
+            if term < key:
+                lo = mid + 1
+            elif term > key:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def _accumulate(self, query):
+        scores = {}
+        k1_plus_1 = self.k1 + 1
+        k1, b, avgdl = self.k1, self.b, self.avgdl or 1
+        lengths = self.doc_lengths
+        for token in self.tokenize(query):
+            row = self._term_row(token)
+            if row < 0:
+                continue
+            start, end = self._post_ptr[row], self._post_ptr[row + 1]
+            df = end - start
+            idf = log((self.N - df + 0.5) / (df + 0.5) + 1)
+            for idx, tf in zip(accumulate(self._deltas[start:end]), self._tfs[start:end]):
+                norm = k1 * (1 - b + b * lengths[idx] / avgdl)
+                scores[idx] = scores.get(idx, 0) + idf * (tf * k1_plus_1) / (tf + norm)
+        return scores
+
+
+def _fit_bm25(documents):
+    """Fit a BM25 engine over streamed documents, honouring BM25_BACKEND"""
+    bm25 = BM25()
+    bm25.fit(documents)
+    if np is not None and (BM25_BACKEND == "numpy" or (BM25_BACKEND == "auto" and bm25.N >= NUMPY_MIN_DOCS)):
+        return NumpyBM25.from_fitted(bm25)
+    return bm25
+
+
+def _backend_tag():
+    """Inputs to the backend choice; a cached index built under others is rebuilt"""
+    return BM25_BACKEND, np is not None
+
+
+# ============ INDEX CACHE ============
+# Compiled indexes live in CACHE_DIR, one pickle per CSV file and column projection.
+# Each entry keeps the source mtime/size (cheap check) and sha256 (authoritative check),
+# so a touched but unchanged CSV is revalidated without re-parsing. Loaded indexes are
+# also memoized per process, keyed by file and column projection.
+_INDEX_MEMO = {}
+
+
+def _cache_path(filepath, search_cols, output_cols):
+    """Cache file for a CSV projection, e.g. stacks/react.csv -> stacks--react.<cols hash>.idx"""
+    try:
+        rel = filepath.relative_to(DATA_DIR)
+    except ValueError:
+        rel = Path(filepath.name)
+    projection = "\x1f".join(search_cols) + "\x1e" + "\x1f".join(output_cols)
+    cols_hash = hashlib.sha256(projection.encode("utf-8")).hexdigest()[:12]
+    return CACHE_DIR / f"{'--'.join(rel.with_suffix('').parts)}.{cols_hash}.idx"
+
+
+def _file_stamp(filepath):
+    """(mtime_ns, size) of a file, used as the fast validity check"""
+    stat = filepath.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _decode_lines(f, on_line=None):
+    """Text lines of a binary CSV file, newlines normalised like text mode"""
+    for line in f:
+        if on_line:
+            on_line(line)
+        text = line.decode('utf-8')
+        if text.endswith('\r\n'):
+            text = text[:-2] + '\n'
+        yield text
+
+
+def _project(record, columns, col_index):
+    """DictReader-style values of `columns` from a raw record (short rows -> None)"""
+    values = {}
+    for col in columns:
+        i = col_index.get(col)
+        if i is not None:
+            values[col] = record[i] if i < len(record) else None
+    return values
+
+
+class _CsvScan:
+    """
+    Single streaming pass over a CSV.
+
+    documents() yields the search-column text of each row; while it runs the
+    scan records each row's byte offset and the file's sha256, and keeps
+    output-column rows only when keep_rows is set.
+    """
+
+    def __init__(self, filepath, search_cols, output_cols, keep_rows=True):
+        self.filepath = filepath
+        self.search_cols = search_cols
+        self.output_cols = output_cols
+        self.fieldnames = []
+        self.offsets = array('Q')
+        self.rows = [] if keep_rows else None
+        self._hasher = hashlib.sha256()
+        self._pos = 0
+
+    def _consume(self, line):
+        self._hasher.update(line)
+        self._pos += len(line)
+
+    @property
+    def sha256(self):
+        return self._hasher.hexdigest()
+
+    def documents(self):
+        with open(self.filepath, 'rb') as f:
+            reader = csv.reader(_decode_lines(f, self._consume))
+            self.fieldnames = next(reader, [])
+            col_index = {name: i for i, name in enumerate(self.fieldnames)}
+            while True:
+                # csv.reader never reads ahead, so this is where the next record starts
+                offset = self._pos
+                record = next(reader, None)
+                if record is None:
+                    break
+                if not record:
+                    continue  # DictReader skips blank lines
+                self.offsets.append(offset)
+                search_values = _project(record, self.search_cols, col_index)
+                yield " ".join(str(search_values.get(col, "")) for col in self.search_cols)
+                if self.rows is not None:
+                    self.rows.append(_project(record, self.output_cols, col_index))
+
+
+class _LazyRows:
+    """Index-addressable output rows of a large CSV, read on demand by byte offset"""
+
+    def __init__(self, filepath, fieldnames, offsets, output_cols):
+        self.filepath = str(filepath)
+        self.col_index = {name: i for i, name in enumerate(fieldnames)}
+        self.offsets = offsets
+        self.output_cols = output_cols
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, idx):
+        with open(self.filepath, 'rb') as f:
+            f.seek(self.offsets[idx])
+            record = next(csv.reader(_decode_lines(f)), [])
+        return _project(record, self.output_cols, self.col_index)
+
+
+def _file_sha256(filepath):
+    """sha256 of a file, read in chunks"""
+    hasher = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _build_index(filepath, search_cols, output_cols, cache_file=None):
+    """Stream a CSV once and return (rows, fitted BM25, sha256)"""
+    lazy = filepath.stat().st_size >= LAZY_ROWS_MIN_BYTES
+    scan = _CsvScan(filepath, search_cols, output_cols, keep_rows=not lazy)
+    bm25 = _fit_bm25(scan.documents())
+    rows = _LazyRows(filepath, scan.fieldnames, scan.offsets, output_cols) if lazy else scan.rows
+    if BM25_BACKEND == "mmap" and cache_file is not None:
+        bm25 = _publish_compact(bm25, cache_file, scan.sha256)
+    return rows, bm25, scan.sha256
+
+
+def _publish_compact(bm25, cache_file, digest):
+    """Write the compact file for this CSV version and reopen it via mmap"""
+    path = cache_file.with_name(f"{cache_file.stem}.{digest[:16]}.bm25")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_compact_index(bm25, path)
+        compact = MmapBM25(path)
+    except OSError:
+        return bm25  # read-only cache dir: keep the in-memory index
+    for stale in path.parent.glob(f"{cache_file.stem}.*.bm25"):
+        if stale != path:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+    return compact
+
+
+def _read_cache(cache_file):
+    """Load a cache entry in one read, or None if missing/corrupt"""
+    try:
+        with open(cache_file, 'rb') as f:
+            entry = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, ValueError, struct.error):
+        return None
+    if not isinstance(entry, dict) or entry.get("version") != INDEX_FORMAT_VERSION:
+        return None
+    return entry
+
+
+def _write_cache(cache_file, entry):
+    """Atomically persist a cache entry; a read-only data dir just skips caching"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+def _load_index(filepath, search_cols, output_cols):
+    """Return (rows, bm25) for a CSV, using the memo, then disk cache, then a fresh build"""
+    key = (str(filepath), tuple(search_cols), tuple(output_cols))
+    stamp = _file_stamp(filepath)
+
+    memo = _INDEX_MEMO.get(key)
+    if memo and memo[0] == stamp:
+        return memo[1], memo[2]
+
+    cache_file = _cache_path(filepath, search_cols, output_cols)
+    entry = _read_cache(cache_file)
+    if entry and (entry["search_cols"], entry["output_cols"], entry["backend"]) != (key[1], key[2], _backend_tag()):
+        entry = None
+
+    if entry and entry["stamp"] != stamp:
+        # mtime/size moved: fall back to content hash before rebuilding
+        if entry["sha256"] == _file_sha256(filepath):
+            entry["stamp"] = stamp
+            _write_cache(cache_file, entry)
+        else:
+            entry = None
+
+    if entry is None:
+        rows, bm25, digest = _build_index(filepath, search_cols, output_cols, cache_file)
+        entry = {
+            "version": INDEX_FORMAT_VERSION,
+            "stamp": stamp,
+            "sha256": digest,
+            "search_cols": key[1],
+            "output_cols": key[2],
+            "backend": _backend_tag(),
+            "rows": rows,
+            "bm25": bm25,
+        }
+        _write_cache(cache_file, entry)
+
+    _INDEX_MEMO[key] = (stamp, entry["rows"], entry["bm25"])
+    return entry["rows"], entry["bm25"]
 
 
+# ============ SEARCH FUNCTIONS ============
 def _search_csv(filepath, search_cols, output_cols, query, max_results):
-    """Core search function using BM25"""
+    """Core search function using BM25 over a cached, prebuilt index"""
     if not filepath.exists():
         return []
 
-    data = _load_csv(filepath)
-
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+    rows, bm25 = _load_index(filepath, search_cols, output_cols)
+    return _rank(rows, bm25, query, max_results)
+
+
+def _rank(rows, bm25, query, max_results):
+    """Top results with score > 0 as fresh output dicts"""
+    return [dict(rows[idx]) for idx, score in bm25.top_k(query, max_results) if score > 0]
+
+
+def preload_indexes():
+    """Load (or build) the index of every domain and stack into the process memo"""
+    loaded = 0
+    for config in CSV_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _load_index(filepath, config["search_cols"], config["output_cols"])
+            loaded += 1
+    for config in STACK_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _load_index(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"])
+            loaded += 1
+    return loaded
+
+
+DOMAIN_KEYWORDS = {
+    "color": ["color", "palette", "hex", "#", "rgb"],
+    "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
+    "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
+    "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
+    "prompt": ["prompt", "css", "implementation", "variable", "checklist", "tailwind"],
+    "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora"],
+    "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
+    "typography": ["font", "typography", "heading", "serif", "sans"],
+    "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
+    "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
+    "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
+}
 
-    # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
 
-    # Get top results with score > 0
-    results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
-
-    return results
+def detect_domains(queries):
+    """Auto-detect the domain of each query; repeated queries are scored once"""
+    detected = {}
+    domains = []
+    for query in queries:
+        query_lower = query.lower()
+        if query_lower not in detected:
+            scores = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in DOMAIN_KEYWORDS.items()}
+            best = max(scores, key=scores.get)
+            detected[query_lower] = best if scores[best] > 0 else "style"
+        domains.append(detected[query_lower])
+    return domains
 
 
 def detect_domain(query):
     """Auto-detect the most relevant domain from query"""
-    query_lower = query.lower()
-
-    domain_keywords = {
-        "color": ["color", "palette", "hex", "#", "rgb"],
-        "chart": ["chart", "graph", "visualization", "trend", "bar", "pie", "scatter", "heatmap", "funnel"],
-        "landing": ["landing", "page", "cta", "conversion", "hero", "testimonial", "pricing", "section"],
-        "product": ["saas", "ecommerce", "e-commerce", "fintech", "healthcare", "gaming", "portfolio", "crypto", "dashboard"],
-        "prompt": ["prompt", "css", "implementation", "variable", "checklist", "tailwind"],
-        "style": ["style", "design", "ui", "minimalism", "glassmorphism", "neumorphism", "brutalism", "dark mode", "flat", "aurora"],
-        "ux": ["ux", "usability", "accessibility", "wcag", "touch", "scroll", "animation", "keyboard", "navigation", "mobile"],
-        "typography": ["font", "typography", "heading", "serif", "sans"],
-        "icons": ["icon", "icons", "lucide", "heroicons", "symbol", "glyph", "pictogram", "svg icon"],
-        "react": ["react", "next.js", "nextjs", "suspense", "memo", "usecallback", "useeffect", "rerender", "bundle", "waterfall", "barrel", "dynamic import", "rsc", "server component"],
-        "web": ["aria", "focus", "outline", "semantic", "virtualize", "autocomplete", "form", "input type", "preconnect"]
-    }
-
-    scores = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in domain_keywords.items()}
-    best = max(scores, key=scores.get)
-    return best if scores[best] > 0 else "style"
+    return detect_domains([query])[0]
 
 
 def search(query, domain=None, max_results=MAX_RESULTS):
@@ -255,3 +759,59 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "count": len(results),
         "results": results
     }
+
+
+def search_many(queries, domain=None, max_results=MAX_RESULTS):
+    """
+    Run a batch of queries, loading each domain/stack index once.
+
+    Each item is a query string or a dict with "query" and optional "domain",
+    "stack" and "max_results" keys. Items without a domain or stack use
+    `domain`, or are auto-detected together via detect_domains(). Returns one
+    result dict per item, in input order, shaped like search()/search_stack().
+    """
+    items = [q if isinstance(q, dict) else {"query": q} for q in queries]
+
+    undetected = [i for i, item in enumerate(items) if not (item.get("stack") or item.get("domain") or domain)]
+    detected = dict(zip(undetected, detect_domains([items[i].get("query", "") for i in undetected])))
+
+    # Group item positions by the index they need
+    groups = defaultdict(list)
+    for i, item in enumerate(items):
+        if item.get("stack"):
+            groups[("stack", item["stack"])].append(i)
+        else:
+            groups[("domain", item.get("domain") or domain or detected[i])].append(i)
+
+    results = [None] * len(items)
+    for (kind, name), positions in groups.items():
+        if kind == "stack":
+            if name not in STACK_CONFIG:
+                for i in positions:
+                    results[i] = {"error": f"Unknown stack: {name}. Available: {', '.join(AVAILABLE_STACKS)}"}
+                continue
+            file = STACK_CONFIG[name]["file"]
+            search_cols, output_cols = _STACK_COLS["search_cols"], _STACK_COLS["output_cols"]
+            header = {"domain": "stack", "stack": name}
+        else:
+            config = CSV_CONFIG.get(name, CSV_CONFIG["style"])
+            file = config["file"]
+            search_cols, output_cols = config["search_cols"], config["output_cols"]
+            header = {"domain": name}
+
+        filepath = DATA_DIR / file
+        if not filepath.exists():
+            label = "Stack file" if kind == "stack" else "File"
+            for i in positions:
+                results[i] = {"error": f"{label} not found: {filepath}", kind: name}
+            continue
+
+        rows, bm25 = _load_index(filepath, search_cols, output_cols)
+        queries = [items[i].get("query", "") for i in positions]
+        limits = [items[i].get("max_results", max_results) for i in positions]
+        ranked = bm25.top_k_many(queries, max(limits))
+        for i, query, limit, hits in zip(positions, queries, limits, ranked):
+            found = [dict(rows[idx]) for idx, score in hits[:limit] if score > 0]
+            results[i] = {**header, "query": query, "file": file, "count": len(found), "results": found}
+
+    return results
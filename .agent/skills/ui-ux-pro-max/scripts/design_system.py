@@ -27,57 +27,144 @@ SEARCH_CONFIG = {
 }
 
 
-# ============ DESIGN SYSTEM GENERATOR ============
-class DesignSystemGenerator:
-    """Generates design system recommendations from aggregated searches."""
+# ============ REASONING RULE MATCHER ============
+class _AhoCorasick:
+    """Multi-pattern substring automaton keeping the lowest value per tag."""
 
     def __init__(self):
-        self.reasoning_data = self._load_reasoning()
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [{}]
+
+    def add(self, pattern: str, tag: str, value: int) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self.goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[node][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append({})
+            node = nxt
+        if value < self.out[node].get(tag, value + 1):
+            self.out[node][tag] = value
+
+    def build(self) -> None:
+        """Compute failure links (BFS) and fold suffix outputs into each node."""
+        queue = list(self.goto[0].values())
+        for node in queue:
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                for tag, value in self.out[self.fail[nxt]].items():
+                    if value < self.out[nxt].get(tag, value + 1):
+                        self.out[nxt][tag] = value
+
+    def best(self, text: str) -> dict:
+        """Lowest value per tag over every pattern occurring in text (one pass)."""
+        best = {}
+        node = 0
+        goto, fail, out = self.goto, self.fail, self.out
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for tag, value in out[node].items():
+                if value < best.get(tag, value + 1):
+                    best[tag] = value
+        return best
+
+
+class ReasoningMatcher:
+    """
+    Compiled form of the three-stage UI_Category lookup.
 
-    def _load_reasoning(self) -> list:
-        """Load reasoning rules from CSV."""
-        filepath = DATA_DIR / REASONING_FILE
-        if not filepath.exists():
-            return []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
+    1. exact:   hash map of lowercased category -> first rule
+    2. partial: rule category inside the query (automaton), or the query
+                inside a rule category (hash map of every category substring)
+    3. keyword: any word of a rule category inside the query (automaton)
+    Each stage resolves to the first matching rule in file order, as before.
+    """
 
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
-        for domain, config in SEARCH_CONFIG.items():
-            if domain == "style" and style_priority:
-                # For style, also search with priority keywords
-                priority_query = " ".join(style_priority[:2]) if style_priority else query
-                combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
-            else:
-                results[domain] = search(query, domain, config["max_results"])
-        return results
+    def __init__(self, rules: list):
+        self.rules = rules
+        self.exact = {}
+        self.contained_in = {}
+        self.automaton = _AhoCorasick()
 
-    def _find_reasoning_rule(self, category: str) -> dict:
-        """Find matching reasoning rule for a category."""
+        for idx, rule in enumerate(rules):
+            ui_cat = rule.get("UI_Category", "").lower()
+            self.exact.setdefault(ui_cat, idx)
+            for start in range(len(ui_cat) + 1):
+                for end in range(start, len(ui_cat) + 1):
+                    self.contained_in.setdefault(ui_cat[start:end], idx)
+            if ui_cat:
+                self.automaton.add(ui_cat, "partial", idx)
+            for kw in ui_cat.replace("/", " ").replace("-", " ").split():
+                self.automaton.add(kw, "keyword", idx)
+        self.automaton.build()
+        # An empty category is a substring of every query
+        self.empty_rule = self.exact.get("")
+
+    def find(self, category: str) -> dict:
         category_lower = category.lower()
 
-        # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
+        idx = self.exact.get(category_lower)
+        if idx is not None:
+            return self.rules[idx]
 
-        # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
+        hits = self.automaton.best(category_lower)
+        partial = [i for i in (hits.get("partial"), self.contained_in.get(category_lower), self.empty_rule) if i is not None]
+        if partial:
+            return self.rules[min(partial)]
+
+        idx = hits.get("keyword")
+        return self.rules[idx] if idx is not None else {}
 
-        # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
 
-        return {}
+# Module-level cache: {filepath: ((mtime_ns, size), rules, matcher)}
+_REASONING_CACHE = {}
+
+
+def _load_reasoning_matcher(filepath: Path) -> ReasoningMatcher:
+    """Read and compile the reasoning CSV once per process (until it changes)."""
+    if not filepath.exists():
+        return ReasoningMatcher([])
+    stat = filepath.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _REASONING_CACHE.get(str(filepath))
+    if cached and cached[0] == stamp:
+        return cached[1]
+    with open(filepath, 'r', encoding='utf-8') as f:
+        matcher = ReasoningMatcher(list(csv.DictReader(f)))
+    _REASONING_CACHE[str(filepath)] = (stamp, matcher)
+    return matcher
+
+
+# ============ DESIGN SYSTEM GENERATOR ============
+class DesignSystemGenerator:
+    """Generates design system recommendations from aggregated searches."""
+
+    def __init__(self):
+        self._matcher = _load_reasoning_matcher(DATA_DIR / REASONING_FILE)
+        self.reasoning_data = self._matcher.rules
+
+    def _style_query(self, query: str, style_priority: list = None) -> str:
+        """Style query, boosted with the top reasoning style priorities."""
+        if not style_priority:
+            return query
+        priority_query = " ".join(style_priority[:2])
+        return f"{query} {priority_query}"
+
+    def _find_reasoning_rule(self, category: str) -> dict:
+        """Find matching reasoning rule for a category."""
+        if self._matcher.rules is not self.reasoning_data:
+            self._matcher = ReasoningMatcher(self.reasoning_data)
+        return self._matcher.find(category)
 
     def _apply_reasoning(self, category: str, search_results: dict) -> dict:
         """Apply reasoning rules to search results."""
@@ -156,8 +243,8 @@ class DesignSystemGenerator:
 
     def generate(self, query: str, project_name: str = None) -> dict:
         """Generate complete design system recommendation."""
-        # Step 1: First search product to get category
-        product_result = search(query, "product", 1)
+        # Step 1: Search product to get category
+        product_result = search(query, "product", SEARCH_CONFIG["product"]["max_results"])
         product_results = product_result.get("results", [])
         category = "General"
         if product_results:
@@ -167,9 +254,14 @@ class DesignSystemGenerator:
         reasoning = self._apply_reasoning(category, {})
         style_priority = reasoning.get("style_priority", [])
 
-        # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
-        search_results["product"] = product_result  # Reuse product search
+        # Step 3: Remaining domains (style with priority hints), reusing the product search.
+        # Serial on purpose: each search is an index unpickle plus BM25 scoring, all under
+        # the GIL, and a thread pool measured slower than this loop (see benchmark.py).
+        search_results = {"product": product_result}
+        for domain, config in SEARCH_CONFIG.items():
+            if domain != "product":
+                domain_query = self._style_query(query, style_priority) if domain == "style" else query
+                search_results[domain] = search(domain_query, domain, config["max_results"])
 
         # Step 4: Select best matches from each domain using priority
         style_results = self._extract_results(search_results.get("style", {}))
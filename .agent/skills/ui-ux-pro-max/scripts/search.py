@@ -4,14 +4,20 @@
 UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
        python search.py "<query>" --design-system [-p "Project Name"]
+       python search.py --batch queries.jsonl [--domain <domain>] [-n 3]
+       python search.py --serve [--stdio] [--socket PATH]
+
+Queries are answered by a running --serve daemon when one is listening,
+otherwise in-process.
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
 Stacks: html-tailwind, react, nextjs
 """
 
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system
+import json
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS
+from server import handle_request, query_daemon, serve_socket, serve_stdio
 
 
 def format_output(result):
@@ -40,9 +46,38 @@ def format_output(result):
     return "\n".join(output)
 
 
+def load_batch(path):
+    """Read a JSON-lines batch file; each line is a query string or a request object"""
+    queries = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                queries.append(json.loads(line))
+    return queries
+
+
+class SearchError(Exception):
+    """A request the daemon or the in-process search answered with ok: false"""
+
+
+def run_request(request, use_daemon=True, socket_path=None):
+    """
+    Answer a request through the daemon if reachable, else in-process. An
+    error response (from either) raises SearchError; a request the daemon
+    rejected is not re-run in-process.
+    """
+    response = query_daemon(request, socket_path) if use_daemon else None
+    if response is None:
+        response = handle_request(request)
+    if not response.get("ok"):
+        raise SearchError(response.get("error") or "request failed")
+    return response["result"]
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
@@ -51,26 +86,61 @@ if __name__ == "__main__":
     parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
     parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
     parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format for design system")
+    # Daemon mode
+    parser.add_argument("--serve", action="store_true", help="Run as a long-lived search daemon with all indexes resident")
+    parser.add_argument("--stdio", action="store_true", help="With --serve: answer JSON-lines on stdin/stdout instead of a socket")
+    parser.add_argument("--socket", type=str, default=None, help="Daemon Unix socket path (default: $UIPRO_SEARCH_SOCKET or temp dir)")
+    parser.add_argument("--no-daemon", action="store_true", help="Always search in-process, never contact a daemon")
+    # Batch mode
+    parser.add_argument("--batch", type=str, default=None, metavar="FILE.jsonl", help="Run every query in a JSON-lines file, print one JSON result per line")
 
     args = parser.parse_args()
 
+    if args.serve:
+        if args.stdio:
+            serve_stdio()
+        else:
+            serve_socket(args.socket)
+        raise SystemExit(0)
+
+    use_daemon = not args.no_daemon
+
+    if args.batch:
+        request = {"op": "batch", "queries": load_batch(args.batch), "domain": args.domain, "max_results": args.max_results}
+        try:
+            results = run_request(request, use_daemon, args.socket)
+            if not isinstance(results, list):
+                raise SearchError(f"batch returned {type(results).__name__}, expected a list of results")
+        except SearchError as e:
+            print(json.dumps({"error": str(e)}, ensure_ascii=False))
+            raise SystemExit(1)
+        for result in results:
+            print(json.dumps(result, ensure_ascii=False))
+        raise SystemExit(0)
+
+    if not args.query:
+        parser.error("the following arguments are required: query")
+
     # Design system takes priority
     if args.design_system:
-        result = generate_design_system(args.query, args.project_name, args.format)
-        print(result)
+        request = {"op": "design_system", "query": args.query, "project_name": args.project_name, "format": args.format}
     # Stack search
     elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
-        if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            print(format_output(result))
+        request = {"op": "stack", "query": args.query, "stack": args.stack, "max_results": args.max_results}
     # Domain search
     else:
-        result = search(args.query, args.domain, args.max_results)
-        if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            print(format_output(result))
+        request = {"op": "search", "query": args.query, "domain": args.domain, "max_results": args.max_results}
+
+    try:
+        result = run_request(request, use_daemon, args.socket)
+    except SearchError as e:
+        result = {"error": str(e)}
+        print(json.dumps(result, ensure_ascii=False) if args.json else format_output(result))
+        raise SystemExit(1)
+
+    if args.design_system:
+        print(result)
+    elif args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        print(format_output(result))
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Daemon - keeps every domain index resident and answers
+JSON-lines queries over a Unix socket (or stdin/stdout).
+
+Usage:
+    python search.py --serve                 # Unix socket daemon
+    python search.py --serve --stdio         # JSON-lines on stdin/stdout
+
+Protocol (one JSON object per line):
+    {"op": "search", "query": "...", "domain": "style", "max_results": 3}
+    {"op": "stack", "query": "...", "stack": "react", "max_results": 3}
+    {"op": "design_system", "query": "...", "project_name": null, "format": "ascii"}
+    {"op": "batch", "queries": ["...", {"query": "...", "stack": "react"}], "domain": null}
+    {"op": "ping"}
+Responses: {"ok": true, "result": ...} or {"ok": false, "error": "..."}
+
+Every request carries the client's fingerprint (data directory, code and
+data files); a daemon built from anything else refuses it, and the client
+falls back to in-process search.
+"""
+
+import hashlib
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from core import DATA_DIR, INDEX_FORMAT_VERSION, MAX_RESULTS, preload_indexes, search, search_many, search_stack
+
+
+# ============ CONFIGURATION ============
+SOCKET_ENV = "UIPRO_SEARCH_SOCKET"
+CONNECT_TIMEOUT = 0.2
+REQUEST_TIMEOUT = 30
+
+
+@lru_cache(maxsize=1)
+def fingerprint():
+    """
+    Hash of DATA_DIR, the search code and the (mtime, size) of every data
+    file. Client and daemon must agree on it, so a daemon started from
+    another checkout, data directory or version is never used.
+    """
+    digest = hashlib.sha256(f"{DATA_DIR.resolve()}:{INDEX_FORMAT_VERSION}".encode("utf-8"))
+    for source in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(source.name.encode("utf-8"))
+        digest.update(source.read_bytes())
+    for data_file in sorted(DATA_DIR.rglob("*")):
+        if data_file.is_file():
+            stat = data_file.stat()
+            digest.update(f"{data_file.relative_to(DATA_DIR)}:{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def default_socket_path():
+    """Socket path from $UIPRO_SEARCH_SOCKET, else a per-user, per-fingerprint file in the temp dir"""
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    uid = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    return os.path.join(tempfile.gettempdir(), f"uipro-search-{uid}-{fingerprint()}.sock")
+
+
+# ============ REQUEST HANDLING ============
+def handle_request(request):
+    """Dispatch one decoded request to the in-process search functions"""
+    op = request.get("op", "search")
+    query = request.get("query", "")
+    max_results = request.get("max_results", MAX_RESULTS)
+
+    if op == "ping":
+        return {"ok": True, "result": "pong"}
+    if op == "search":
+        return {"ok": True, "result": search(query, request.get("domain"), max_results)}
+    if op == "stack":
+        return {"ok": True, "result": search_stack(query, request.get("stack"), max_results)}
+    if op == "batch":
+        return {"ok": True, "result": search_many(request.get("queries", []), request.get("domain"), max_results)}
+    if op == "design_system":
+        from design_system import generate_design_system
+        result = generate_design_system(query, request.get("project_name"), request.get("format", "ascii"))
+        return {"ok": True, "result": result}
+    return {"ok": False, "error": f"Unknown op: {op}"}
+
+
+def _handle_line(line, expected=None):
+    """Decode, dispatch and encode one JSON-lines request; expected is the daemon's fingerprint"""
+    try:
+        request = json.loads(line)
+        if expected and request.get("fingerprint", expected) != expected:
+            response = {"ok": False, "error": "fingerprint mismatch", "fingerprint": expected}
+        else:
+            response = handle_request(request)
+    except Exception as e:  # keep the daemon alive on bad input
+        response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+    return json.dumps(response, ensure_ascii=False) + "\n"
+
+
+class _LineHandler(socketserver.StreamRequestHandler):
+    """Serve JSON-lines requests until the client closes the connection"""
+
+    def handle(self):
+        for raw in self.rfile:
+            line = raw.decode("utf-8").strip()
+            if not line:
+                continue
+            self.wfile.write(_handle_line(line, self.server.fingerprint).encode("utf-8"))
+            self.wfile.flush()
+
+
+# ============ SERVER ============
+def _socket_in_use(path):
+    """True if a live daemon is already accepting on path"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(path)
+        return True
+    except OSError:
+        return False
+
+
+def serve_socket(path=None):
+    """Preload all indexes and serve requests on a Unix socket until interrupted"""
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("Unix sockets are not available on this platform; use --stdio")
+
+    path = path or default_socket_path()
+    if os.path.exists(path):
+        if _socket_in_use(path):
+            raise RuntimeError(f"A search daemon is already listening on {path}")
+        os.unlink(path)  # stale socket from a crashed daemon
+
+    loaded = preload_indexes()
+    server = socketserver.ThreadingUnixStreamServer(path, _LineHandler)
+    server.daemon_threads = True
+    server.fingerprint = fingerprint()
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # unlink the socket on kill too
+    print(f"UI Pro Max search daemon: {loaded} indexes loaded, listening on {path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def serve_stdio(stdin=None, stdout=None):
+    """Preload all indexes and answer JSON-lines requests from stdin until EOF"""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    preload_indexes()
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+        stdout.write(_handle_line(line))
+        stdout.flush()
+
+
+# ============ CLIENT ============
+def query_daemon(request, path=None):
+    """
+    Send one request to a running daemon.
+
+    Returns the decoded response dict, or None when no daemon is reachable
+    or the one listening was built from other code or data, so callers can
+    fall back to in-process search.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = path or default_socket_path()
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(path)
+            sock.settimeout(REQUEST_TIMEOUT)
+            request = dict(request, fingerprint=fingerprint())
+            sock.sendall((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+
+    if not line:
+        return None
+    try:
+        response = json.loads(line.decode("utf-8"))
+    except ValueError:
+        return None
+    if response.get("fingerprint", fingerprint()) != fingerprint():
+        return None  # a daemon for other code or data
+    return response
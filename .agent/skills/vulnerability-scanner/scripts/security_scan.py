@@ -4,7 +4,9 @@ Skill: vulnerability-scanner
 Script: security_scan.py
 Purpose: Validate that security principles from SKILL.md are applied correctly
 Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config]
-Output: JSON with validation findings
+       [--jobs N] [--since GIT_REV] [--cache FILE | --no-cache]
+       [--large-files scan|sample|skip] [--large-file-mb N] [--history [REVS]] [--profile]
+Output: JSON with validation findings, or streamed JSON-lines / SARIF (--output jsonl|sarif)
 
 This script verifies:
 1. Dependencies - Supply chain security (OWASP A03)
@@ -18,6 +20,19 @@ import os
 import sys
 import re
 import argparse
+import asyncio
+import hashlib
+import io
+import math
+import multiprocessing
+import threading
+import time
+from collections import Counter
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
@@ -58,6 +73,21 @@ SECRET_PATTERNS = [
     (r'eyJ[A-Za-z0-9-_]+\.eyJ[A-Za-z0-9-_]+\.[A-Za-z0-9-_]+', "JWT Token", "high"),
 ]
 
+# Vendor-specific keys the patterns above miss: a character-class tokenizer
+# yields base64/hex runs, cheap character tests drop words and identifiers,
+# and only the survivors get a Shannon entropy check
+ENTROPY_SECRET = ("High Entropy String", "medium")
+ENTROPY_TOKEN_PATTERN = r'(?<![A-Za-z0-9+=_-])[A-Za-z0-9+=_-]{20,256}(?![A-Za-z0-9+=_-])'
+ENTROPY_BASE64_MIN = 4.5  # bits per char; needs 23+ distinct chars
+ENTROPY_HEX_MIN = 3.0
+ENTROPY_HEX_MIN_LENGTH = 32
+ENTROPY_SKIP_PREFIXES = ("sha1-", "sha256-", "sha384-", "sha512-")  # subresource integrity
+# Lockfiles are full of integrity hashes and checksums; node_modules/.package-lock.json
+# is npm's hidden copy of package-lock.json
+ENTROPY_SKIP_FILES = {"package-lock.json", ".package-lock.json", "npm-shrinkwrap.json", "pnpm-lock.yaml",
+                      "yarn.lock", "bun.lock", "bun.lockb", "composer.lock", "poetry.lock", "Pipfile.lock",
+                      "Cargo.lock", "go.sum"}
+
 DANGEROUS_PATTERNS = [
     # Injection risks
     (r'eval\s*\(', "eval() usage", "critical", "Code Injection risk"),
@@ -89,15 +119,240 @@ SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'v
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
 
+# Files above STREAM_MIN_BYTES are read in chunks instead of whole; a match is
+# only guaranteed to be found if it is shorter than STREAM_OVERLAP_CHARS
+STREAM_MIN_BYTES = 4 * 1024 * 1024
+STREAM_CHUNK_CHARS = 1024 * 1024
+STREAM_OVERLAP_CHARS = 64 * 1024
+SNIFF_BYTES = 8192  # a NUL byte in the head marks a file as binary
+
+# Files above LARGE_FILE_BYTES: "scan" streams all of it, "sample" only the
+# first LARGE_FILE_BYTES, "skip" leaves it out
+LARGE_FILE_BYTES = 50 * 1024 * 1024
+LARGE_FILE_POLICIES = ("scan", "sample", "skip")
+
+# Parallel mode (--jobs): smaller scans are not worth starting worker processes
+PARALLEL_MIN_FILES = 64
+PARALLEL_MIN_SHARD = 16
+
+CONFIG_PATTERNS = [
+    (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
+    (r'debug\s*=\s*True', "Debug mode enabled", "high"),
+    (r'NODE_ENV.*development', "Development mode in config", "medium"),
+    (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
+    (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
+    (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
+]
+
+
+# ============================================================================
+#  COMPILED RULES
+# ============================================================================
+
+_QUANTIFIER = re.compile(r'\{(\d*)(?:,(\d*))?\}')
+
+
+def _skip_class(pattern: str, i: int) -> int:
+    """Index just past the character class starting at pattern[i] == '['."""
+    j = i + 1
+    if j < len(pattern) and pattern[j] == '^':
+        j += 1
+    if j < len(pattern) and pattern[j] == ']':
+        j += 1
+    while j < len(pattern):
+        if pattern[j] == '\\':
+            j += 2
+        elif pattern[j] == ']':
+            return j + 1
+        else:
+            j += 1
+    return j
+
+
+def _skip_group(pattern: str, i: int) -> int:
+    """Index just past the group starting at pattern[i] == '('."""
+    depth = 0
+    j = i
+    while j < len(pattern):
+        ch = pattern[j]
+        if ch == '\\':
+            j += 2
+            continue
+        if ch == '[':
+            j = _skip_class(pattern, j)
+            continue
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+            if depth == 0:
+                return j + 1
+        j += 1
+    return j
+
+
+def _required_literal(pattern: str) -> str:
+    """
+    Longest run of plain characters that every match of a pattern contains.
+    Returns "" when no such run can be read off the pattern (e.g. a top-level
+    alternation), which makes the rule match every prefilter.
+    """
+    runs = []
+    run = ""
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == '\\' and i + 1 < len(pattern):
+            if pattern[i + 1].isalnum():  # \s, \d, \b, ... are not literals
+                runs.append(run)
+                run = ""
+            else:
+                run += pattern[i + 1]
+            i += 2
+        elif ch == '[':
+            runs.append(run)
+            run = ""
+            i = _skip_class(pattern, i)
+        elif ch == '(':
+            runs.append(run)
+            run = ""
+            i = _skip_group(pattern, i)
+        elif ch == '|':
+            return ""
+        elif ch in '*?+' or (ch == '{' and _QUANTIFIER.match(pattern, i)):
+            # The quantified atom is the last char of the run (if any); it may
+            # be absent (*, ?, {0,n}) and cannot be followed by a fixed char
+            quantifier = _QUANTIFIER.match(pattern, i) if ch == '{' else None
+            optional = ch in '*?' or (quantifier is not None and not quantifier.group(1).strip('0'))
+            runs.append(run[:-1] if optional else run)
+            run = ""
+            i = quantifier.end() if quantifier else i + 1
+        elif ch in '.^$':
+            runs.append(run)
+            run = ""
+            i += 1
+        else:
+            run += ch
+            i += 1
+    runs.append(run)
+    return max(runs, key=len)
+
+
+class RuleSet:
+    """
+    A rule list compiled once for the whole scan.
+
+    Each rule keeps its own precompiled regex plus the literal it cannot match
+    without, so a single substring test per rule and file rules out most of
+    them before any regex runs. The rules left over are joined into one
+    alternation with a named group per rule (r0, r1, ...) so a line is searched
+    once and the match is attributed back to the rule that fired.
+    """
+
+    MAX_ALTERNATIONS = 256
+    profiled = False  # set by ScanProfile: search rule by rule so time is attributable
+
+    def __init__(self, patterns: List[str], flags: int = re.IGNORECASE):
+        self.patterns = list(patterns)
+        self.flags = flags
+        self.regexes = [re.compile(p, flags) for p in self.patterns]
+        self.literals = [self._fold(_required_literal(p)) for p in self.patterns]
+        self._alternations: Dict[tuple, Any] = {}
+
+    def _fold(self, text: str) -> str:
+        return text.casefold() if self.flags & re.IGNORECASE else text
+
+    def candidates(self, text: str) -> List[int]:
+        """Indices, in rule order, of the rules whose literal occurs in text."""
+        haystack = self._fold(text)
+        return [i for i, literal in enumerate(self.literals) if literal in haystack]
+
+    def alternation(self, indices: List[int]):
+        """One compiled regex that matches wherever any of the given rules does."""
+        key = tuple(indices)
+        combined = self._alternations.get(key)
+        if combined is None:
+            if len(self._alternations) >= self.MAX_ALTERNATIONS:
+                self._alternations.clear()
+            combined = re.compile("|".join(f"(?P<r{i}>{self.patterns[i]})" for i in key), self.flags)
+            self._alternations[key] = combined
+        return combined
+
+    @staticmethod
+    def rule_of(match) -> int:
+        """Index of the rule whose named group produced match."""
+        return int(match.lastgroup[1:])
+
+    def matching(self, line: str, indices: List[int], alternation=None) -> List[int]:
+        """Indices, in rule order, of the given rules that match line."""
+        if self.profiled:
+            return [i for i in indices if self.regexes[i].search(line)]
+        alternation = alternation or self.alternation(indices)
+        hit = alternation.search(line)
+        if hit is None:
+            return []
+        fired = self.rule_of(hit)
+        return [i for i in indices if i == fired or self.regexes[i].search(line)]
+
+
+SECRET_RULES = RuleSet([pattern for pattern, _, _ in SECRET_PATTERNS])
+ENTROPY_RULES = RuleSet([ENTROPY_TOKEN_PATTERN], flags=0)
+DANGEROUS_RULES = RuleSet([pattern for pattern, _, _, _ in DANGEROUS_PATTERNS])
+CONFIG_RULES = RuleSet([pattern for pattern, _, _ in CONFIG_PATTERNS])
+
+
+_HAS_DIGIT = re.compile(r'[0-9]').search
+_HAS_LETTER = re.compile(r'[A-Za-z]').search
+_HAS_UPPER = re.compile(r'[A-Z]').search
+_HAS_LOWER = re.compile(r'[a-z]').search
+_IS_HEX = re.compile(r'[0-9a-fA-F]+').fullmatch
+
+
+def shannon_entropy(text: str) -> float:
+    """Bits per character of text."""
+    length = len(text)
+    return -sum(n / length * math.log2(n / length) for n in Counter(text).values())
+
+
+def is_high_entropy_token(token: str) -> bool:
+    """
+    Whether a tokenizer run looks like a key. The character tests reject
+    most runs (identifiers, words, numbers, integrity hashes) before the
+    entropy is computed: hex needs ENTROPY_HEX_MIN_LENGTH, anything else
+    mixed case.
+    """
+    if not (_HAS_DIGIT(token) and _HAS_LETTER(token)):
+        return False
+    if token.startswith(ENTROPY_SKIP_PREFIXES):
+        return False
+    if _IS_HEX(token):
+        return len(token) >= ENTROPY_HEX_MIN_LENGTH and shannon_entropy(token) >= ENTROPY_HEX_MIN
+    if not (_HAS_UPPER(token) and _HAS_LOWER(token)):
+        return False
+    return shannon_entropy(token) >= ENTROPY_BASE64_MIN
+
+
+def _entropy_match(match) -> bool:
+    return is_high_entropy_token(match.group())
+
+
+def count_entropy_tokens(text: str) -> int:
+    """Number of high-entropy tokens in text."""
+    return sum(1 for match in ENTROPY_RULES.regexes[0].finditer(text) if _entropy_match(match))
+
 
 # ============================================================================
 #  SCANNING FUNCTIONS
 # ============================================================================
 
-def scan_dependencies(project_path: str) -> Dict[str, Any]:
+def scan_dependencies(project_path: str, package_roots: List[str] = None,
+                      audits: Dict[str, Any] = None, cache: "AuditCache" = None) -> Dict[str, Any]:
     """
     Validate supply chain security (OWASP A03).
     Checks: npm audit, lock file presence, dependency age.
+    package_roots are nested directories with a package.json (found by walking
+    project_path when omitted); audits are npm audit results already collected
+    by a DependencyAudit that ran alongside the file scan.
     """
     results = {"tool": "dependency_scanner", "findings": [], "status": "[OK] Secure"}
     
@@ -128,49 +383,54 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
                     "message": f"{manager}: No lock file found. Supply chain integrity at risk."
                 })
     
-    # Run npm audit if applicable
-    if (Path(project_path) / "package.json").exists():
-        try:
-            result = subprocess.run(
-                ["npm", "audit", "--json"],
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            try:
-                audit_data = json.loads(result.stdout)
-                vulnerabilities = audit_data.get("vulnerabilities", {})
-                
-                severity_count = {"critical": 0, "high": 0, "moderate": 0, "low": 0}
-                for vuln in vulnerabilities.values():
-                    sev = vuln.get("severity", "low").lower()
-                    if sev in severity_count:
-                        severity_count[sev] += 1
-                
-                if severity_count["critical"] > 0:
-                    results["status"] = "[!!] Critical vulnerabilities"
-                    results["findings"].append({
-                        "type": "npm audit",
-                        "severity": "critical",
-                        "message": f"{severity_count['critical']} critical vulnerabilities in dependencies"
-                    })
-                elif severity_count["high"] > 0:
-                    results["status"] = "[!] High vulnerabilities"
-                    results["findings"].append({
-                        "type": "npm audit",
-                        "severity": "high",
-                        "message": f"{severity_count['high']} high severity vulnerabilities"
-                    })
-                
-                results["npm_audit"] = severity_count
-                
-            except json.JSONDecodeError:
-                pass
-                
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+    # Nested packages (workspaces) are covered by a lock file next to them or
+    # in any parent directory up to the project root
+    if package_roots is None:
+        package_roots = find_package_roots(project_path)
+    for root in package_roots:
+        if not _has_js_lock(project_path, root):
+            results["findings"].append({
+                "type": "Missing Lock File",
+                "severity": "high",
+                "message": f"{_root_label(project_path, root)}: package.json without a lock file. "
+                           "Supply chain integrity at risk."
+            })
+    
+    # npm audit per package root
+    if audits is None:
+        audits = audit_packages(audit_targets(project_path, package_roots), cache)
+    
+    totals = {"critical": 0, "high": 0, "moderate": 0, "low": 0}
+    per_root = {}
+    for root, severity_count in audits.items():
+        if severity_count is None:
+            continue  # npm missing, timed out or returned no JSON
+        label = _root_label(project_path, root)
+        prefix = "" if label == "." else f"{label}: "
+        per_root[label] = severity_count
+        for sev in totals:
+            totals[sev] += severity_count.get(sev, 0)
+        
+        if severity_count["critical"] > 0:
+            results["status"] = "[!!] Critical vulnerabilities"
+            results["findings"].append({
+                "type": "npm audit",
+                "severity": "critical",
+                "message": f"{prefix}{severity_count['critical']} critical vulnerabilities in dependencies"
+            })
+        elif severity_count["high"] > 0:
+            if results["status"] != "[!!] Critical vulnerabilities":
+                results["status"] = "[!] High vulnerabilities"
+            results["findings"].append({
+                "type": "npm audit",
+                "severity": "high",
+                "message": f"{prefix}{severity_count['high']} high severity vulnerabilities"
+            })
+    
+    if per_root:
+        results["npm_audit"] = totals
+    if len(per_root) > 1 or (per_root and "." not in per_root):
+        results["package_roots"] = per_root
     
     if not results["findings"]:
         results["status"] = "[OK] Supply chain checks passed"
@@ -178,199 +438,1567 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
+# ============================================================================
+#  FINDINGS CACHE
+# ============================================================================
+
+CACHE_FORMAT_VERSION = 1
+
+
+def _rules_version() -> str:
+    """Fingerprint of every rule table; a rule change invalidates cached findings."""
+    rules = repr((CACHE_FORMAT_VERSION, SECRET_PATTERNS, DANGEROUS_PATTERNS, CONFIG_PATTERNS,
+                  ENTROPY_TOKEN_PATTERN, ENTROPY_BASE64_MIN, ENTROPY_HEX_MIN, ENTROPY_HEX_MIN_LENGTH,
+                  ENTROPY_SKIP_PREFIXES, sorted(ENTROPY_SKIP_FILES)))
+    return hashlib.sha256(rules.encode('utf-8')).hexdigest()[:16]
+
+
+def cache_dir() -> Path:
+    """$XDG_CACHE_HOME/vulnerability-scanner (or ~/.cache/...)."""
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(root) / "vulnerability-scanner"
+
+
+def default_cache_path(project_path: str) -> Path:
+    """Per-project findings cache file inside cache_dir()."""
+    project_id = hashlib.sha1(os.path.abspath(project_path).encode('utf-8')).hexdigest()[:16]
+    return cache_dir() / f"{project_id}.json"
+
+
+class FindingsCache:
     """
-    Validate no hardcoded secrets (OWASP A04).
-    Checks: API keys, tokens, passwords, cloud credentials.
+    Finding records per file and scanner, keyed by relative path and the
+    SHA-256 of the file's bytes, persisted as JSON between runs.
     """
-    results = {
-        "tool": "secret_scanner",
-        "findings": [],
-        "status": "[OK] No secrets detected",
-        "scanned_files": 0,
-        "by_severity": {"critical": 0, "high": 0, "medium": 0}
-    }
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.version = _rules_version()
+        self.files: Dict[str, Any] = {}
+        self.seen = set()
+        self.hits = 0
+        self.misses = 0
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get("version") == self.version:
+                self.files = data.get("files", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def lookup(self, relpath: str):
+        return self.files.get(relpath)
+
+    def store(self, relpath: str, digest: str, records: Dict[str, Any], hit: bool = False) -> None:
+        """Record one scanned file; records from other scanners survive an unchanged hash."""
+        self.seen.add(relpath)
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        entry = self.files.get(relpath)
+        if entry is None or entry.get("sha256") != digest:
+            entry = self.files[relpath] = {"sha256": digest, "scanners": {}}
+        entry["scanners"].update(records)
+
+    def save(self, prune: bool = False) -> None:
+        """Write the cache atomically; prune drops files this run did not see."""
+        if prune:
+            self.files = {relpath: entry for relpath, entry in self.files.items() if relpath in self.seen}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": self.version, "files": self.files}), encoding='utf-8')
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # caching is best effort
+
+    def stats(self) -> Dict[str, Any]:
+        return {"path": str(self.path), "hits": self.hits, "scanned": self.misses}
+
+
+def changed_files(project_path: str, rev: str) -> set:
+    """
+    '/'-separated paths under project_path that differ from git revision rev:
+    committed and uncommitted changes plus untracked (non-ignored) files.
+    """
+    commands = [
+        ["git", "diff", "--name-only", "--relative", "-z", rev, "--"],
+        ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+    ]
+    paths = set()
+    for command in commands:
+        try:
+            result = subprocess.run(command, cwd=project_path, capture_output=True, text=True, timeout=60)
+        except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+            raise RuntimeError(f"git unavailable: {e}")
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"{' '.join(command)} failed")
+        paths.update(p for p in result.stdout.split('\0') if p)
+    return paths
+
+
+# ============================================================================
+#  DEPENDENCY AUDIT
+# ============================================================================
+
+NPM_LOCK_FILES = ("package-lock.json", "npm-shrinkwrap.json")
+JS_LOCK_FILES = NPM_LOCK_FILES + ("yarn.lock", "pnpm-lock.yaml")
+AUDIT_TIMEOUT = 60
+AUDIT_CONCURRENCY = 4
+AUDIT_CACHE_TTL = 6 * 3600  # advisories change; re-audit an unchanged lock file after this
+
+
+def find_package_roots(project_path: str, paths: List[str] = None) -> List[str]:
+    """Directories below project_path (not itself) that hold a package.json."""
+    if paths is None:
+        paths = iter_project_files(project_path)
+    top = os.path.normpath(project_path)
+    return [
+        os.path.dirname(path) for path in paths
+        if os.path.basename(path) == "package.json" and os.path.normpath(os.path.dirname(path)) != top
+    ]
+
+
+def _root_label(project_path: str, root: str) -> str:
+    return Path(os.path.relpath(root, project_path)).as_posix()
+
+
+def _has_js_lock(project_path: str, root: str) -> bool:
+    """True if root or one of its parents up to project_path has a JS lock file."""
+    top = Path(os.path.abspath(project_path))
+    current = Path(os.path.abspath(root))
+    while True:
+        if any((current / name).exists() for name in JS_LOCK_FILES):
+            return True
+        if current == top or current.parent == current:
+            return False
+        current = current.parent
+
+
+def audit_targets(project_path: str, package_roots: List[str]) -> List[str]:
+    """
+    Roots to run npm audit in: the project root when it has a package.json,
+    plus nested roots with their own npm lock file (workspace members share
+    the root lock and are covered by its audit).
+    """
+    targets = []
+    if (Path(project_path) / "package.json").exists():
+        targets.append(project_path)
+    for root in package_roots:
+        if any((Path(root) / name).exists() for name in NPM_LOCK_FILES):
+            targets.append(root)
+    return targets
+
+
+def _lock_digest(root: str):
+    for name in NPM_LOCK_FILES:
+        try:
+            with open(Path(root) / name, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            continue
+    return None
+
+
+class AuditCache:
+    """npm audit severity counts keyed by lock file hash, expiring after AUDIT_CACHE_TTL."""
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else cache_dir() / "npm-audit.json"
+        try:
+            self.entries = json.loads(self.path.read_text(encoding='utf-8'))
+            if not isinstance(self.entries, dict):
+                self.entries = {}
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, digest: str):
+        entry = self.entries.get(digest)
+        if entry and datetime.now().timestamp() - entry.get("time", 0) < AUDIT_CACHE_TTL:
+            return entry["counts"]
+        return None
+
+    def put(self, digest: str, counts: Dict[str, int]) -> None:
+        self.entries[digest] = {"time": datetime.now().timestamp(), "counts": counts}
+
+    def save(self) -> None:
+        now = datetime.now().timestamp()
+        self.entries = {k: v for k, v in self.entries.items() if now - v.get("time", 0) < AUDIT_CACHE_TTL}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self.entries), encoding='utf-8')
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+async def _npm_audit(root: str, limit: "asyncio.Semaphore"):
+    """Severity counts from `npm audit --json` in root, or None if unavailable."""
+    async with limit:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "npm", "audit", "--json", cwd=root,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+            )
+        except (FileNotFoundError, PermissionError):
+            return None
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), AUDIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return None
+
+    try:
+        audit_data = json.loads(stdout.decode('utf-8', errors='replace'))
+    except ValueError:
+        return None
+    if not isinstance(audit_data, dict):
+        return None
     
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
+    severity_count = {"critical": 0, "high": 0, "moderate": 0, "low": 0}
+    for vuln in audit_data.get("vulnerabilities", {}).values():
+        sev = vuln.get("severity", "low").lower()
+        if sev in severity_count:
+            severity_count[sev] += 1
+    return severity_count
+
+
+async def _audit_all(roots: List[str]) -> List[Any]:
+    limit = asyncio.Semaphore(AUDIT_CONCURRENCY)
+    return await asyncio.gather(*(_npm_audit(root, limit) for root in roots))
+
+
+def audit_packages(roots: List[str], cache: AuditCache = None) -> Dict[str, Any]:
+    """
+    npm audit every root concurrently (AUDIT_CONCURRENCY at a time). Roots
+    whose lock file hash has a fresh cache entry are not re-audited.
+    Returns {root: severity counts or None} in the order of roots.
+    """
+    audits = {root: None for root in roots}
+    digests = {root: _lock_digest(root) for root in roots}
+    pending = []
+    for root in roots:
+        cached = cache.get(digests[root]) if cache and digests[root] else None
+        if cached is not None:
+            audits[root] = cached
+        else:
+            pending.append(root)
+
+    if pending:
+        for root, counts in zip(pending, asyncio.run(_audit_all(pending))):
+            audits[root] = counts
+            if cache and counts is not None and digests[root]:
+                cache.put(digests[root], counts)
+        if cache:
+            cache.save()
+    return audits
+
+
+class DependencyAudit:
+    """
+    audit_packages() on a background thread, started before the file scan so
+    the total wall time is max(audit, scan) rather than their sum.
+    """
+
+    def __init__(self, roots: List[str], cache: AuditCache = None):
+        self.roots = roots
+        self.cache = cache
+        self.audits: Dict[str, Any] = {}
+        self._thread = threading.Thread(target=self._run, name="npm-audit", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            self.audits = audit_packages(self.roots, self.cache)
+        except Exception:
+            self.audits = {root: None for root in self.roots}
+
+    def result(self) -> Dict[str, Any]:
+        self._thread.join()
+        return self.audits
+
+
+# ============================================================================
+#  PROFILING
+# ============================================================================
+
+PROFILE_TOP = 10
+
+
+class _TimedRegex:
+    """Compiled-regex proxy that adds its matching time to a [seconds, calls] entry."""
+
+    def __init__(self, regex, entry: list):
+        self.regex = regex
+        self.entry = entry
+
+    def search(self, *args):
+        start = time.perf_counter()
+        try:
+            return self.regex.search(*args)
+        finally:
+            self.entry[0] += time.perf_counter() - start
+            self.entry[1] += 1
+
+    def findall(self, *args):
+        start = time.perf_counter()
+        try:
+            return self.regex.findall(*args)
+        finally:
+            self.entry[0] += time.perf_counter() - start
+            self.entry[1] += 1
+
+    def finditer(self, *args):
+        self.entry[1] += 1
+        matches = self.regex.finditer(*args)
+        while True:
+            start = time.perf_counter()
+            match = next(matches, None)
+            self.entry[0] += time.perf_counter() - start
+            if match is None:
+                return
+            yield match
+
+
+def _rule_labels(scan_name: str, names: List[str]) -> List[str]:
+    """'scan: rule name' per rule; repeated names get their rule index."""
+    labels = []
+    for i, name in enumerate(names):
+        label = f"{scan_name}: {name}"
+        labels.append(f"{label} #{i}" if names.count(name) > 1 else label)
+    return labels
+
+
+class ScanProfile:
+    """
+    Time per rule and per file plus bytes scanned. While entered, every
+    RuleSet's regexes are swapped for timed proxies and lines are matched
+    rule by rule instead of through the combined alternation, so each rule
+    is charged its own time; the literal prefilter is timed per rule set.
+    Entering is re-entrant. Profiled scans run in-process (no --jobs) and
+    the CLI skips the caches, so only work that actually ran is timed.
+    """
+
+    def __init__(self):
+        self.rules: Dict[str, list] = {}
+        self.files: Dict[str, list] = {}
+        self.seconds = 0.0
+        self.depth = 0
+        self.started = 0.0
+        self.saved = []
+
+    def _entry(self, label: str) -> list:
+        return self.rules.setdefault(label, [0.0, 0])
+
+    def _rule_sets(self):
+        return [
+            (SECRET_RULES, _rule_labels("secrets", [name for _, name, _ in SECRET_PATTERNS])),
+            (ENTROPY_RULES, [f"secrets: {ENTROPY_SECRET[0]} (tokenizer)"]),
+            (DANGEROUS_RULES, _rule_labels("patterns", [name for _, name, _, _ in DANGEROUS_PATTERNS])),
+            (CONFIG_RULES, _rule_labels("config", [issue for _, issue, _ in CONFIG_PATTERNS])),
+        ]
+
+    def __enter__(self):
+        self.depth += 1
+        if self.depth == 1:
+            for rules, labels in self._rule_sets():
+                self.saved.append((rules, rules.regexes))
+                rules.regexes = [_TimedRegex(regex, self._entry(label)) for regex, label in zip(rules.regexes, labels)]
+                rules.profiled = True
+                rules.candidates = self._timed(rules.candidates, self._entry(f"{labels[0].split(':')[0]}: literal prefilter"))
+            self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.depth -= 1
+        if self.depth == 0:
+            self.seconds += time.perf_counter() - self.started
+            for rules, regexes in self.saved:
+                rules.regexes = regexes
+                rules.profiled = False
+                del rules.candidates  # back to the class method
+            self.saved = []
+
+    @staticmethod
+    def _timed(function, entry: list):
+        def timed(*args):
+            start = time.perf_counter()
+            try:
+                return function(*args)
+            finally:
+                entry[0] += time.perf_counter() - start
+                entry[1] += 1
+        return timed
+
+    def record_file(self, relpath: str, seconds: float, size: int) -> None:
+        entry = self.files.setdefault(relpath, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += size
+
+    def summary(self, top: int = PROFILE_TOP) -> Dict[str, Any]:
+        rules = sorted(self.rules.items(), key=lambda item: -item[1][0])[:top]
+        files = sorted(self.files.items(), key=lambda item: -item[1][0])[:top]
+        return {
+            "seconds": round(self.seconds, 4),
+            "files": len(self.files),
+            "bytes_scanned": sum(size for _, size in self.files.values()),
+            "slowest_rules": [{"rule": label, "seconds": round(sec, 4), "calls": calls}
+                              for label, (sec, calls) in rules],
+            "slowest_files": [{"file": relpath, "seconds": round(sec, 4), "bytes": size}
+                              for relpath, (sec, size) in files],
+        }
+
+    def table(self, top: int = PROFILE_TOP) -> str:
+        summary = self.summary(top)
+        mb = summary["bytes_scanned"] / (1024 * 1024)
+        rate = mb / summary["seconds"] if summary["seconds"] else 0.0
+        lines = [f"Profile: {summary['seconds']:.3f}s, {summary['files']} files, "
+                 f"{mb:.1f} MB scanned ({rate:.1f} MB/s)", ""]
+        lines.append(f"{'Slowest rules':<56} {'seconds':>9} {'calls':>8}")
+        for row in summary["slowest_rules"]:
+            lines.append(f"{row['rule'][:56]:<56} {row['seconds']:>9.4f} {row['calls']:>8}")
+        lines.append("")
+        lines.append(f"{'Slowest files':<56} {'seconds':>9} {'bytes':>10}")
+        for row in summary["slowest_files"]:
+            name = row["file"] if len(row["file"]) <= 56 else "..." + row["file"][-53:]
+            lines.append(f"{name:<56} {row['seconds']:>9.4f} {row['bytes']:>10}")
+        return "\n".join(lines)
+
+
+# ============================================================================
+#  SHARED FILE WALK
+# ============================================================================
+
+CONFIG_FILENAMES = {'next.config.js', 'webpack.config.js', '.eslintrc.js'}
+
+
+def iter_project_files(project_path: str):
+    """
+    Yield the path of every file under project_path, skipping SKIP_DIRS.
+    Same order as os.walk: a directory's files first, then its subdirectories;
+    symlinked directories are not followed and unreadable ones are skipped.
+    """
+    stack = [project_path]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
             try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
-                            
-            except Exception:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                yield entry.path
+            elif entry.name not in SKIP_DIRS and not entry.is_symlink():
+                subdirs.append(entry.path)
+        stack.extend(reversed(subdirs))
+
+
+class FileScanner:
+    """
+    One file-based scan type. The shared walk asks wants() for every file and
+    reads it once; scan() turns the content into finding records without
+    touching scanner state (so it can run in a worker process) and add()
+    merges one file's records into the result dict that finish() completes.
+    """
+
+    key = ""
+    counts_files = True
+    listener = None  # called with every finding as it is merged
+
+    def __init__(self, project_path: str):
+        self.project_path = project_path
+        self.results = self.new_results()
+
+    def new_results(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def wants(self, filename: str, ext: str) -> bool:
+        raise NotImplementedError
+
+    def scan(self, relpath: str, content: str) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def stream(self, relpath: str):
+        """
+        Incremental consumer for files too large to read at once: feed(chunk)
+        per text chunk, close() returns the same records scan() would.
+        """
+        return _BufferedStream(self, relpath)
+
+    def tally(self, finding: Dict[str, Any]) -> None:
+        """Update per-scanner counters for one merged finding."""
+
+    def finish(self) -> Dict[str, Any]:
+        return self.results
+
+    def run(self, relpath: str, content):
+        """Records for one file; None when the file could not be read."""
+        if content is None:
+            return None
+        try:
+            return self.scan(relpath, content)
+        except Exception:
+            return []
+
+    def add(self, records) -> None:
+        """Merge the records run() produced for one file."""
+        if self.counts_files:
+            self.results["scanned_files"] += 1
+        for finding in records or ():
+            self.append(finding)
+
+    def append(self, finding: Dict[str, Any]) -> None:
+        """Record one finding and pass it to the listener (streaming output)."""
+        self.results["findings"].append(finding)
+        self.tally(finding)
+        if self.listener is not None:
+            self.listener(finding)
+
+
+# ============================================================================
+#  STREAMING READER
+# ============================================================================
+
+class _BufferedStream:
+    """Fallback stream for scanners without one: scan the joined text at close."""
+
+    def __init__(self, scanner: FileScanner, relpath: str):
+        self.scanner = scanner
+        self.relpath = relpath
+        self.parts = []
+
+    def feed(self, chunk: str) -> None:
+        self.parts.append(chunk)
+
+    def close(self):
+        return self.scanner.scan(self.relpath, "".join(self.parts))
+
+
+class _RuleWindowStream:
+    """
+    Match counts per rule over consecutive overlapping windows of a stream.
+    A match is credited to the window it starts in, before that window's
+    trailing STREAM_OVERLAP_CHARS, so it is counted once and always matched
+    with its full trailing context; each rule resumes after its last match
+    exactly as findall() would. One character before each window is kept
+    for lookbehinds. With first_only, a rule stops at one match; match_filter
+    decides whether a match counts.
+    """
+
+    def __init__(self, rules: RuleSet, finalize, first_only: bool = False, match_filter=None):
+        self.rules = rules
+        self.finalize = finalize
+        self.first_only = first_only
+        self.match_filter = match_filter
+        self.tail = ""
+        self.lead = 0  # chars at the start of the window owned by the previous one
+        self.offset = 0
+        self.resume = [0] * len(rules.patterns)
+        self.counts = [0] * len(rules.patterns)
+
+    def feed(self, chunk: str, final: bool = False) -> None:
+        text = self.tail + chunk
+        own_end = len(text) if final else max(self.lead, len(text) - STREAM_OVERLAP_CHARS)
+        for i in self.rules.candidates(text):
+            if self.first_only and self.counts[i]:
+                continue
+            for match in self.rules.regexes[i].finditer(text, max(self.lead, self.resume[i] - self.offset)):
+                if match.start() >= own_end:
+                    break
+                self.resume[i] = self.offset + match.end()
+                if self.match_filter is not None and not self.match_filter(match):
+                    continue
+                self.counts[i] += 1
+                if self.first_only:
+                    break
+        keep = max(0, own_end - 1)
+        self.lead = own_end - keep
+        self.offset += keep
+        self.tail = text[keep:]
+
+    def close(self):
+        self.feed("", final=True)
+        return self.finalize(self.counts)
+
+
+class _StreamGroup:
+    """Feeds the same chunks to several streams; close() hands all their results to finalize."""
+
+    def __init__(self, streams: list, finalize):
+        self.streams = streams
+        self.finalize = finalize
+
+    def feed(self, chunk: str) -> None:
+        for stream in self.streams:
+            stream.feed(chunk)
+
+    def close(self):
+        return self.finalize(*[stream.close() for stream in self.streams])
+
+
+def _identity(value):
+    return value
+
+
+class _LineStream:
+    """
+    Per-line rule matching over a stream. Lines longer than a chunk (minified
+    bundles) are matched in overlapping segments and reported once per rule.
+    """
+
+    def __init__(self, rules: RuleSet, on_line):
+        self.rules = rules
+        self.on_line = on_line
+        self.findings = []
+        self.partial = ""
+        self.line_num = 0
+        self.long_hits = None
+        self.long_snippet = ""
+
+    def feed(self, chunk: str) -> None:
+        text = self.partial + chunk
+        lines = text.split("\n")
+        self.partial = lines.pop()
+        if lines:
+            candidates = self.rules.candidates(text)
+            for line in lines:
+                self._end_line(line, candidates)
+        if len(self.partial) > STREAM_CHUNK_CHARS:
+            self._segment(self.partial, final=False)
+
+    def _segment(self, text: str, final: bool) -> None:
+        if self.long_hits is None:
+            self.long_hits = set()
+            self.long_snippet = text.lstrip()[:80]
+        own_end = len(text) if final else len(text) - STREAM_OVERLAP_CHARS
+        for i in self.rules.candidates(text):
+            if i not in self.long_hits:
+                match = self.rules.regexes[i].search(text)
+                if match and match.start() < own_end:
+                    self.long_hits.add(i)
+        if not final:
+            self.partial = text[own_end:]
+
+    def _end_line(self, line: str, candidates: List[int]) -> None:
+        self.line_num += 1
+        if self.long_hits is not None:
+            self._segment(line, final=True)
+            hits, snippet = sorted(self.long_hits), self.long_snippet
+            self.long_hits = None
+        else:
+            hits = self.rules.matching(line, candidates) if candidates else []
+            snippet = line.strip()[:80] if hits else ""
+        if hits:
+            self.findings.extend(self.on_line(self.line_num, hits, snippet))
+
+    def close(self):
+        if self.partial or self.long_hits is not None:
+            self._end_line(self.partial, self.rules.candidates(self.partial))
+        return self.findings
+
+
+class _HashingReader(io.RawIOBase):
+    """Raw reader that hashes what passes through, optionally stopping at limit bytes."""
+
+    def __init__(self, raw, limit: int = None):
+        self.raw = raw
+        self.remaining = limit
+        self.sha = hashlib.sha256()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer)
+        if self.remaining is not None:
+            if self.remaining <= 0:
+                return 0
+            view = view[:self.remaining]
+        n = self.raw.readinto(view) or 0
+        self.sha.update(view[:n])
+        if self.remaining is not None:
+            self.remaining -= n
+        return n
+
+
+def _digest(sha, limit: int = None) -> str:
+    """Cache key for a file's content; sampled reads are tagged with their limit."""
+    return f"sample{limit}:{sha.hexdigest()}" if limit else sha.hexdigest()
+
+
+def _is_binary(head: bytes) -> bool:
+    return b'\0' in head[:SNIFF_BYTES]
+
+
+def _read_file(path: str):
+    """
+    (text, content hash, is_binary) of a file read whole; (None, None, False)
+    if unreadable. The text matches a universal-newlines UTF-8 read with
+    errors ignored.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except Exception:
+        return None, None, False
+    content = _decode(data)
+    if content is None:
+        return None, None, True
+    return content, _digest(hashlib.sha256(data)), False
+
+
+def _decode(data: bytes):
+    """Universal-newlines UTF-8 text of data (errors ignored); None if binary."""
+    if _is_binary(data):
+        return None
+    content = data.decode('utf-8', errors='ignore')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _sniff_file(path: str):
+    """True if binary, False if text, None if unreadable."""
+    try:
+        with open(path, 'rb') as f:
+            return _is_binary(f.read(SNIFF_BYTES))
+    except OSError:
+        return None
+
+
+def _hash_file(path: str, limit: int = None):
+    """Content hash of a file (its first limit bytes) without decoding it."""
+    try:
+        with open(path, 'rb', buffering=0) as raw:
+            reader = _HashingReader(raw, limit)
+            while reader.read(STREAM_CHUNK_CHARS):
                 pass
-    
-    if results["by_severity"]["critical"] > 0:
-        results["status"] = "[!!] CRITICAL: Secrets exposed!"
-    elif results["by_severity"]["high"] > 0:
-        results["status"] = "[!] HIGH: Secrets found"
-    elif sum(results["by_severity"].values()) > 0:
-        results["status"] = "[?] Potential secrets detected"
-    
-    # Limit findings for output
-    results["findings"] = results["findings"][:15]
-    
-    return results
+    except OSError:
+        return None
+    return _digest(reader.sha, limit)
+
+
+def _stream_file(path: str, relpath: str, scanners: List[FileScanner], limit: int = None):
+    """
+    Feed a file chunk by chunk to each scanner's stream; memory stays bounded
+    by the chunk and overlap sizes. Returns (records per scanner, content
+    hash), or (None, None) if the file could not be read.
+    """
+    try:
+        with open(path, 'rb', buffering=0) as raw:
+            reader = _HashingReader(raw, limit)
+            records = _stream_text(io.BufferedReader(reader), relpath, scanners)
+    except OSError:
+        return None, None
+    return records, _digest(reader.sha, limit)
+
+
+def _stream_text(buffered, relpath: str, scanners: List[FileScanner]) -> List[List[Dict[str, Any]]]:
+    """Decode a binary stream chunk by chunk into each scanner's stream; records per scanner."""
+    streams = [scanner.stream(relpath) for scanner in scanners]
+    text = io.TextIOWrapper(buffered, encoding='utf-8', errors='ignore')
+    while True:
+        chunk = text.read(STREAM_CHUNK_CHARS)
+        if not chunk:
+            break
+        for k, stream in enumerate(streams):
+            if stream is not None:
+                try:
+                    stream.feed(chunk)
+                except Exception:
+                    streams[k] = None
+
+    records = []
+    for stream in streams:
+        try:
+            records.append(stream.close() if stream is not None else [])
+        except Exception:
+            records.append([])
+    return records
+
+
+def _scan_file(scanners: List[FileScanner], entry, policy):
+    """
+    (content hash, records per interested scanner, policy status) for one
+    planned file. Small files are read whole, larger ones streamed; cached
+    records are reused when the content hash is unchanged.
+    """
+    path, relpath, interested, cached = entry
+    unread = [None] * len(interested)
+    mode, large_bytes = policy
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return None, unread, None
+
+    limit = None
+    status = None
+    if size > large_bytes:
+        if mode == "skip":
+            return None, unread, "skipped"
+        if mode == "sample":
+            limit, status = large_bytes, "sampled"
+
+    if size <= STREAM_MIN_BYTES:
+        content, digest, binary = _read_file(path)
+        if binary:
+            return None, unread, "binary"
+        reuse = cached["scanners"] if cached and digest and cached["sha256"] == digest else {}
+        records = []
+        for i in interested:
+            key = scanners[i].key
+            records.append(reuse[key] if key in reuse else scanners[i].run(relpath, content))
+        return digest, records, status
+
+    binary = _sniff_file(path)
+    if binary is None:
+        return None, unread, None
+    if binary:
+        return None, unread, "binary"
+
+    reuse = {}
+    digest = None
+    if cached:
+        # A hash-only pass is far cheaper than rescanning a large file
+        digest = _hash_file(path, limit)
+        if digest and cached["sha256"] == digest:
+            reuse = cached["scanners"]
+    pending = [i for i in interested if scanners[i].key not in reuse]
+    streamed = {}
+    if pending:
+        pending_records, digest = _stream_file(path, relpath, [scanners[i] for i in pending], limit)
+        if pending_records is None:
+            return None, unread, None
+        streamed = dict(zip(pending, pending_records))
+    records = [streamed[i] if i in streamed else reuse[scanners[i].key] for i in interested]
+    return digest, records, status or "streamed"
+
+
+def _plan_files(project_path: str, scanners: List[FileScanner], only=None, cache=None, paths=None):
+    """
+    (path, relpath, interested scanner indices, cached entry) for every file
+    some scanner wants; only, if given, is a set of '/'-separated relative
+    paths to restrict the scan to.
+    """
+    plan = []
+    for path in (iter_project_files(project_path) if paths is None else paths):
+        name = os.path.basename(path)
+        ext = Path(name).suffix.lower()
+        interested = [i for i, scanner in enumerate(scanners) if scanner.wants(name, ext)]
+        if not interested:
+            continue
+        relative = Path(path).relative_to(project_path)
+        if only is not None and relative.as_posix() not in only:
+            continue
+        relpath = str(relative)
+        plan.append((path, relpath, interested, cache.lookup(relpath) if cache else None))
+    return plan
+
+
+def _scan_planned(scanners: List[FileScanner], plan, policy) -> List[tuple]:
+    """Per planned file, (content hash, records per interested scanner, status)."""
+    return [_scan_file(scanners, entry, policy) for entry in plan]
+
+
+def _scan_shard(project_path: str, keys: List[str], policy, shard) -> List[tuple]:
+    """Worker entry point: rebuild the scanners by key and scan one shard."""
+    scanners = [FILE_SCANNERS[key](project_path) for key in keys]
+    return _scan_planned(scanners, shard, policy)
+
+
+def _pool_context():
+    """
+    Start method for scan workers. Forking while another thread (the npm
+    audit) is running is unsafe, so use a fork server in that case.
+    """
+    if threading.active_count() > 1 and "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return None
+
+
+def _parallel_scan(project_path: str, scanners: List[FileScanner], plan, policy, jobs: int):
+    """Yield per-file results from worker processes, in plan order, shard by shard."""
+    keys = [scanner.key for scanner in scanners]
+    shard_size = max(PARALLEL_MIN_SHARD, -(-len(plan) // (jobs * 4)))
+    shards = [plan[i:i + shard_size] for i in range(0, len(plan), shard_size)]
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=_pool_context()) as executor:
+        # map() yields shards in submission order, keeping the merge deterministic
+        for shard_records in executor.map(_scan_shard, repeat(project_path), repeat(keys), repeat(policy), shards):
+            yield from shard_records
+
+
+def _scanned_bytes(size: int, status: str, policy) -> int:
+    if status in ("skipped", "binary"):
+        return 0
+    return min(size, policy[1]) if status == "sampled" else size
+
+
+def _profiled_scan(scanners: List[FileScanner], entry, policy, profile: ScanProfile):
+    start = time.perf_counter()
+    result = _scan_file(scanners, entry, policy)
+    try:
+        size = os.path.getsize(entry[0])
+    except OSError:
+        size = 0
+    profile.record_file(entry[1], time.perf_counter() - start, _scanned_bytes(size, result[2], policy))
+    return result
+
+
+def _iter_results(project_path: str, scanners: List[FileScanner], plan, policy, jobs: int,
+                  profile: ScanProfile = None):
+    """Per-file results in plan order as they become available; profiled runs stay serial."""
+    if profile is not None:
+        for entry in plan:
+            yield _profiled_scan(scanners, entry, policy, profile)
+        return
+    done = 0
+    if jobs > 1 and len(plan) >= PARALLEL_MIN_FILES:
+        try:
+            for result in _parallel_scan(project_path, scanners, plan, policy, jobs):
+                yield result
+                done += 1
+            return
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # no usable process pool here: scan the rest serially
+    for entry in plan[done:]:
+        yield _scan_file(scanners, entry, policy)
 
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+def scan_files(project_path: str, scanners: List[FileScanner], jobs: int = 1,
+               cache=None, only=None, large_files: str = "scan",
+               large_bytes: int = LARGE_FILE_BYTES, paths: List[str] = None,
+               profile: ScanProfile = None) -> Dict[str, int]:
+    """
+    Walk project_path once, reading each file at most once for all scanners.
+    With jobs > 1 the file list is sharded across worker processes; records
+    are merged in walk order as they arrive, so the report (and any scanner
+    listener) sees the same sequence as a serial run. A
+    FindingsCache skips files whose content hash is unchanged; only limits
+    the scan to a set of relative paths (see changed_files()). Files above
+    large_bytes are handled per large_files (see LARGE_FILE_POLICIES); paths
+    is an already walked file list to use instead of walking again. A
+    ScanProfile records per-rule and per-file time (and forces jobs=1).
+
+    Returns how many files were streamed, sampled, skipped or binary.
+    """
+    policy = (large_files, large_bytes)
+    plan = _plan_files(project_path, scanners, only, cache, paths)
+
+    statuses: Dict[str, int] = {}
+    with profile or nullcontext():
+        records = _iter_results(project_path, scanners, plan, policy, jobs, profile)
+        for (_, relpath, interested, cached), (digest, file_records, status) in zip(plan, records):
+            if status:
+                statuses[status] = statuses.get(status, 0) + 1
+            for i, scanner_records in zip(interested, file_records):
+                scanners[i].add(scanner_records)
+            if cache is not None and digest:
+                cache.store(relpath, digest, {
+                    scanners[i].key: scanner_records
+                    for i, scanner_records in zip(interested, file_records)
+                    if scanner_records is not None
+                }, hit=bool(cached) and cached["sha256"] == digest)
+    return statuses
+
+
+class SecretScanner(FileScanner):
+    """
+    Validate no hardcoded secrets (OWASP A04).
+    Checks: API keys, tokens, passwords, cloud credentials.
+    """
+
+    key = "secrets"
+
+    def new_results(self) -> Dict[str, Any]:
+        return {
+            "tool": "secret_scanner",
+            "findings": [],
+            "status": "[OK] No secrets detected",
+            "scanned_files": 0,
+            "by_severity": {"critical": 0, "high": 0, "medium": 0}
+        }
+
+    def wants(self, filename: str, ext: str) -> bool:
+        return ext in CODE_EXTENSIONS or ext in CONFIG_EXTENSIONS
+
+    def scan(self, relpath: str, content: str) -> List[Dict[str, Any]]:
+        counts = [0] * len(SECRET_PATTERNS)
+        for i in SECRET_RULES.candidates(content):
+            counts[i] = len(SECRET_RULES.regexes[i].findall(content))
+        entropy = count_entropy_tokens(content) if self._checks_entropy(relpath) else 0
+        return self._findings(relpath, counts, entropy)
+
+    def stream(self, relpath: str):
+        streams = [_RuleWindowStream(SECRET_RULES, _identity)]
+        if self._checks_entropy(relpath):
+            streams.append(_RuleWindowStream(ENTROPY_RULES, _identity, match_filter=_entropy_match))
+        return _StreamGroup(streams, lambda counts, entropy=(0,): self._findings(relpath, counts, entropy[0]))
+
+    @staticmethod
+    def _checks_entropy(relpath: str) -> bool:
+        return os.path.basename(relpath) not in ENTROPY_SKIP_FILES
+
+    @staticmethod
+    def _findings(relpath: str, counts: List[int], entropy: int = 0) -> List[Dict[str, Any]]:
+        findings = []
+        for (_, secret_type, severity), count in zip(SECRET_PATTERNS + [(None,) + ENTROPY_SECRET], counts + [entropy]):
+            if count:
+                findings.append({
+                    "file": relpath,
+                    "type": secret_type,
+                    "severity": severity,
+                    "count": count
+                })
+        return findings
+
+    def tally(self, finding: Dict[str, Any]) -> None:
+        self.results["by_severity"][finding["severity"]] += finding["count"]
+
+    def finish(self) -> Dict[str, Any]:
+        results = self.results
+        if results["by_severity"]["critical"] > 0:
+            results["status"] = "[!!] CRITICAL: Secrets exposed!"
+        elif results["by_severity"]["high"] > 0:
+            results["status"] = "[!] HIGH: Secrets found"
+        elif sum(results["by_severity"].values()) > 0:
+            results["status"] = "[?] Potential secrets detected"
+
+        # Limit findings for output
+        results["findings"] = results["findings"][:15]
+        return results
+
+
+class PatternScanner(FileScanner):
     """
     Validate dangerous code patterns (OWASP A05).
     Checks: Injection risks, XSS, unsafe deserialization.
     """
-    results = {
-        "tool": "pattern_scanner",
-        "findings": [],
-        "status": "[OK] No dangerous patterns",
-        "scanned_files": 0,
-        "by_category": {}
-    }
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
-                                
-            except Exception:
-                pass
-    
-    critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
-    high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
-    
-    if critical_count > 0:
-        results["status"] = f"[!!] CRITICAL: {critical_count} dangerous patterns"
-    elif high_count > 0:
-        results["status"] = f"[!] HIGH: {high_count} risky patterns"
-    elif results["findings"]:
-        results["status"] = "[?] Some patterns need review"
-    
-    # Limit findings
-    results["findings"] = results["findings"][:20]
-    
-    return results
 
+    key = "patterns"
+
+    def new_results(self) -> Dict[str, Any]:
+        return {
+            "tool": "pattern_scanner",
+            "findings": [],
+            "status": "[OK] No dangerous patterns",
+            "scanned_files": 0,
+            "by_category": {}
+        }
+
+    def wants(self, filename: str, ext: str) -> bool:
+        return ext in CODE_EXTENSIONS
+
+    def scan(self, relpath: str, content: str) -> List[Dict[str, Any]]:
+        findings = []
+        candidates = DANGEROUS_RULES.candidates(content)
+        if not candidates:
+            return findings
+        any_rule = DANGEROUS_RULES.alternation(candidates)
+        lines = content.split("\n")
+        if lines[-1] == "":
+            lines.pop()
+
+        for line_num, line in enumerate(lines, 1):
+            hits = DANGEROUS_RULES.matching(line, candidates, any_rule)
+            if hits:
+                findings.extend(self._findings(relpath, line_num, hits, line.strip()[:80]))
+        return findings
+
+    def stream(self, relpath: str):
+        return _LineStream(DANGEROUS_RULES, lambda line_num, hits, snippet: self._findings(relpath, line_num, hits, snippet))
+
+    @staticmethod
+    def _findings(relpath: str, line_num: int, hits: List[int], snippet: str) -> List[Dict[str, Any]]:
+        findings = []
+        for i in hits:
+            _, name, severity, category = DANGEROUS_PATTERNS[i]
+            findings.append({
+                "file": relpath,
+                "line": line_num,
+                "pattern": name,
+                "severity": severity,
+                "category": category,
+                "snippet": snippet
+            })
+        return findings
+
+    def tally(self, finding: Dict[str, Any]) -> None:
+        by_category = self.results["by_category"]
+        by_category[finding["category"]] = by_category.get(finding["category"], 0) + 1
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+    def finish(self) -> Dict[str, Any]:
+        results = self.results
+        critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
+        high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
+
+        if critical_count > 0:
+            results["status"] = f"[!!] CRITICAL: {critical_count} dangerous patterns"
+        elif high_count > 0:
+            results["status"] = f"[!] HIGH: {high_count} risky patterns"
+        elif results["findings"]:
+            results["status"] = "[?] Some patterns need review"
+
+        # Limit findings
+        results["findings"] = results["findings"][:20]
+        return results
+
+
+class ConfigScanner(FileScanner):
     """
     Validate security configuration (OWASP A02).
     Checks: Security headers, CORS, debug modes.
     """
-    results = {
-        "tool": "config_scanner",
-        "findings": [],
-        "status": "[OK] Configuration secure",
-        "checks": {}
-    }
-    
-    # Check common config files for issues
-    config_issues = [
-        (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
-        (r'debug\s*=\s*True', "Debug mode enabled", "high"),
-        (r'NODE_ENV.*development', "Development mode in config", "medium"),
-        (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
-        (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
-        (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
-    ]
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CONFIG_EXTENSIONS and file not in ['next.config.js', 'webpack.config.js', '.eslintrc.js']:
-                continue
-                
-            filepath = Path(root) / file
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-                            
-            except Exception:
-                pass
-    
-    # Check for security header configurations
-    header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
-    for hf in header_files:
-        hf_path = Path(project_path) / hf
-        if hf_path.exists():
-            results["checks"]["security_headers_config"] = True
-            break
+
+    key = "config"
+    counts_files = False
+
+    def new_results(self) -> Dict[str, Any]:
+        return {
+            "tool": "config_scanner",
+            "findings": [],
+            "status": "[OK] Configuration secure",
+            "checks": {}
+        }
+
+    def wants(self, filename: str, ext: str) -> bool:
+        return ext in CONFIG_EXTENSIONS or filename in CONFIG_FILENAMES
+
+    def scan(self, relpath: str, content: str) -> List[Dict[str, Any]]:
+        counts = [0] * len(CONFIG_PATTERNS)
+        for i in CONFIG_RULES.candidates(content):
+            counts[i] = 1 if CONFIG_RULES.regexes[i].search(content) else 0
+        return self._findings(relpath, counts)
+
+    def stream(self, relpath: str):
+        return _RuleWindowStream(CONFIG_RULES, lambda counts: self._findings(relpath, counts), first_only=True)
+
+    @staticmethod
+    def _findings(relpath: str, counts: List[int]) -> List[Dict[str, Any]]:
+        findings = []
+        for (_, issue, severity), count in zip(CONFIG_PATTERNS, counts):
+            if count:
+                findings.append({
+                    "file": relpath,
+                    "issue": issue,
+                    "severity": severity
+                })
+        return findings
+
+    def finish(self) -> Dict[str, Any]:
+        results = self.results
+
+        # Check for security header configurations
+        header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
+        for hf in header_files:
+            hf_path = Path(self.project_path) / hf
+            if hf_path.exists():
+                results["checks"]["security_headers_config"] = True
+                break
+        else:
+            results["checks"]["security_headers_config"] = False
+            self.append({
+                "issue": "No security headers configuration found",
+                "severity": "medium",
+                "recommendation": "Configure CSP, HSTS, X-Frame-Options headers"
+            })
+
+        if any(f["severity"] == "critical" for f in results["findings"]):
+            results["status"] = "[!!] CRITICAL: Configuration issues"
+        elif any(f["severity"] == "high" for f in results["findings"]):
+            results["status"] = "[!] HIGH: Configuration review needed"
+        elif results["findings"]:
+            results["status"] = "[?] Minor configuration issues"
+        return results
+
+
+FILE_SCANNERS = {scanner.key: scanner for scanner in (SecretScanner, PatternScanner, ConfigScanner)}
+
+
+def _run_file_scanner(scanner_class, project_path: str, profile: ScanProfile = None) -> Dict[str, Any]:
+    scanner = scanner_class(project_path)
+    scan_files(project_path, [scanner], profile=profile)
+    return scanner.finish()
+
+
+def scan_secrets(project_path: str, profile: ScanProfile = None) -> Dict[str, Any]:
+    """Validate no hardcoded secrets (OWASP A04)."""
+    return _run_file_scanner(SecretScanner, project_path, profile)
+
+
+def scan_code_patterns(project_path: str, profile: ScanProfile = None) -> Dict[str, Any]:
+    """Validate dangerous code patterns (OWASP A05)."""
+    return _run_file_scanner(PatternScanner, project_path, profile)
+
+
+def scan_configuration(project_path: str, profile: ScanProfile = None) -> Dict[str, Any]:
+    """Validate security configuration (OWASP A02)."""
+    return _run_file_scanner(ConfigScanner, project_path, profile)
+
+
+# ============================================================================
+#  GIT HISTORY
+# ============================================================================
+
+HISTORY_REVS = "--all"
+
+
+def iter_history_blobs(project_path: str, revs: str = HISTORY_REVS):
+    """
+    (sha, path, size) of every blob reachable from revs, streamed from
+    `git rev-list --objects` through `git cat-file --batch-check`. rev-list
+    lists each object once, so a blob shared by many commits or paths is
+    yielded once, under the first path it was reached by (relative to the
+    repository root).
+    """
+    try:
+        rev_list = subprocess.Popen(["git", "rev-list", "--objects", revs], cwd=project_path,
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError as e:
+        raise RuntimeError(f"git unavailable: {e}")
+    check = subprocess.Popen(
+        ["git", "cat-file", "--batch-check=%(objectname) %(objecttype) %(objectsize) %(rest)"],
+        cwd=project_path, stdin=rev_list.stdout, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    rev_list.stdout.close()  # cat-file owns the read end now
+    try:
+        for line in check.stdout:
+            fields = line.decode('utf-8', errors='replace').rstrip('\n').split(' ', 3)
+            if len(fields) >= 3 and fields[1] == "blob":
+                yield fields[0], fields[3] if len(fields) > 3 else "", int(fields[2])
+        check.wait()
+        if rev_list.wait() != 0:
+            error = rev_list.stderr.read().decode('utf-8', errors='replace').strip()
+            raise RuntimeError(error or f"git rev-list {revs} failed")
+    finally:
+        for process in (rev_list, check):
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+        check.stdout.close()
+        rev_list.stderr.close()
+
+
+class _BlobReader:
+    """Blob contents by sha from one long-running `git cat-file --batch`."""
+
+    def __init__(self, project_path: str):
+        try:
+            self.process = subprocess.Popen(["git", "cat-file", "--batch"], cwd=project_path,
+                                            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                            stderr=subprocess.DEVNULL)
+        except OSError as e:
+            raise RuntimeError(f"git unavailable: {e}")
+        self.out = self.process.stdout
+
+    def open(self, sha: str):
+        """Request a blob; returns its size, the bytes of which (and a newline) follow on out."""
+        self.process.stdin.write(sha.encode('ascii') + b"\n")
+        self.process.stdin.flush()
+        header = self.out.readline().split()
+        if len(header) < 3:
+            return None  # "<sha> missing"
+        return int(header[2])
+
+    def skip(self, n: int) -> None:
+        while n > 0:
+            data = self.out.read(min(n, STREAM_CHUNK_CHARS))
+            if not data:
+                break
+            n -= len(data)
+
+    def close(self) -> None:
+        self.process.stdin.close()
+        self.out.close()
+        self.process.wait()
+
+
+def _scan_blob(reader: _BlobReader, scanner: FileScanner, sha: str, path: str, size: int, policy):
+    """(records, policy status) for one blob, mirroring _scan_file() for working-tree files."""
+    mode, large_bytes = policy
+    limit = None
+    status = None
+    if size > large_bytes:
+        if mode == "skip":
+            return None, "skipped"
+        if mode == "sample":
+            limit, status = large_bytes, "sampled"
+
+    total = reader.open(sha)
+    if total is None:
+        return None, None
+    wanted = total if limit is None else min(total, limit)
+
+    if total <= STREAM_MIN_BYTES:
+        content = _decode(reader.out.read(wanted))
+        reader.skip(total - wanted + 1)
+        if content is None:
+            return None, "binary"
+        return scanner.run(path, content), status
+
+    blob = _HashingReader(reader.out, wanted)
+    buffered = io.BufferedReader(blob, SNIFF_BYTES)
+    if _is_binary(buffered.peek(SNIFF_BYTES)):
+        records, status = None, "binary"
     else:
-        results["checks"]["security_headers_config"] = False
-        results["findings"].append({
-            "issue": "No security headers configuration found",
-            "severity": "medium",
-            "recommendation": "Configure CSP, HSTS, X-Frame-Options headers"
-        })
-    
-    if any(f["severity"] == "critical" for f in results["findings"]):
-        results["status"] = "[!!] CRITICAL: Configuration issues"
-    elif any(f["severity"] == "high" for f in results["findings"]):
-        results["status"] = "[!] HIGH: Configuration review needed"
-    elif results["findings"]:
-        results["status"] = "[?] Minor configuration issues"
-    
+        records, status = _stream_text(buffered, path, [scanner])[0], status or "streamed"
+    reader.skip(total - wanted + blob.remaining + 1)
+    return records, status
+
+
+class HistoryScanner(SecretScanner):
+    """
+    Validate no secrets were ever committed (OWASP A04).
+    Checks: the secret rules against every blob in git history.
+    """
+
+    key = "history"
+    counts_files = False
+
+    def new_results(self) -> Dict[str, Any]:
+        return {
+            "tool": "history_scanner",
+            "findings": [],
+            "status": "[OK] No secrets in git history",
+            "scanned_blobs": 0,
+            "by_severity": {"critical": 0, "high": 0, "medium": 0}
+        }
+
+    def add(self, records) -> None:
+        self.results["scanned_blobs"] += 1
+        super().add(records)
+
+
+def scan_history(project_path: str, revs: str = HISTORY_REVS, large_files: str = "scan",
+                 large_bytes: int = LARGE_FILE_BYTES, listener=None,
+                 profile: ScanProfile = None) -> Dict[str, Any]:
+    """
+    Validate no secrets anywhere in the git history reachable from revs
+    (default: all refs). Blobs stream from one cat-file process and each
+    unique blob is scanned once; findings carry its path and blob id.
+    SKIP_DIRS does not apply: anything committed is exposed, and a blob is
+    only listed under the first path it was reached by. A ScanProfile
+    records each blob as "path@blob".
+    """
+    scanner = HistoryScanner(project_path)
+    scanner.listener = listener
+    policy = (large_files, large_bytes)
+    statuses: Dict[str, int] = {}
+
+    reader = _BlobReader(project_path)
+    try:
+        with profile or nullcontext():
+            for sha, path, size in iter_history_blobs(project_path, revs):
+                name = path.rsplit('/', 1)[-1]
+                if not scanner.wants(name, Path(name).suffix.lower()):
+                    continue
+                start = time.perf_counter()
+                records, status = _scan_blob(reader, scanner, sha, path, size, policy)
+                if profile is not None:
+                    profile.record_file(f"{path}@{sha[:12]}", time.perf_counter() - start,
+                                        _scanned_bytes(size, status, policy))
+                if status:
+                    statuses[status] = statuses.get(status, 0) + 1
+                for finding in records or ():
+                    finding["blob"] = sha
+                scanner.add(records)
+    finally:
+        reader.close()
+
+    results = scanner.finish()
+    results["revs"] = revs
+    if statuses:
+        results["file_policy"] = statuses
     return results
 
 
+# ============================================================================
+#  STREAMING OUTPUT
+# ============================================================================
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_LEVELS = {"critical": "error", "high": "error", "medium": "warning", "moderate": "warning", "low": "note"}
+
+
+def _overall_status(summary: Dict[str, Any]) -> str:
+    if summary["critical"] > 0:
+        return "[!!] CRITICAL ISSUES FOUND"
+    if summary["high"] > 0:
+        return "[!] HIGH RISK ISSUES"
+    if summary["total_findings"] > 0:
+        return "[?] REVIEW RECOMMENDED"
+    return "[OK] SECURE"
+
+
+class FindingStream:
+    """
+    Writes every finding the moment it is merged - untruncated, unlike the
+    JSON report - followed by a closing summary. Nothing is written before
+    the first finding, so an early error can still be printed as plain JSON.
+    """
+
+    def __init__(self, out=None):
+        self.out = out or sys.stdout
+        self.started = False
+        self.summary = {"total_findings": 0, "critical": 0, "high": 0}
+
+    def finding(self, scan_name: str, finding: Dict[str, Any]) -> None:
+        self._start()
+        self.summary["total_findings"] += 1
+        if finding.get("severity") in ("critical", "high"):
+            self.summary[finding["severity"]] += 1
+        self.write_finding(scan_name, finding)
+        self.out.flush()
+
+    def close(self, report: Dict[str, Any]) -> None:
+        self._start()
+        self.summary["overall_status"] = _overall_status(self.summary)
+        self.write_end(report)
+        self.out.flush()
+
+    def _start(self) -> None:
+        if not self.started:
+            self.started = True
+            self.write_start()
+
+    def write_start(self) -> None:
+        pass
+
+    def write_finding(self, scan_name: str, finding: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def write_end(self, report: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+
+class JsonLinesStream(FindingStream):
+    """One {"record": "finding", "scan": ...} object per line, then a summary record."""
+
+    def write_finding(self, scan_name: str, finding: Dict[str, Any]) -> None:
+        self.out.write(json.dumps({"record": "finding", "scan": scan_name, **finding}) + "\n")
+
+    def write_end(self, report: Dict[str, Any]) -> None:
+        record = {
+            "record": "summary",
+            "project": report["project"],
+            "timestamp": report["timestamp"],
+            "scan_type": report["scan_type"],
+            "summary": self.summary,
+            "scans": {name: {k: v for k, v in result.items() if k != "findings"}
+                      for name, result in report["scans"].items()},
+        }
+        for key in ("since", "cache", "file_policy", "profile"):
+            if key in report:
+                record[key] = report[key]
+        self.out.write(json.dumps(record) + "\n")
+
+
+def _slug(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def _sarif_rule_name(scan_name: str, finding: Dict[str, Any]) -> str:
+    for field in ("pattern", "issue", "type"):
+        if field in finding:
+            return finding[field]
+    return scan_name
+
+
+def sarif_rules() -> List[Dict[str, Any]]:
+    """Every rule a scan can report, as SARIF reportingDescriptors."""
+    entries = [(scan_name, name, severity)
+               for scan_name in ("secrets", "secret_history")
+               for _, name, severity in SECRET_PATTERNS + [(None,) + ENTROPY_SECRET]]
+    entries += [("code_patterns", name, severity) for _, name, severity, _ in DANGEROUS_PATTERNS]
+    entries += [("configuration", issue, severity) for _, issue, severity in CONFIG_PATTERNS]
+    entries += [
+        ("configuration", "No security headers configuration found", "medium"),
+        ("dependencies", "Missing Lock File", "high"),
+        ("dependencies", "npm audit", "high"),
+    ]
+    rules = {}
+    for scan_name, name, severity in entries:
+        rule_id = f"{scan_name}/{_slug(name)}"
+        rules.setdefault(rule_id, {
+            "id": rule_id,
+            "name": name,
+            "shortDescription": {"text": name},
+            "defaultConfiguration": {"level": SARIF_LEVELS.get(severity, "warning")},
+        })
+    return list(rules.values())
+
+
+class SarifStream(FindingStream):
+    """A SARIF 2.1.0 log whose results array is written one result at a time."""
+
+    def write_start(self) -> None:
+        driver = {"name": "security_scan", "rules": sarif_rules()}
+        head = json.dumps({"version": "2.1.0", "$schema": SARIF_SCHEMA, "runs": [{"tool": {"driver": driver}}]})
+        # Reopen the run object to stream its results array
+        self.out.write(head[:-3] + ', "results": [\n')
+        self.first = True
+
+    def write_finding(self, scan_name: str, finding: Dict[str, Any]) -> None:
+        severity = finding.get("severity", "low")
+        name = _sarif_rule_name(scan_name, finding)
+        if scan_name in ("secrets", "secret_history"):
+            count = finding.get("count", 1)
+            text = f"{name} ({count} occurrence{'s' if count != 1 else ''})"
+        elif scan_name == "code_patterns":
+            text = f"{name} - {finding.get('category', '')}"
+        else:
+            text = finding.get("message") or finding.get("issue") or name
+            if finding.get("recommendation"):
+                text += f". {finding['recommendation']}"
+
+        result = {
+            "ruleId": f"{scan_name}/{_slug(name)}",
+            "level": SARIF_LEVELS.get(severity, "warning"),
+            "message": {"text": text},
+            "properties": {k: v for k, v in finding.items() if k in ("severity", "category", "count", "blob")},
+        }
+        if "file" in finding:
+            location = {"artifactLocation": {"uri": Path(finding["file"]).as_posix()}}
+            if "line" in finding:
+                location["region"] = {"startLine": finding["line"], "snippet": {"text": finding.get("snippet", "")}}
+            result["locations"] = [{"physicalLocation": location}]
+
+        self.out.write(("" if self.first else ",\n") + json.dumps(result))
+        self.first = False
+
+    def write_end(self, report: Dict[str, Any]) -> None:
+        properties = {"project": report["project"], "timestamp": report["timestamp"], "summary": self.summary}
+        self.out.write("\n], " + json.dumps({"properties": properties})[1:-1] + "}]}\n")
+
+
 # ============================================================================
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
-    """Execute security validation scans."""
+def run_full_scan(project_path: str, scan_type: str = "all", jobs: int = 1,
+                  cache: FindingsCache = None, since: str = None, large_files: str = "scan",
+                  large_bytes: int = LARGE_FILE_BYTES, audit_cache: AuditCache = None,
+                  on_finding=None, history: str = None, profile: ScanProfile = None) -> Dict[str, Any]:
+    """
+    Execute security validation scans. jobs > 1 scans files in worker
+    processes, cache reuses findings of unchanged files, since limits file
+    scans to paths changed since that git revision, and large_files decides
+    whether files above large_bytes are scanned, sampled or skipped. npm audit
+    runs on a background thread while the files are scanned. on_finding(scan
+    name, finding) is called for every finding as it is found, before the
+    report's per-scanner truncation (see FindingStream). history, a git
+    revision range such as "--all", adds a secret scan of every blob
+    reachable from it (see scan_history). profile, a ScanProfile, times
+    every rule and file and is summarized in the report.
+    """
     
     report = {
         "project": project_path,
@@ -387,33 +2015,77 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     
     scanners = {
         "deps": ("dependencies", scan_dependencies),
-        "secrets": ("secrets", scan_secrets),
-        "patterns": ("code_patterns", scan_code_patterns),
-        "config": ("configuration", scan_configuration),
+        "secrets": ("secrets", SecretScanner),
+        "patterns": ("code_patterns", PatternScanner),
+        "config": ("configuration", ConfigScanner),
+    }
+    enabled = {key: entry for key, entry in scanners.items() if scan_type == "all" or scan_type == key}
+    if history:
+        enabled["history"] = ("secret_history", scan_history)
+    
+    # File-based scanners share one walk and one read per file
+    file_scanners = {
+        key: scanner(project_path)
+        for key, (_, scanner) in enabled.items()
+        if isinstance(scanner, type) and issubclass(scanner, FileScanner)
     }
+    if on_finding is not None:
+        for key, file_scanner in file_scanners.items():
+            file_scanner.listener = partial(on_finding, enabled[key][0])
+    paths = list(iter_project_files(project_path)) if file_scanners or "deps" in enabled else []
+    
+    audit = None
+    if "deps" in enabled:
+        package_roots = find_package_roots(project_path, paths)
+        audit = DependencyAudit(audit_targets(project_path, package_roots), audit_cache)
     
-    for key, (name, scanner) in scanners.items():
-        if scan_type == "all" or scan_type == key:
+    if file_scanners:
+        try:
+            only = changed_files(project_path, since) if since else None
+        except RuntimeError as e:
+            raise RuntimeError(f"--since {since}: {e}")
+        statuses = scan_files(project_path, list(file_scanners.values()), jobs, cache, only,
+                              large_files, large_bytes, paths, profile)
+        if statuses:
+            report["file_policy"] = statuses
+        if since:
+            report["since"] = since
+        if cache is not None:
+            cache.save(prune=scan_type == "all" and not since)
+            report["cache"] = cache.stats()
+    
+    for key, (name, scanner) in enabled.items():
+        if key in file_scanners:
+            result = file_scanners[key].finish()
+        elif key == "deps":
+            result = scanner(project_path, package_roots, audit.result(), audit_cache)
+            if on_finding is not None:
+                for finding in result["findings"]:
+                    on_finding(name, finding)
+        elif key == "history":
+            listener = partial(on_finding, name) if on_finding is not None else None
+            try:
+                result = scanner(project_path, history, large_files, large_bytes, listener, profile)
+            except RuntimeError as e:
+                raise RuntimeError(f"--history {history}: {e}")
+        else:
             result = scanner(project_path)
-            report["scans"][name] = result
-            
-            findings_count = len(result.get("findings", []))
-            report["summary"]["total_findings"] += findings_count
-            
-            for finding in result.get("findings", []):
-                sev = finding.get("severity", "low")
-                if sev == "critical":
-                    report["summary"]["critical"] += 1
-                elif sev == "high":
-                    report["summary"]["high"] += 1
+        report["scans"][name] = result
+        
+        findings_count = len(result.get("findings", []))
+        report["summary"]["total_findings"] += findings_count
+        
+        for finding in result.get("findings", []):
+            sev = finding.get("severity", "low")
+            if sev == "critical":
+                report["summary"]["critical"] += 1
+            elif sev == "high":
+                report["summary"]["high"] += 1
     
     # Determine overall status
-    if report["summary"]["critical"] > 0:
-        report["summary"]["overall_status"] = "[!!] CRITICAL ISSUES FOUND"
-    elif report["summary"]["high"] > 0:
-        report["summary"]["overall_status"] = "[!] HIGH RISK ISSUES"
-    elif report["summary"]["total_findings"] > 0:
-        report["summary"]["overall_status"] = "[?] REVIEW RECOMMENDED"
+    report["summary"]["overall_status"] = _overall_status(report["summary"])
+    if profile is not None:
+        report["profile"] = profile.summary()
     
     return report
 
@@ -425,8 +2097,23 @@ def main():
     parser.add_argument("project_path", nargs="?", default=".", help="Project directory to scan")
     parser.add_argument("--scan-type", choices=["all", "deps", "secrets", "patterns", "config"],
                         default="all", help="Type of scan to run")
-    parser.add_argument("--output", choices=["json", "summary"], default="json",
-                        help="Output format")
+    parser.add_argument("--output", choices=["json", "summary", "jsonl", "sarif"], default="json",
+                        help="Output format (jsonl and sarif stream every finding, untruncated)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes for file scanning (0 = one per CPU)")
+    parser.add_argument("--since", metavar="GIT_REV", default=None,
+                        help="Only scan files changed since this git revision")
+    parser.add_argument("--cache", metavar="FILE", default=None,
+                        help="Findings cache file (default: per-project file in ~/.cache)")
+    parser.add_argument("--no-cache", action="store_true", help="Rescan every file and re-run npm audit")
+    parser.add_argument("--large-files", choices=LARGE_FILE_POLICIES, default="scan",
+                        help="Files above --large-file-mb: stream all, scan the head only, or skip")
+    parser.add_argument("--large-file-mb", type=float, default=LARGE_FILE_BYTES / (1024 * 1024),
+                        help="Size threshold for --large-files (default: %(default)s)")
+    parser.add_argument("--history", nargs="?", const=HISTORY_REVS, default=None, metavar="REVS",
+                        help="Also scan every blob in git history for secrets (default: all refs)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Time every rule and file and print the slowest to stderr (implies --jobs 1 --no-cache)")
     
     args = parser.parse_args()
     
@@ -434,7 +2121,34 @@ def main():
         print(json.dumps({"error": f"Directory not found: {args.project_path}"}))
         sys.exit(1)
     
-    result = run_full_scan(args.project_path, args.scan_type)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    cache = audit_cache = None
+    # A profile times the work that ran; cache hits would report files that were never scanned
+    if not (args.no_cache or args.profile):
+        cache = FindingsCache(args.cache or default_cache_path(args.project_path))
+        audit_cache = AuditCache()
+    
+    stream = None
+    if args.output == "jsonl":
+        stream = JsonLinesStream()
+    elif args.output == "sarif":
+        stream = SarifStream()
+    profile = ScanProfile() if args.profile else None
+    
+    try:
+        result = run_full_scan(args.project_path, args.scan_type, jobs, cache, args.since,
+                               args.large_files, int(args.large_file_mb * 1024 * 1024), audit_cache,
+                               stream.finding if stream else None, args.history, profile)
+    except RuntimeError as e:
+        print(json.dumps({"error": str(e)}))
+        sys.exit(1)
+    
+    if profile is not None:
+        print(profile.table(), file=sys.stderr)
+    
+    if stream:
+        stream.close(result)
+        return
     
     if args.output == "summary":
         print(f"\n{'='*60}")